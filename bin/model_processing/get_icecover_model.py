@@ -1,14 +1,20 @@
 """
 Called by do_iceskill.py to list model files and use intake lazy load them.
-Returns 2D model output, lats, lons, and time as numpy arrays.
+Returns 2D model output, lats, lons, and time as arrays. Hourly model
+output is returned as a lazy dask array; daily composites, lats, lons,
+and time are numpy arrays.
 """
 from __future__ import annotations
 
 import argparse
+import functools
 import logging.config
 import os
+import re
 import sys
-from datetime import datetime, timedelta
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 import numpy as np
@@ -19,48 +25,82 @@ from ofs_skill.model_processing import intake_scisa, model_properties, model_sou
 from ofs_skill.model_processing.list_of_files import list_of_dir, list_of_files
 from ofs_skill.obs_retrieval import utils
 
+# Cap on daily composite caches read at once in _process_daily_composite.
+_CACHE_READ_MAX_WORKERS = 4
+
+def _parse_iso(date_full):
+    """Parse a 'YYYY-MM-DDThh:mm:ssZ' date string into a naive datetime."""
+    return datetime.fromisoformat(date_full.replace('Z', ''))
+
 
 def get_days_between_dates(start_date, end_date):
     """Generates a list of all dates between start_date and end_date (inclusive)."""
     if start_date > end_date:
         raise ValueError('start_date cannot be after end_date!')
-    return [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+    return list(pd.date_range(start_date, end_date, freq='D').to_pydatetime())
 
 
 def file_name_to_datetime(list_files):
     '''Converts OFS model file names to datetime objects. Handles old & new naming conventions.'''
-    list_files_dates = []
-    for file in list_files:
-        file_split = file.split('/')[-1].split('.')
-        is_old = 'nos.' in file
-
-        if is_old:
-            cycle_date = datetime.strptime(file_split[4] + file_split[5][1:3], '%Y%m%d%H')
-            hour_info = file_split[3]
-        else:
-            cycle_date = datetime.strptime(file_split[2] + file_split[1][1:3], '%Y%m%d%H')
-            hour_info = file_split[4]
-
-        if hour_info == 'hindcast':
-            list_files_dates.append(cycle_date)
-        elif 'n' in hour_info:  # nowcast
-            list_files_dates.append(cycle_date - timedelta(hours=6 - int(hour_info[1:])))
-        elif 'f' in hour_info:  # forecast
-            list_files_dates.append(cycle_date + timedelta(hours=int(hour_info[1:])))
-
-    return list_files_dates
-
-
-def get_indices_for_day(datetime_list, target_date):
-    """Returns indices where datetime objects match the target_date."""
-    return [i for i, dt_obj in enumerate(datetime_list) if dt_obj.date() == target_date.date()]
+    if len(list_files) == 0:
+        return []
+    names = pd.Series(list_files, dtype=object).str.rsplit('/', n=1).str[-1]
+    parts = names.str.split('.', expand=True).reindex(columns=range(6))
+    is_old = names.str.startswith('nos.')
+
+    # Old: nos.ofs.fields.n006.YYYYMMDD.tHHz.nc, new: ofs.tHHz.YYYYMMDD.fields.n006.nc
+    date_hour = (parts[2].where(~is_old, parts[4])
+                 + parts[1].where(~is_old, parts[5]).str[1:3])
+    cycle_dates = pd.to_datetime(date_hour, format='%Y%m%d%H')
+    hour_info = parts[4].where(~is_old, parts[3])
+
+    # Files that are not hindcast, nowcast or forecast output are skipped.
+    hindcast = hour_info == 'hindcast'
+    tag = hour_info.str[0]
+    keep = (hindcast | tag.isin(['n', 'f'])).to_numpy()
+    hours = pd.to_numeric(hour_info.str[1:].where(~hindcast, '0')[keep]).to_numpy()
+    hours = np.where(tag[keep] == 'n', hours - 6, hours)
+    list_files_dates = cycle_dates[keep] + pd.to_timedelta(hours, unit='h')
+    return list(pd.DatetimeIndex(list_files_dates).to_pydatetime())
+
+
+def get_indices_by_day(datetime_list):
+    """Returns a dict mapping each calendar day to the indices of its datetimes."""
+    if len(datetime_list) == 0:
+        return {}
+    days = pd.DatetimeIndex(datetime_list).values.astype('datetime64[D]')
+    keys, inverse = np.unique(days, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    splits = np.split(order, np.searchsorted(inverse[order], np.arange(1, len(keys))))
+    return {key.item(): idx.tolist() for key, idx in zip(keys, splits)}
+
+
+def _daily_file_regex(cycle, hour):
+    """Compile a matcher for file names holding both the cycle and hour fields.
+
+    Both must be whole dot-separated fields of the file name (the hour may
+    also be followed by '_', as in SCHISM 'out2d_1.nc'), so neither
+    matches inside another field or a directory name. Works for old and
+    new file naming conventions.
+    """
+    return re.compile(
+        rf'^(?=(?:.*\.)?{re.escape(cycle)}\.)(?=(?:.*\.)?{re.escape(hour)}[._])')
 
 
 def _setup_logger(logger, config_file=None):
     """Initialize logger if not provided."""
     if logger is not None:
         return logger
+    return _init_logger(config_file)
+
 
+@functools.lru_cache(maxsize=1)
+def _init_logger(config_file):
+    """Configure logging from conf/logging.conf.
+
+    Cached, so calling get_icecover_model repeatedly without a logger
+    parses the logging config and builds its handlers only once.
+    """
     config_file = utils.Utils(config_file).get_config_file()
     log_config_file = (Path(__file__).parent.parent.parent / 'conf/logging.conf').resolve()
 
@@ -82,47 +122,171 @@ def _get_variable_names(model_src):
     return 'aice', 'lon', 'lat'
 
 
-def _process_daily_composite(prop, logger, list_files, list_days, ice_name, x_name, y_name):
-    """Process daily composite ice cover."""
-    daily_composite_all = []
-    list_files_datetime = file_name_to_datetime(list_files)
-    for day in list_days:
-        logger.info('Making model daily average for %s', day)
-        daystring = datetime.strftime(day, '%Y%m%d')
-        filename = f'{prop.ofs}_{prop.whichcast}_{daystring}_composite_iceconc.csv'
-        filepath = os.path.join(prop.data_model_ice_path, filename)
+# Daily composites are cached as float16. Ice concentration is a fraction
+# in [0, 1], where float16 keeps better than 0.0005 precision, well below
+# what the skill thresholds resolve.
+_COMPOSITE_CACHE_DTYPE = np.float16
+
+
+def _composite_cache_path(prop, day, suffix='npz'):
+    """Path of the cached daily composite for one day."""
+    daystring = datetime.strftime(day, '%Y%m%d')
+    filename = f'{prop.ofs}_{prop.whichcast}_{daystring}_composite_iceconc.{suffix}'
+    return os.path.join(prop.data_model_ice_path, filename)
+
 
+def _cached_file_names(prop):
+    """Names of the files in the composite cache directory, from one scan."""
+    try:
+        with os.scandir(prop.data_model_ice_path) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+
+def _read_composite_cache(prop, day, cached_names, grid=True):
+    """Read one day's cached composite, or return None if it is not cached.
+
+    Composites are cached in a .npz file and read back as float32.
+    CSV caches written before that are still read, and converted to .npz.
+    cached_names is the set from _cached_file_names, so no file is
+    stat'ed just to find out whether it exists. With grid=False the
+    static lon/lat arrays are not read from a .npz cache and come back
+    as None.
+    """
+    filepath = _composite_cache_path(prop, day)
+    if os.path.basename(filepath) in cached_names:
+        try:
+            with np.load(filepath) as cache:
+                daily_composite = cache['daily_composite'].astype(np.float32)
+                if not grid:
+                    return daily_composite, None, None
+                return daily_composite, cache['lon'], cache['lat']
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            pass
+    filepath = _composite_cache_path(prop, day, 'csv')
+    if os.path.basename(filepath) in cached_names:
         try:
-            if os.path.exists(filepath):
-                df = pd.read_csv(filepath)
-                daily_composite, lon_m, lat_m = df['daily_composite'], df['lon'], df['lat']
-            else:
-                raise FileNotFoundError()
-        except (FileNotFoundError, pd.errors.EmptyDataError, KeyError):
-
-            date_indices = get_indices_for_day(list_files_datetime, day)
-            if prop.model_source == 'schism':
-                date_indices.append(date_indices[-1]+1)
-            try:
-                file_list_composite = [list_files[i] for i in date_indices]
-            except IndexError:
-                file_list_composite = [list_files[i] for i in date_indices[:-1]]
-            concated_model = intake_scisa.intake_model(file_list_composite, prop, logger)
-            if prop.model_source == 'schism':
-                concated_model = concated_model.sel(time=datetime.strftime(day,'%Y-%m-%d'))
-            daily_composite = np.nanmean(np.asarray(concated_model.variables[ice_name][:]), axis=0)
-            lon_m, lat_m = np.asarray(concated_model.variables[x_name][:]), np.asarray(concated_model.variables[y_name][:])
-
-            df_save = pd.DataFrame({'lon': lon_m, 'lat': lat_m, 'daily_composite': daily_composite})
-            df_save.to_csv(filepath, index=False)
-
-        daily_composite_all.append(daily_composite)
+            df = pd.read_csv(filepath, usecols=['lon', 'lat', 'daily_composite'],
+                             dtype=np.float64, engine='c')
+        except (OSError, pd.errors.EmptyDataError, ValueError):
+            return None
+        # Rounded like a .npz cache, and rewritten as one so later runs
+        # skip the text parse.
+        daily_composite = df['daily_composite'].to_numpy().astype(
+            _COMPOSITE_CACHE_DTYPE).astype(np.float32)
+        lon_m, lat_m = df['lon'].to_numpy(), df['lat'].to_numpy()
+        try:
+            _write_composite_cache(prop, day, daily_composite, lon_m, lat_m)
+        except OSError:
+            pass
+        return daily_composite, lon_m, lat_m
+    return None
+
+
+def _write_composite_cache(prop, day, daily_composite, lon_m, lat_m):
+    """Cache one day's composite to a .npz file."""
+    np.savez(_composite_cache_path(prop, day),
+             daily_composite=daily_composite.astype(_COMPOSITE_CACHE_DTYPE),
+             lon=lon_m, lat=lat_m)
+
+
+def _composites_for_days(prop, logger, list_files, days, ice_name, x_name, y_name):
+    """Average model ice cover for several days from one multi-file open.
+
+    The files of all requested days are opened together and reduced to
+    daily means with a single resample, so file opening and metadata
+    parsing happen once instead of once per day.
+    """
+    day_indices = get_indices_by_day(file_name_to_datetime(list_files))
+    file_indices = set()
+    for day in days:
+        date_indices = day_indices.get(day.date(), [])
+        file_indices.update(date_indices)
+        # SCHISM files also hold the first hours of the next day.
+        if prop.model_source == 'schism' and date_indices:
+            file_indices.add(date_indices[-1]+1)
+    file_list_composite = [list_files[i] for i in sorted(file_indices)
+                           if i < len(list_files)]
+    concated_model = intake_scisa.intake_model(file_list_composite, prop, logger)
+
+    day_index = pd.DatetimeIndex([pd.Timestamp(day.date()) for day in days])
+    daily = (concated_model[ice_name].resample(time='1D').mean(skipna=True)
+             .reindex(time=day_index))
+    # Rounded to the cache precision, so a cached rerun gives the same values.
+    daily_composites = np.asarray(daily.values).astype(
+        _COMPOSITE_CACHE_DTYPE).astype(np.float32)
+    lon_m, lat_m = np.asarray(concated_model.variables[x_name][:]), np.asarray(concated_model.variables[y_name][:])
+
+    for day, daily_composite in zip(days, daily_composites):
+        # A day without model files is all NaN; leave it uncached so a
+        # later run retries it once its files are available.
+        if not day_indices.get(day.date()):
+            logger.warning('No model files found for %s; its composite '
+                           'is not cached.', day.strftime('%Y-%m-%d'))
+            continue
+        _write_composite_cache(prop, day, daily_composite, lon_m, lat_m)
+    return daily_composites, lon_m, lat_m
+
+
+def _list_model_files(prop, logger):
+    """List the model files for the run period."""
+    dir_list = list_of_dir(prop, logger)
+    return list_of_files(prop, dir_list, logger)
+
+
+def _process_daily_composite(prop, logger, list_files, list_days, ice_name, x_name, y_name):
+    """Process daily composite ice cover.
+
+    Days with a cached composite are read back, a few files at a time.
+    The remaining days are averaged together from one open of their
+    model files, which dask already spreads over its worker threads. If
+    list_files is None, model files are listed only when some day is not
+    cached.
+    """
+    logger.info('Making model daily averages for %d days', len(list_days))
+    cached_names = _cached_file_names(prop)
+    max_workers = min(len(list_days), _CACHE_READ_MAX_WORKERS)
+    # The grid is the same every day, so it is read once further down.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        cache_reads = list(executor.map(
+            lambda day: _read_composite_cache(prop, day, cached_names, grid=False),
+            list_days))
+
+    # One float32 row per day, filled as composites are read or computed.
+    icecover_m = None
+    lon_m = lat_m = None
+    missing = []
+    for i, cached in enumerate(cache_reads):
+        if cached is None:
+            missing.append(i)
+            continue
+        daily_composite, day_lon, day_lat = cached
+        if day_lon is not None:
+            lon_m, lat_m = day_lon, day_lat
+        if icecover_m is None:
+            icecover_m = np.empty((len(list_days), daily_composite.size), np.float32)
+        icecover_m[i] = daily_composite
+
+    if missing:
+        logger.info('Averaging %d model days...', len(missing))
+        if list_files is None:
+            list_files = _list_model_files(prop, logger)
+        daily_composites, lon_m, lat_m = _composites_for_days(
+            prop, logger, list_files, [list_days[i] for i in missing],
+            ice_name, x_name, y_name)
+        if icecover_m is None:
+            icecover_m = np.empty((len(list_days), daily_composites.shape[1]), np.float32)
+        icecover_m[missing] = daily_composites
+    elif lon_m is None:
+        _, lon_m, lat_m = _read_composite_cache(prop, list_days[-1], cached_names)
+
     if prop.model_source == 'schism':
         transformer = Transformer.from_crs('EPSG:3174', 'EPSG:4326', always_xy=True)
         lon_m, lat_m = transformer.transform(lon_m, lat_m)
     else:
         lon_m = lon_m - 360
-    return np.stack(daily_composite_all), lon_m, lat_m, list_days
+    return icecover_m, lon_m, lat_m, list_days
 
 
 def get_icecover_model(prop, logger):
@@ -137,33 +301,30 @@ def get_icecover_model(prop, logger):
         raise NotImplementedError('Ice cover retrieval not implemented for ADCIRC.')
 
     # Reformat dates
-    start_dt = datetime.strptime(prop.start_date_full.replace('-', '').replace('Z', '').replace('T', '-').split('-')[0], '%Y%m%d')
-    end_dt = datetime.strptime(prop.end_date_full.replace('-', '').replace('Z', '').replace('T', '-').split('-')[0], '%Y%m%d')
+    start_dt, end_dt = _parse_iso(prop.start_date_full), _parse_iso(prop.end_date_full)
     prop.startdate, prop.enddate = start_dt.strftime('%Y%m%d') + '00', end_dt.strftime('%Y%m%d') + '23'
 
-    # Get list of model files
-    dir_list = list_of_dir(prop, logger)
-    list_files = list_of_files(prop, dir_list, logger)
-
     ice_name, x_name, y_name = _get_variable_names(prop.model_source)
 
+    # Process daily averages if requested. Model files are not listed
+    # when every day is already cached.
+    if prop.dailyavg and prop.ice_dt == 'daily':
+        list_days = get_days_between_dates(start_dt, end_dt)
+        icecover_m, lon_m, lat_m, time_m = _process_daily_composite(prop, logger, None, list_days, ice_name, x_name, y_name)
+        logger.info('Finished model daily averages!')
+        return icecover_m, lon_m, lat_m, time_m
+
+    # Get list of model files
+    list_files = _list_model_files(prop, logger)
+
     # Handle daily resolution
     if prop.ice_dt == 'daily' and not prop.dailyavg:
         cycle, hour = ('t12z', 'n006') if prop.whichcast == 'nowcast' else ('t06z', 'f006')
         if prop.model_source == 'schism':
             cycle = 't12z'
             hour = 'out2d'
-        list_files = [f for f in list_files if cycle in f and hour in f]
-
-    # Process daily averages if requested
-    if prop.dailyavg and prop.ice_dt == 'daily':
-        list_days = get_days_between_dates(
-            datetime.strptime(prop.start_date_full, '%Y-%m-%dT%H:%M:%SZ'),
-            datetime.strptime(prop.end_date_full, '%Y-%m-%dT%H:%M:%SZ'),
-        )
-        icecover_m, lon_m, lat_m, time_m = _process_daily_composite(prop, logger, list_files, list_days, ice_name, x_name, y_name)
-        logger.info('Finished model daily averages!')
-        return icecover_m, lon_m, lat_m, time_m
+        daily_file = _daily_file_regex(cycle, hour)
+        list_files = [f for f in list_files if daily_file.match(os.path.basename(f))]
 
     # Load model files
     if len(list_files) == 0:
@@ -184,8 +345,10 @@ def get_icecover_model(prop, logger):
     else:
         lon_m = lon_m - 360
 
+    # Left dask-backed, so only the time steps the skill code pairs with
+    # observations are ever read from disk.
     try:
-        icecover_m = np.asarray(concated_model.variables[ice_name][:])
+        icecover_m = concated_model.variables[ice_name].data
     except KeyError:
         logger.error('No modeled ice concentration available! Abort')
         sys.exit(-1)
@@ -194,7 +357,7 @@ def get_icecover_model(prop, logger):
 
     # Handle SCHISM daily extraction
     if prop.model_source == 'schism' and prop.ice_dt == 'daily':
-        hourly_indices = np.where((time_m.astype('datetime64[h]').view('i8') % 24) == 12)
+        hourly_indices = np.flatnonzero((time_m.astype('datetime64[h]').view('i8') % 24) == 12)
         time_m = time_m[hourly_indices]
         icecover_m = icecover_m[hourly_indices]
 
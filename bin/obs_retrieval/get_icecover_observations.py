@@ -132,6 +132,41 @@ def get_sat(list_of_urls1, list_of_urls2, obs2d_dir, logger):
     return list_of_files
 
 
+# Target size of one compressed chunk in the written ice cover files.
+_NC_CHUNK_BYTES = 1024 * 1024
+# Encoding keys carried over from the GLSEA input files that the netCDF4
+# writer either rejects or that are replaced by _netcdf_encoding.
+_DROPPED_ENCODING_KEYS = ('source', 'original_shape', 'preferred_chunks',
+                          'chunksizes', 'contiguous', 'zlib', 'complevel',
+                          'shuffle', 'compression')
+
+
+def _netcdf_encoding(ds):
+    """
+    Per-variable to_netcdf encoding: zlib level 1 and roughly 1 MB
+    chunks along time. Packing (dtype, _FillValue, scale_factor) read
+    from the input files is kept.
+    """
+    encoding = {}
+    for name, var in ds.data_vars.items():
+        if var.dtype.kind not in 'biuf' or var.ndim == 0:
+            continue
+        enc = {key: val for key, val in var.encoding.items()
+               if key not in _DROPPED_ENCODING_KEYS}
+        enc.update({'zlib': True, 'complevel': 1, 'contiguous': False})
+        if 'time' in var.dims:
+            step_bytes = var.dtype.itemsize * max(
+                int(np.prod([size for dim, size in var.sizes.items()
+                             if dim != 'time'])), 1)
+            n_time = min(var.sizes['time'],
+                         max(_NC_CHUNK_BYTES // step_bytes, 1))
+            enc['chunksizes'] = tuple(
+                n_time if dim == 'time' else size
+                for dim, size in var.sizes.items())
+        encoding[name] = enc
+    return encoding
+
+
 def concat_sat(list_of_files, obs2d_dir, logger):
     """
     Concatenates the satellite files on
@@ -164,6 +199,7 @@ def concat_sat(list_of_files, obs2d_dir, logger):
             mode = 'w',
             format = 'NETCDF4',
             engine = 'netcdf4',
+            encoding = _netcdf_encoding(nc_item),
             )
     except MemoryError as ex:
         logger.error(f'Error happened at saving file {save_path} -- {str(ex)}')
@@ -383,7 +419,8 @@ def get_icecover_observations(prop, logger):
         masked_sat,ice_clim = masksat_by_ofs(concated_sat[-1], shape_file, prop)
         masked_sat.to_netcdf(
             f'{prop.data_observations_2d_satellite_path}/{prop.ofs}_ice.nc',
-            mode='w'
+            mode='w',
+            encoding=_netcdf_encoding(masked_sat),
         )
         logger.info('Finished clipping satellite data for %s', prop.ofs)
     except ValueError as ex:
@@ -308,7 +308,7 @@ def make_file_list(prop, dates, dir_list, logger):
                                 file_name = os.path.join(dir_list[i], file_name). \
                                     replace('\\', '/')
                                 file_list.append(file_name)
-            elif prop.ofs in ('stofs_2d_glo'):
+            elif prop.ofs == 'stofs_2d_glo':
                 for i, datei in enumerate(dates):
                     for cycle in fcstcycles:
                         # For now we're just doing the combined water level ("cwl").
@@ -338,7 +338,7 @@ def make_file_list(prop, dates, dir_list, logger):
                                 file_list.append(file_name)
 
         elif prop.ofsfiletype == 'stations':
-            if prop.ofs in ('stofs_2d_glo'):
+            if prop.ofs == 'stofs_2d_glo':
                 for i, datei in enumerate(dates):
                     for cycle in fcstcycles:
                         # For now we're just doing the combined water level ("cwl").
@@ -390,7 +390,7 @@ def make_file_list(prop, dates, dir_list, logger):
                                 file_name = os.path.join(dir_list[i], file_name). \
                                     replace('\\', '/')
                                 file_list.append(file_name)
-            elif prop.ofs in ('stofs_2d_glo'):
+            elif prop.ofs == 'stofs_2d_glo':
                 for i, datei in enumerate(dates):
                     for cycle in fcstcycles:
                         # For now we're just doing the combined water level ("cwl").
@@ -419,7 +419,7 @@ def make_file_list(prop, dates, dir_list, logger):
                                 file_list.append(file_name)
 
         elif prop.ofsfiletype == 'stations':
-            if prop.ofs in ('stofs_2d_glo'):
+            if prop.ofs == 'stofs_2d_glo':
                 for i, datei in enumerate(dates):
                     for cycle in fcstcycles:
                         # For now we're just doing the combined water level ("cwl").
@@ -602,7 +602,7 @@ def download_data(prop, list_of_urls1, dir_list, logger):
                     list_of_urls1[0].split('.com')[-1]
                 ).replace('//', '/').replace('STOFS-3D-Atl/', 'stofs_3d_atl/'),
             )
-        elif prop.ofs in ('stofs_2d_glo'):
+        elif prop.ofs == 'stofs_2d_glo':
             urllib.request.urlretrieve(
                 list_of_urls1[0].replace('\\', '/'),
                 (savepath + list_of_urls1[0].split('.com')[-1]).replace('//', '/'),
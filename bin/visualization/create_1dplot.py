@@ -839,7 +839,7 @@ def create_1dplot(prop, logger):
                          'Switching to IGLD...', prop.datum, prop.ofs)
             prop.datum = 'IGLD85'
     except TypeError:
-        if (vdatums == -9995) and prop.ofs.lower() in ('stofs_2d_glo'):
+        if (vdatums == -9995) and prop.ofs.lower() == 'stofs_2d_glo':
             logger.info('No vdatum file for STOFS-2D-Global, as expected.')
         else:
             logger.error('Failure checking for datum netcdf file on the NODD S3 '
@@ -165,6 +165,30 @@ def check_custom_file_list(file_list_path: str, logger: Logger) -> None:
 
 
 
+def _full_date_to_day(date_full: str) -> datetime:
+    """
+    Parse the day of a full start/end date string.
+
+    Parameters
+    ----------
+    date_full : str
+        Date in format 'YYYY-MM-DDTHH:MM:SSZ' or 'YYYYMMDD-HH:MM:SS'
+
+    Returns
+    -------
+    datetime
+        Midnight of that day
+
+    Raises
+    ------
+    ValueError
+        If the date part cannot be parsed
+    """
+    if 'T' in date_full and 'Z' in date_full:
+        return datetime.strptime(date_full.split('T')[0], '%Y-%m-%d')
+    return datetime.strptime(date_full.split('-')[0], '%Y%m%d')
+
+
 def check_model_files(prop: Any, logger: Logger) -> None:
     """
     Verify that all necessary model files are present for skill assessment.
@@ -224,14 +248,16 @@ def check_model_files(prop: Any, logger: Logger) -> None:
                            'was found in the configuration!')
         return
 
+    # Directory params do not depend on the cast, so read the config and
+    # build the model dir once
+    dir_params = utils.Utils(_conf).read_config_section('directories', logger)
+    model_dir = Path(dir_params['model_historical_dir'], prop.ofs,
+                     dir_params['netcdf_dir']).as_posix()
+
     # This first chunk handles the main skill assessment
     for cast in prop.whichcasts:
         prop.whichcast = cast
-        # Directory params
-        _conf = getattr(prop, 'config_file', None)
-        dir_params = utils.Utils(_conf).read_config_section('directories', logger)
-        prop.model_save_path = os.path.join(dir_params['model_historical_dir'],
-                                            prop.ofs, dir_params['netcdf_dir'])
+        prop.model_save_path = model_dir
 
         # First make list of what files SHOULD be in the directories
         try:
@@ -247,35 +273,20 @@ def check_model_files(prop: Any, logger: Logger) -> None:
         dir_list = dir_list[1:]  # Chop off extra first dir, not needed here
         file_path_list = get_model_data.make_file_list(prop, dates, dir_list,
                                                         logger)
-        file_wish = []
-        file_wish.append([i.split('/')[-1] for i in file_path_list])
-
-        # Now see what is actually available. Need to reformat dates before
-        # using list_of_files.py
-        startdatesave = prop.start_date_full
-        enddatesave = prop.end_date_full
-        if 'T' in prop.start_date_full and 'Z' in prop.start_date_full:
-            prop.start_date_full = prop.start_date_full.replace('-', '')
-            prop.end_date_full = prop.end_date_full.replace('-', '')
-            prop.start_date_full = prop.start_date_full.replace('Z', '')
-            prop.end_date_full = prop.end_date_full.replace('Z', '')
-            prop.start_date_full = prop.start_date_full.replace('T', '-')
-            prop.end_date_full = prop.end_date_full.replace('T', '-')
+
+        # Now see what is actually available. list_of_files.py needs
+        # YYYYMMDDHH start/end dates covering whole days.
         try:
-            prop.startdate = (datetime.strptime(
-                prop.start_date_full.split('-')[0], '%Y%m%d')).strftime(
-                '%Y%m%d') + '00'
-            prop.enddate = (datetime.strptime(
-                prop.end_date_full.split('-')[0], '%Y%m%d')).strftime(
-                '%Y%m%d') + '23'
+            prop.startdate = _full_date_to_day(
+                prop.start_date_full).strftime('%Y%m%d') + '00'
+            prop.enddate = _full_date_to_day(
+                prop.end_date_full).strftime('%Y%m%d') + '23'
         except ValueError as e_x:
             logger.error(f'Date format problem in check_model_files: {e_x}')
             logger.error('Unable to check if model files are present.')
             return
 
-        prop.model_path = os.path.join(dir_params['model_historical_dir'],
-                                       prop.ofs, dir_params['netcdf_dir'])
-        prop.model_path = Path(prop.model_path).as_posix()
+        prop.model_path = model_dir
         dir_list = list_of_dir(prop, logger)
         try:
             file_actual_path_list = list_of_files(prop, dir_list, logger)
@@ -288,14 +299,14 @@ def check_model_files(prop: Any, logger: Logger) -> None:
             logger.error('No model output files! Exiting...')
             raise SystemExit(1)
 
-        file_actual = []
-        file_actual.append([i.split('/')[-1] for i in file_actual_path_list])
+        file_actual = {os.path.basename(i) for i in file_actual_path_list}
 
         # Now cross-check wish_list and actual_list. If files are missing,
-        # display missing files in log.
-        if list(set(file_wish[0]).difference(file_actual[0])):
-            missing_files = list(set(file_wish[0]) -
-                                 set(file_actual[0]))
+        # display missing files in log (once each, in expected order).
+        missing_files = list(dict.fromkeys(
+            name for name in map(os.path.basename, file_path_list)
+            if name not in file_actual))
+        if missing_files:
             logger.warning('Oops, you are missing model files! The missing '
                          'files are: \n{}'.format('\n'.join(map(
                                                     str, missing_files))))
@@ -304,6 +315,3 @@ def check_model_files(prop: Any, logger: Logger) -> None:
 
         else:
             logger.info('Located all necessary model files for %s!', cast)
-            # Reset dates before returning
-            prop.start_date_full = startdatesave
-            prop.end_date_full = enddatesave
@@ -10,9 +10,9 @@ Last updated: 8/12/25
 """
 from __future__ import annotations
 
-import copy
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import numpy as np
@@ -21,9 +21,56 @@ import pandas as pd
 from ofs_skill.model_processing import do_horizon_skill_utils, get_fcst_cycle
 from ofs_skill.model_processing.get_node_ofs import get_node_ofs
 from ofs_skill.obs_retrieval.station_ctl_file_extract import station_ctl_file_extract
+from ofs_skill.obs_retrieval.utils import get_parallel_config
 from ofs_skill.skill_assessment.get_skill import name_convent, ofs_ctlfile_extract
 from ofs_skill.visualization import plot_forecast_hours
 
+# Leading columns of a station .obs file; currents files carry direction,
+# u and v after these, which are not used here
+_OBS_COLUMNS = ['julian', 'year', 'month', 'day', 'hour', 'minute', 'OBS']
+_OBS_DTYPES = {
+    'julian': 'float64',
+    'year': 'int64',
+    'month': 'int64',
+    'day': 'int64',
+    'hour': 'int64',
+    'minute': 'int64',
+    'OBS': 'float64',
+}
+
+
+class _PropView:
+    '''
+    Writable view of a model properties object. Attributes set on the view
+    stay on the view; everything else is read from the base object, which
+    is shared rather than copied.
+    '''
+
+    def __init__(self, base):
+        self._base = base
+
+    def __getattr__(self, name):
+        # Only reached for attributes not set on the view itself
+        if name == '_base' or name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self._base, name)
+
+
+def _read_obs_file(obs_path):
+    '''
+    Reads a station .obs file into a dataframe with the _OBS_COLUMNS
+    columns, using a fixed schema instead of inferring column types.
+    '''
+    return pd.read_csv(
+        obs_path,
+        sep=r'\s+',
+        header=None,
+        names=_OBS_COLUMNS,
+        usecols=range(len(_OBS_COLUMNS)),
+        dtype=_OBS_DTYPES,
+        engine='c',
+    )
+
 
 def make_horizon_series(prop, logger):
     '''
@@ -39,11 +86,12 @@ def make_horizon_series(prop, logger):
 
     Returns
     -------
-    NOTHING. Calls get_node_ofs.py which writes CSVs to file.
+    NOTHING. Collects the model cycle series from get_node_ofs.py and
+    writes one CSV per station and variable.
 
     '''
-    # First make dummy copy of prop to manipulate in here
-    prop11 = copy.deepcopy(prop)
+    # First make a view of prop to manipulate in here
+    prop11 = _PropView(prop)
 
     # First get all hours & dates between start and end dates
     try:
@@ -81,32 +129,32 @@ def make_horizon_series(prop, logger):
     prop11.datecycles = datecycles
     prop11.whichcast = 'forecast_a'
     fcstlength, _ = get_fcst_cycle.get_fcst_hours(prop.ofs)
-    for i, filename in enumerate(filenames):
-        if 'nowcast' in str(filename.split('.')):
-            continue  # Skip any nowcasts
+
+    def _run_cycle(i, filename, prop_cycle, cycle_frames):
+        """Load one forecast cycle, adding its series to cycle_frames."""
         start_date = filename.split('.')[2]
-        prop11.start_date_full = \
+        prop_cycle.start_date_full = \
             start_date[0:4] + '-' + start_date[4:6] + '-' +\
             start_date[6:8] + 'T00:00:00Z'
-        prop11.end_date_full = datetime.strftime(
+        prop_cycle.end_date_full = datetime.strftime(
             (
-                datetime.strptime(prop11.start_date_full,
+                datetime.strptime(prop_cycle.start_date_full,
                                   '%Y-%m-%dT%H:%M:%SZ') +
                 timedelta(hours=fcstlength)
             ), '%Y-%m-%dT%H:%M:%SZ',
         )
-        prop11.forecast_hr = filename.split('.')[1][1:3]+'z'
+        prop_cycle.forecast_hr = filename.split('.')[1][1:3]+'z'
         try:
             logger.info(
                 'Running get_node for %s...',
                 str(filename),
             )
             # Call get node
-            get_node_ofs(prop11, logger)
+            get_node_ofs(prop_cycle, logger, horizon_frames=cycle_frames)
             logger.info(
                 'Forecast cycles are %s percent '
                 'complete!\n',
-                str(np.round(((i+1)/len(filenames))*100, decimals=2)),
+                str(np.round(((i+1)/len(cycles))*100, decimals=2)),
             )
         except Exception as e_x:
             logger.error(
@@ -114,6 +162,62 @@ def make_horizon_series(prop, logger):
                 'Passing to next horizon. '
                 'Error: %s', e_x,
             )
+        return cycle_frames
+
+    # Only forecast files are loaded; skip any nowcasts
+    cycles = list(enumerate(
+        filename for filename in filenames
+        if filename.endswith('.forecast.nc')
+    ))
+    # Cycle series per horizon CSV, merged and written once after the loop
+    horizon_frames = {}
+    parallel_cfg = get_parallel_config(
+        logger,
+        config_file=getattr(prop, 'config_file', None),
+    )
+    if parallel_cfg['parallel_forecast_cycles'] and len(cycles) > 2:
+        # Run the first cycle alone so any model ctl files are written
+        # before the remaining cycles read them concurrently
+        _run_cycle(*cycles[0], prop11, horizon_frames)
+        max_workers = min(len(cycles)-1, 4)
+        logger.info('Processing %d forecast cycles in parallel with %d '
+                    'workers', len(cycles)-1, max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Each cycle gets its own prop view and collector; collectors are
+            # combined in cycle order so the CSV columns stay in order
+            results = executor.map(
+                lambda cycle: _run_cycle(*cycle, _PropView(prop11), {}),
+                cycles[1:],
+            )
+            for cycle_frames in results:
+                for filepath, frames in cycle_frames.items():
+                    horizon_frames.setdefault(filepath, []).extend(frames)
+    else:
+        for i, filename in cycles:
+            _run_cycle(i, filename, prop11, horizon_frames)
+
+    def _save_horizons(filepath, frames):
+        """Merge one station's cycles onto its horizon CSV and write it."""
+        try:
+            df = do_horizon_skill_utils.pandas_merge_cycles(
+                filepath, frames, prop11, logger)
+            df.to_csv(filepath, index=False)
+        except Exception as e_x:
+            logger.error(
+                'Could not save forecast horizon series to %s! '
+                'Error: %s', filepath, e_x,
+            )
+
+    # Each horizon CSV belongs to one station and variable, so the
+    # read/merge/write passes are independent of each other
+    if parallel_cfg.get('parallel_stations') and len(horizon_frames) > 1:
+        with ThreadPoolExecutor(
+                max_workers=min(len(horizon_frames), 8)) as executor:
+            list(executor.map(_save_horizons, horizon_frames,
+                              horizon_frames.values()))
+    else:
+        for filepath, frames in horizon_frames.items():
+            _save_horizons(filepath, frames)
 
     logger.info(
         'Done loading and saving model forecast horizon series! '
@@ -203,6 +307,10 @@ def merge_obs_series_scalar(prop, logger):
         read_ofs_ctl_file = ofs_ctlfile_extract(
             prop, name_var, logger,)
         if read_ofs_ctl_file is not None:
+            # Obs ctl row for each station ID; the first row wins
+            obs_rows = {}
+            for row, station in enumerate(read_station_ctl_file[0]):
+                obs_rows.setdefault(station[0], row)
             # Loop through stations
             for i in range(0, len(read_ofs_ctl_file[4])):
                 # Now pair/merge the obs time series with the horizons
@@ -216,11 +324,7 @@ def merge_obs_series_scalar(prop, logger):
                 # Open .obs file
                 if os.path.isfile(obs_path):
                     if os.path.getsize(obs_path) > 0:
-                        obs_df = pd.read_csv(
-                            obs_path,
-                            delim_whitespace=True,
-                            header=None,
-                        )
+                        obs_df = _read_obs_file(obs_path)
                     else:
                         logger.error(
                             '%s/%s_%s_%s_station.obs is empty',
@@ -252,31 +356,23 @@ def merge_obs_series_scalar(prop, logger):
                         # Prep obs series first
                         # Reading the input dataframes
                         obs_df['DateTime'] = pd.to_datetime(
-                            dict(
-                                year=obs_df[1],
-                                month=obs_df[2],
-                                day=obs_df[3],
-                                hour=obs_df[4],
-                                minute=obs_df[5],
-                            ),
+                            obs_df[['year', 'month', 'day', 'hour', 'minute']],
                         )
-                        obs_df = obs_df.rename(columns={6: 'OBS'})
-                        obs_df = obs_df.sort_values(by='DateTime')
+                        obs_df = obs_df[['DateTime', 'OBS']]
+                        # Sort once; the filter below keeps the order
                         obs_df = pd.concat([paired_0, obs_df]).sort_values(
-                            by='DateTime',
+                            by='DateTime', kind='stable',
                         )
                         obs_df = obs_df[
                             ~obs_df['DateTime'].duplicated(keep=False)
                             | obs_df[['OBS']].notnull().any(axis=1)
                         ]
                         obs_df = (
-                            obs_df.sort_values(by='DateTime')
-                            .set_index('DateTime')
+                            obs_df.set_index('DateTime')
                             .astype(float)
                             .interpolate(method='linear', limit=3)
                             .ffill(limit=1)
                             .bfill(limit=1)
-                            .reset_index()
                         )
                     except Exception as e_x:
                         logger.error(
@@ -284,15 +380,13 @@ def merge_obs_series_scalar(prop, logger):
                             'forecast horizon CSV! Error: %s', e_x,
                         )
                     try:
-                        ofs_df = ofs_df.sort_values(by='DateTime')
                         ofs_df = (
-                            ofs_df.sort_values(by='DateTime')
-                            .set_index('DateTime')
+                            ofs_df.set_index('DateTime')
+                            .sort_index(kind='stable')
                             # .interpolate(method="linear",limit=3)
                             # .ffill(limit=3)
                             # .bfill(limit=3)
                             .astype(float)
-                            .reset_index()
                         )
                     except Exception as e_x:
                         logger.error(
@@ -300,12 +394,10 @@ def merge_obs_series_scalar(prop, logger):
                             'forecast horizon CSV! Error: %s', e_x,
                         )
                     try:
-                        paired = pd.merge(
-                            ofs_df,
-                            obs_df[['DateTime', 'OBS']],
-                            on=['DateTime'],
-                            how='left',
-                        )
+                        # Both sides are indexed and sorted on DateTime
+                        paired = ofs_df.join(
+                            obs_df['OBS'], how='left',
+                        ).reset_index()
                         paired = paired.loc[(
                             paired['DateTime'] >=
                             datetime_start
@@ -319,13 +411,8 @@ def merge_obs_series_scalar(prop, logger):
                             'series! Error: %s', e_x,
                         )
                     # Do stats
-                    try:
-                        obs_row = [y[0] for y in read_station_ctl_file[0]].\
-                            index(read_ofs_ctl_file[4][i])
-                        if read_station_ctl_file[0][obs_row][0] != \
-                                read_ofs_ctl_file[4][i]:
-                            raise Exception
-                    except Exception:
+                    obs_row = obs_rows.get(read_ofs_ctl_file[4][i])
+                    if obs_row is None:
                         logger.error(
                             'Could not match station ID %s between '
                             'control file in get_node_ofs!',
@@ -399,41 +486,54 @@ def horizon_skill(prop, df, info, logger):
     fcstlength, _ = get_fcst_cycle.get_fcst_hours(prop.ofs)
     forecast_cols = [col for col in df.columns if 'forecast' in col]
     bins = np.arange(0, fcstlength+6, 6)
-    for fcst_col in forecast_cols:
-        col_time = fcst_col.split('-')[0] + '-' + \
-            fcst_col.split('-')[1][0:2] + ':00:00'
-        time_diff = (
-            df['DateTime'] - datetime.strptime(
-                col_time, '%Y%m%d-%H:%M:%S',
-            )
-        )
-        df['horizon_category'] = np.floor(
-            time_diff.dt.total_seconds()/3600,
-        ).astype('int')
-        df['hour_bins'] = df['horizon_category']
-        for j in range(len(bins)-1):
-            df.loc[
-                (df['horizon_category'] >= bins[j]) &
-                (df['horizon_category'] < bins[j+1]), 'hour_bins',
-            ] = \
-                bins[j+1]
-        df['model_cycle'] = fcst_col
-        # Make new dataframe with model, obs, and horizon category
-        df_temp = df[[
-            'DateTime', 'model_cycle', 'horizon_category', 'hour_bins',
-            'OBS', fcst_col,
-        ]]
-        df_temp = df_temp.rename(columns={fcst_col: 'OFS'})
-        if fcst_col == forecast_cols[0]:
-            df_all = df_temp
-        else:
-            df_all = pd.concat([df_all, df_temp])
-
-    # Now bin errors by hour after loop is finished
-    df_all = df_all[(df_all['horizon_category'] <= fcstlength) &
-                    (df_all['horizon_category'] >= 0)]
-    df_all['error'] = df_all['OFS'] - df_all['OBS']
-    df_all['square_error'] = (df_all['OFS'] - df_all['OBS'])**2
+    # Start time of each model cycle, parsed from the column names at once
+    col_times = pd.to_datetime(
+        [fcst_col.split('-')[0] + fcst_col.split('-')[1][0:2]
+         for fcst_col in forecast_cols],
+        format='%Y%m%d%H',
+    )
+    # Reshape to one block of rows per model cycle, in column order
+    df_long = df.melt(
+        id_vars=['DateTime', 'OBS'], value_vars=forecast_cols,
+        var_name='model_cycle', value_name='OFS',
+    )
+    # Whole hours since each row's cycle start, on int64 nanoseconds rather
+    # than through pandas timedeltas
+    ns_per_hour = 3600 * 10**9
+    datetime_ns = df['DateTime'].to_numpy(dtype='datetime64[ns]').view('i8')
+    col_times_ns = col_times.to_numpy(dtype='datetime64[ns]').view('i8')
+    horizon_category = (
+        np.tile(datetime_ns, len(forecast_cols)) -
+        np.repeat(col_times_ns, len(df))
+    ) // ns_per_hour
+    # Keep rows inside the forecast horizon, then bin and compute errors on
+    # those rows only
+    keep = np.flatnonzero(
+        (horizon_category >= 0) & (horizon_category <= fcstlength))
+    horizon_category = horizon_category[keep]
+    # Hours in [bins[j], bins[j+1]) go to bin bins[j+1]; hours outside the
+    # bins keep their own value
+    bin_index = np.digitize(horizon_category, bins)
+    in_bins = (bin_index > 0) & (bin_index < len(bins))
+    obs = df_long['OBS'].to_numpy()[keep]
+    ofs = df_long['OFS'].to_numpy()[keep]
+    error = ofs - obs
+    df_all = pd.DataFrame(
+        {
+            'DateTime': df_long['DateTime'].to_numpy()[keep],
+            'model_cycle': df_long['model_cycle'].to_numpy()[keep],
+            'horizon_category': horizon_category,
+            'hour_bins': np.where(
+                in_bins, bins[np.minimum(bin_index, len(bins)-1)],
+                horizon_category,
+            ),
+            'OBS': obs,
+            'OFS': ofs,
+            'error': error,
+            'square_error': error**2,
+        },
+        index=df_long.index[keep],
+    )
 
     # Save df_all to CSV
     # filename=f"{prop.ofs}_{info[0]}_{info[2]}_fcsthorizons_pair.csv"
@@ -441,20 +541,8 @@ def horizon_skill(prop, df, info, logger):
     #               index=False)
 
     # Sort the model cycles by date
-    forecast_cols_dt = []
-    # First get all column names & format them
-    for fcst_col in forecast_cols:
-        forecast_cols_dt.append(
-            datetime.strptime(
-                fcst_col.split('-')[0] +
-                fcst_col.split('-')[1][0:2],
-                '%Y%m%d%H',
-            ),
-        )
-    # Now combine lists with original indices and sort
-    combined_list = list(enumerate(zip(forecast_cols_dt, forecast_cols)))
-    sorted_combined_list = sorted(combined_list, key=lambda item: item[1][0])
-    forecast_cols_sort = [item[1][1] for item in sorted_combined_list]
+    order = np.argsort(col_times.to_numpy(), kind='stable')
+    forecast_cols_sort = [forecast_cols[i] for i in order]
 
     # Let's plot
     plot_forecast_hours.make_horizonbin_plots(df_all, info, prop, logger)
@@ -4,6 +4,7 @@ Utility functions to support the forecast horizon skill option. Called by
 do_horizon_skill and/or get_node_ofs, the functions are
 described below and include:
     -pandas_merge
+    -pandas_merge_cycles
     -pandas_processing
     -get_horizon_filenames
 
@@ -14,6 +15,8 @@ Created on Wed Jan 14 08:24:39 2026
 
 from __future__ import annotations
 
+import io
+import os
 import sys
 from datetime import datetime, timedelta
 
@@ -24,6 +27,51 @@ from ofs_skill.model_processing import (
     get_fcst_cycle,
 )
 
+# Time key columns shared by every model cycle series in a horizon CSV
+_HORIZON_KEY_COLS = ['julian', 'year', 'month', 'day', 'hour', 'minute']
+
+
+def _read_horizon_csv(filepath, datecycles, prop):
+    '''
+    Reads an existing horizon CSV, drops stale columns from a previous run
+    and any cycles about to be rewritten, and indexes it on the time key.
+    '''
+    prd = pd.read_csv(filepath)
+    # Clean up existing dataframe if there are columns from a previous run
+    desired_cols = prop.datecycles
+    diff_cols = list(prd.columns.difference(desired_cols))
+    cols_to_drop = [item for item in diff_cols if 'hr' in item]
+    # Merge away, but avoid duplicates if files exist from a previous run!
+    # This is especially relevant to server/cron runs!
+    cols_to_drop += [item for item in datecycles if item in prd.columns]
+    if cols_to_drop:
+        prd.drop(columns=cols_to_drop, inplace=True)
+    prd = prd.set_index(_HORIZON_KEY_COLS).sort_index()
+    if not prd.index.is_unique:
+        raise ValueError(f'Duplicate time rows found in {filepath}!')
+    return prd
+
+
+def _cycle_series(df, datecycle):
+    '''
+    Sets datatypes of a model cycle series from pandas_processing and
+    indexes it on the time key.
+    '''
+    df = df.astype({
+        'julian': 'float',
+        'year': 'int64',
+        'month': 'int64',
+        'day': 'int64',
+        'hour': 'int64',
+        'minute': 'int64',
+        datecycle: 'float',
+    })
+    df = df.set_index(_HORIZON_KEY_COLS)[[datecycle]].sort_index()
+    if not df.index.is_unique:
+        raise ValueError(
+            f'Duplicate time rows found while merging {datecycle}!')
+    return df
+
 
 def pandas_merge(filepath, df, datecycle, prop):
     '''
@@ -46,43 +94,52 @@ def pandas_merge(filepath, df, datecycle, prop):
 
     '''
     # Existing dataframe with previously merged model cycle series
-    prd = pd.read_csv(filepath)
-    # Clean up existing dataframe if there are columns from a previous run
-    desired_cols = prop.datecycles
-    diff_cols = list(prd.columns.difference(desired_cols))
-    cols_to_drop = [item for item in diff_cols if 'hr' in item]
-    if cols_to_drop:
-        prd.drop(columns=cols_to_drop, inplace=True)
-    # Set datatypes of new model cycle series before merging
-    df = df.astype({
-        'julian': 'float',
-        'year': 'int64',
-        'month': 'int64',
-        'day': 'int64',
-        'hour': 'int64',
-        'minute': 'int64',
-        datecycle: 'float',
-    })
-    # Merge away, but avoid duplicates if files exist from a previous run!
-    # This is especially relevant to server/cron runs!
-    if datecycle in prd.columns:
-        prd.drop(columns=datecycle, inplace=True)
-    df = pd.merge(
-        prd, df,
-        on=[
-            'julian',
-            'year',
-            'month',
-            'day',
-            'hour',
-            'minute',
-        ],
-        how='outer',
-    )
+    prd = _read_horizon_csv(filepath, [datecycle], prop)
+    # Outer join on the shared time key index rather than merging on the
+    # key columns; both sides are sorted by the key first.
+    df = prd.join(_cycle_series(df, datecycle), how='outer').reset_index()
 
     return df
 
 
+def pandas_merge_cycles(filepath, frames, prop, logger):
+    '''
+    Combines all model cycle time series collected for one station and
+    variable into a single dataframe, merged onto the existing horizon CSV
+    at filepath if there is one. Called by make_horizon_series so that each
+    horizon CSV is read and written once per run instead of once per cycle.
+
+    Parameters
+    ----------
+    filepath: path to the horizon CSV for this station and variable.
+    frames: list of (datecycle, df) tuples in cycle order, where df is the
+    output of pandas_processing.
+    prop: model properties object; prop.datecycles lists wanted columns.
+    logger : logging interface.
+
+    Returns
+    -------
+    df: merged dataframe with existing & new model cycle series.
+
+    '''
+    # A cycle processed twice keeps its last series, as if rewritten
+    series = []
+    for datecycle, frame in dict(frames).items():
+        try:
+            series.append(_cycle_series(frame, datecycle))
+        except Exception as e_x:
+            logger.error('Could not merge datecycle %s! Skipping. '
+                         'Error: %s', datecycle, e_x)
+    if not series:
+        raise ValueError(f'No forecast horizons available for {filepath}!')
+    df = pd.concat(series, axis=1, join='outer', sort=True)
+    if os.path.isfile(filepath):
+        prd = _read_horizon_csv(filepath, list(df.columns), prop)
+        df = prd.join(df, how='outer')
+
+    return df.reset_index()
+
+
 def pandas_processing(name_conventions, datecycle, formatted_series):
     '''
     Processes & parses model time series into pandas dataframes.
@@ -104,50 +161,22 @@ def pandas_processing(name_conventions, datecycle, formatted_series):
 
     '''
 
-    # Get date and forecast cycle
-    for k in range(len(formatted_series)):
-        formatted_series[k] = \
-            formatted_series[k].replace('   ', ' ')
-        formatted_series[k] = \
-            formatted_series[k].replace('  ', ' ')
-    df = pd.DataFrame(formatted_series)
-    df.columns = ['temp']
-    if name_conventions != 'cu':
-        df[[
-            'julian',
-            'year',
-            'month',
-            'day',
-            'hour',
-            'minute',
-            datecycle,
-        ]] = df['temp'].str.split(
-            ' ',
-            n=6, expand=True,
-        )
-        columns_to_drop = ['temp']
-        # df = df.replace(r'^\s*$', np.nan, regex=True)
-    else:
-        df[[
-            'julian',
-            'year',
-            'month',
-            'day',
-            'hour',
-            'minute',
-            datecycle,
-            'temp2',
-            'temp3',
-            'temp4',
-        ]] = df['temp'].str.split(
-            ' ',
-            n=9, expand=True,
-        )
-        columns_to_drop = ['temp', 'temp2', 'temp3', 'temp4']
-        # df = df.replace(r'^\s*$', np.nan, regex=True)
-    df = df.drop(columns_to_drop, axis=1)
+    # Parse the whitespace-separated lines in one pass. Currents lines carry
+    # direction, u and v after the speed, which are not used here.
+    names = _HORIZON_KEY_COLS + [datecycle]
+    df = pd.read_csv(
+        io.StringIO('\n'.join(formatted_series)),
+        sep=r'\s+',
+        header=None,
+        usecols=range(len(names)),
+        names=names,
+        dtype=str,
+        keep_default_na=False,
+        engine='c',
+    )
     return df
 
+
 def get_horizon_filenames(ofs, start_date, end_date, logger):
     '''
     This function is called by make_horizon_series. It figures out the file
@@ -165,7 +194,7 @@ def get_horizon_filenames(ofs, start_date, end_date, logger):
     Returns
     -------
     unique_filenames: a list of unique filenames for each model cycle within
-    the time range between start_date and end_date.
+    the time range between start_date and end_date, in cycle order.
     '''
 
     # Now zoom backwards through time to find first available forecast cycle
@@ -179,57 +208,35 @@ def get_horizon_filenames(ofs, start_date, end_date, logger):
 
     # Get OFS forecast length & cycle info
     fcstlength, fcstcycles = get_fcst_cycle.get_fcst_hours(ofs)
-
-    dates_all = []
-    fcst_horizons_all = []
-    filenames_all = []
-    cycles_all = []
-    date_iterate = startdatedt
-    while date_iterate <= enddatedt:
-        datedt = date_iterate
-        # Round down to nearest hour to find cycle where data point would
-        # appear
-        datedt = datedt.replace(minute=0, second=0, microsecond=0)
-        d_0 = datedt - timedelta(hours=fcstlength)
-        d_0hr = d_0.hour
-        if not isinstance(fcstcycles, int):
-            dist = np.concatenate(
-                (fcstcycles, fcstcycles+24), axis=0)-int(d_0hr)
-        else:
-            dist = np.array([fcstcycles, fcstcycles+24]) - int(d_0hr)
-        index = np.where(dist >= 0)
-        base_forecast_date = d_0 + timedelta(hours=int(dist[index][0]))
-        n_extra = 0
-        if dist[index][0] == 0:
-            n_extra = 1
-        # Now find every cycle date between base date and input date
-        ndates = int(len(np.atleast_1d(fcstcycles))*(fcstlength/24)) + n_extra
-        d_t = int(24/len(np.atleast_1d(fcstcycles)))
-        dates = []
-        fcst_horizons = []
-        filenames = []
-        cycles = []
-        for i in range(0, ndates):
-            dt_i = d_t*i
-            dates.append(base_forecast_date + timedelta(hours=dt_i))
-            fcst_horizons.append(int((datedt-dates[i]).total_seconds()/3600))
-            datestrlong = datetime.strftime(dates[i], '%Y-%m-%dT%H:%M:%SZ')
-            datestr = datestrlong.split('T')[0].replace('-', '')
-            cycle = datestrlong.split('T')[1][0:2]
-            cycles.append(str(cycle))
-            cast = 'forecast'
-            if fcst_horizons[i] <= 0:
-                cast = 'nowcast'
-            filenames.append(
-                ofs + '.t' + cycle.zfill(2) + 'z.' + datestr +
-                '.stations.' + cast + '.nc',
-            )
-        date_iterate += timedelta(hours=1)
-        dates_all.append(dates)
-        fcst_horizons_all.append(fcst_horizons)
-        filenames_all.append(filenames)
-        cycles_all.append(cycles)
-    # Get unique filenames & cycles
-    flat_list = [item for sublist in filenames_all for item in sublist]
-    unique_filenames = list(set(flat_list))
+    # Cycle hours over two days, so the first cycle at or after any hour of
+    # the day is one sorted lookup
+    cycles_sorted = np.sort(np.atleast_1d(fcstcycles))
+    cycle_table = np.concatenate((cycles_sorted, cycles_sorted+24))
+    d_t = int(24/len(cycles_sorted))
+
+    unique_filenames = []
+    if enddatedt < startdatedt:
+        return unique_filenames
+    # Each hour in the date range (rounded down) is covered by the forecast
+    # of every cycle up to fcstlength hours before it, and by the nowcast of
+    # a cycle starting on that hour. Over the whole range that is every
+    # cycle from fcstlength hours before the first hour up to the last hour,
+    # so step through those cycles directly instead of hour by hour.
+    first_hour = startdatedt.replace(minute=0, second=0, microsecond=0)
+    last_hour = first_hour + timedelta(
+        hours=int((enddatedt-startdatedt).total_seconds()//3600))
+    d_0 = first_hour - timedelta(hours=fcstlength)
+    d_0hr = d_0.hour
+    dist = int(cycle_table[np.searchsorted(cycle_table, d_0hr)]) - d_0hr
+    cycle_date = d_0 + timedelta(hours=dist)
+    while cycle_date <= last_hour:
+        prefix = (
+            f'{ofs}.t{cycle_date.hour:02d}z.{cycle_date.year:04d}'
+            f'{cycle_date.month:02d}{cycle_date.day:02d}.stations.'
+        )
+        if cycle_date < last_hour:
+            unique_filenames.append(prefix + 'forecast.nc')
+        if cycle_date >= first_hour:
+            unique_filenames.append(prefix + 'nowcast.nc')
+        cycle_date += timedelta(hours=d_t)
     return unique_filenames
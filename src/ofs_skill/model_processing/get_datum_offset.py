@@ -32,7 +32,9 @@ Author: PL
 Created: Fri Jun 6 09:11:51 2025
 """
 
+import functools
 import os
+import threading
 from datetime import datetime
 from logging import Logger
 from typing import Any, Union
@@ -41,6 +43,7 @@ import numpy as np
 import pandas as pd
 import s3fs
 import xarray as xr
+from scipy.spatial import cKDTree
 
 from ofs_skill.obs_retrieval import utils, vdatum_resilient
 from ofs_skill.obs_retrieval.station_ctl_file_extract import station_ctl_file_extract
@@ -213,10 +216,15 @@ def report_datums(prop: Any, datum_offsets: list[list[Any]], logger: Logger) ->
             logger.warning('Station ctl file was empty; skipping datum report.')
             return
 
+        # Map each station ID to its first row in the obs ctl file, so the
+        # lookup below is not a list scan per station.
+        id_to_row = {}
+        for k, row in enumerate(read_station_ctl_file[0]):
+            id_to_row.setdefault(row[0], k)
+
         for i in range(len(datum_offsets[0])):
             # First find obs row for corresponding model station
-            obs_row = [y[0] for y in read_station_ctl_file[0]].\
-                index(datum_offsets[0][i])
+            obs_row = id_to_row[datum_offsets[0][i]]
             if read_station_ctl_file[0][obs_row][0] != \
                 datum_offsets[0][i]:
                 raise Exception
@@ -289,6 +297,123 @@ def report_datums(prop: Any, datum_offsets: list[list[Any]], logger: Logger) ->
                      'Skipping this step. Exception: %s', e_x)
 
 
+class _VdatumGrid:
+    """A loaded vdatum dataset plus a KD-tree over its node coordinates.
+
+    The tree is built on first use, so OFS that never search by lat/lon
+    (ROMS, GLOFS) do not pay for it. One grid is shared by every water
+    level station of a run.
+    """
+
+    def __init__(self, dataset: xr.Dataset):
+        self.dataset = dataset
+
+    @functools.cached_property
+    def _lonlat(self) -> np.ndarray:
+        return np.around(np.column_stack([
+            np.asarray(self.dataset['longitude']).ravel(),
+            np.asarray(self.dataset['latitude']).ravel()]), 3)
+
+    @functools.cached_property
+    def tree(self) -> cKDTree:
+        return cKDTree(self._lonlat)
+
+    def nearest_node(self, lon: Any, lat: Any) -> Any:
+        """Return the index of the vdatum node nearest to each lon/lat.
+
+        Node and target coordinates are rounded to 3 decimals before the
+        search. Rounding makes exact ties common; like ``np.argmin`` over
+        all node distances, the lowest node index wins a tie. ``lon`` and
+        ``lat`` may be scalars or arrays of the same shape.
+        """
+        target = np.around(np.stack([np.asarray(lon, dtype=float),
+                                     np.asarray(lat, dtype=float)],
+                                    axis=-1), 3)
+        flat = target.reshape(-1, 2)
+        dist, _ = self.tree.query(flat)
+        nearest = np.empty(len(flat), dtype=int)
+        for k, (point, d_min) in enumerate(zip(flat, dist)):
+            # The tree may return any of several equidistant nodes, so
+            # gather every node within the minimum distance (plus float
+            # slack) and break the tie on the exact distances.
+            candidates = np.sort(self.tree.query_ball_point(
+                point, r=d_min * (1 + 1e-9) + 1e-12))
+            cand_dist = np.linalg.norm(self._lonlat[candidates] - point,
+                                       axis=1)
+            nearest[k] = candidates[np.argmin(cand_dist)]
+        if target.ndim == 1:
+            return int(nearest[0])
+        return nearest.reshape(target.shape[:-1])
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vdatum_from_s3(ofs: str) -> _VdatumGrid:
+    """Open an OFS vdatum file from the NODD bucket and load it into memory.
+
+    get_datum_offset runs once per water level station, so without caching
+    the same S3 object would be re-opened for every station. A run works
+    on one OFS, so only the most recent grid is kept. Failures raise and
+    are therefore not cached. Callers must not modify the returned
+    dataset; read_vdatum_from_bucket hands out copies.
+    """
+    s3 = s3fs.S3FileSystem(anon=True)
+    bucket_name = 'noaa-nos-ofs-pds'
+    key = f'OFS_Grid_Datum/{ofs}_vdatums.nc'
+    url = f's3://{bucket_name}/{key}'
+    with s3.open(url, 'rb') as s3_file:
+        with xr.open_dataset(s3_file) as vdatums:
+            return _VdatumGrid(vdatums.load())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_vdatum_local(path: str) -> _VdatumGrid:
+    """Load the local fallback vdatum file, cached like the S3 read."""
+    with xr.open_dataset(path) as vdatums:
+        return _VdatumGrid(vdatums.load())
+
+
+def _read_vdatum_grid(prop: Any, logger: Logger) -> Union[_VdatumGrid, int]:
+    """Return the cached vdatum grid for prop.ofs, or an error code.
+
+    See read_vdatum_from_bucket for the lookup order and error codes.
+    """
+    if prop.ofs == 'stofs_2d_glo':
+        # We shouldn't actually ever need to use this value, but just in case, return a
+        # code that indicates no file to read for STOFS-2D-Global.
+        logger.info('STOFS-2D-Global uses coastalmodeling_vdatum conversion instead of a vdatum file on S3.')
+        return -9995
+    else:
+        try:
+            return _load_vdatum_from_s3(prop.ofs)
+        except FileNotFoundError:
+            logger.warning('vdatum file not found on S3 bucket, trying '
+                           'local fallback...')
+            try:
+                _conf = getattr(prop, 'config_file', None)
+                dir_params = utils.Utils(
+                    config_file=_conf
+                ).read_config_section('directories', logger)
+                local_vdatum = dir_params.get('local_vdatum')
+                if not local_vdatum:
+                    logger.warning(
+                        'No local_vdatum path configured in ofs_dps.conf. '
+                        'Cannot fall back to local vdatum file.')
+                    return -9990
+                grid = _load_vdatum_local(local_vdatum)
+                logger.warning(
+                    'Using local vdatum fallback: %s — verify this file '
+                    'is current with the S3 version.', local_vdatum)
+                return grid
+            except Exception as e_x:
+                logger.warning(
+                    'Local vdatum fallback failed: %s', e_x)
+                return -9990
+        except Exception as e_x:
+            logger.error('Error opening vdatums on the fly!')
+            logger.error(f'Error: {e_x}')
+            return -9990
+
+
 def read_vdatum_from_bucket(prop: Any, logger: Logger) -> Union[xr.Dataset, int]:
     """
     Read vertical datum conversion file from the NODD S3 bucket.
@@ -315,6 +440,8 @@ def read_vdatum_from_bucket(prop: Any, logger: Logger) -> Union[xr.Dataset, int]
     - Uses s3fs with anonymous access to NOAA NOS OFS Public Dataset
     - Bucket: noaa-nos-ofs-pds
     - Key format: OFS_Grid_Datum/{ofs}_vdatums.nc
+    - The S3 (or local fallback) read is cached for the most recent OFS;
+      a copy is returned
     - Returns error code -9990 if file cannot be opened
     - Returns error code -9995 for STOFS-2D-Global, which
       uses coastalmodeling_vdatum instead of a vdatum file on S3.
@@ -327,46 +454,38 @@ def read_vdatum_from_bucket(prop: Any, logger: Logger) -> Union[xr.Dataset, int]
     ... else:
     ...     print(f"Variables: {list(vdatums.data_vars)}")
     """
-    if prop.ofs in ('stofs_2d_glo'):
-        # We shouldn't actually ever need to use this value, but just in case, return a
-        # code that indicates no file to read for STOFS-2D-Global.
-        logger.info('STOFS-2D-Global uses coastalmodeling_vdatum conversion instead of a vdatum file on S3.')
-        return -9995
-    else:
-        s3 = s3fs.S3FileSystem(anon=True)
-        bucket_name = 'noaa-nos-ofs-pds'
-        key = f'OFS_Grid_Datum/{prop.ofs}_vdatums.nc'
-        url = f's3://{bucket_name}/{key}'
+    grid = _read_vdatum_grid(prop, logger)
+    if isinstance(grid, int):
+        return grid
+    # Shallow copy so callers cannot add or replace variables or attrs on
+    # the cached dataset.
+    return grid.dataset.copy(deep=False)
+
+
+# Offsets already computed in this process, keyed by _datum_offset_key.
+# Forecast horizon runs call get_node_ofs once per cycle for the same
+# stations, and the stations-file offsets may each need a VDatum request.
+_DATUM_OFFSET_CACHE: dict = {}
+_DATUM_OFFSET_LOCK = threading.Lock()
+
+
+def _datum_offset_key(prop: Any, node: int, id_number: str) -> tuple:
+    """Return everything a station's datum offset depends on."""
+    # SECOFS switches correction columns at the model-zero transition.
+    secofs_period = None
+    if prop.ofs == 'secofs':
         try:
-            vdatums = xr.open_dataset(s3.open(url, 'rb'))
-            return vdatums
-        except FileNotFoundError:
-            logger.warning('vdatum file not found on S3 bucket, trying '
-                           'local fallback...')
-            try:
-                _conf = getattr(prop, 'config_file', None)
-                dir_params = utils.Utils(
-                    config_file=_conf
-                ).read_config_section('directories', logger)
-                local_vdatum = dir_params.get('local_vdatum')
-                if not local_vdatum:
-                    logger.warning(
-                        'No local_vdatum path configured in ofs_dps.conf. '
-                        'Cannot fall back to local vdatum file.')
-                    return -9990
-                vdatums = xr.open_dataset(local_vdatum)
-                logger.warning(
-                    'Using local vdatum fallback: %s — verify this file '
-                    'is current with the S3 version.', local_vdatum)
-                return vdatums
-            except Exception as e_x:
-                logger.warning(
-                    'Local vdatum fallback failed: %s', e_x)
-                return -9990
-        except Exception as e_x:
-            logger.error('Error opening vdatums on the fly!')
-            logger.error(f'Error: {e_x}')
-            return -9990
+            secofs_period = datetime.strptime(
+                prop.start_date_full, '%Y-%m-%dT%H:%M:%SZ'
+            ) > datetime.strptime(SECOFS_MODELZERO_TRANSITION, '%m/%d/%Y')
+        except ValueError:
+            # _datum_offset falls back to the vdatum file for dates it
+            # cannot parse; key those on the raw string instead.
+            secofs_period = prop.start_date_full
+    return (prop.ofs, prop.ofsfiletype, prop.model_source,
+            prop.datum.lower(), int(node), str(id_number),
+            getattr(prop, 'config_file', None), getattr(prop, 'path', None),
+            secofs_period)
 
 
 def get_datum_offset(prop: Any, node: int, model: xr.Dataset,
@@ -446,6 +565,22 @@ def get_datum_offset(prop: Any, node: int, model: xr.Dataset,
     >>> print(f"Datum offset: {offset:.3f} m")
     Datum offset: 0.234 m
     """
+    key = _datum_offset_key(prop, node, id_number)
+    with _DATUM_OFFSET_LOCK:
+        cached = _DATUM_OFFSET_CACHE.get(key)
+    if cached is not None:
+        return cached
+    datum_offset = _datum_offset(prop, node, model, id_number, logger)
+    # Error codes are not cached, so a failed lookup is retried next time.
+    if datum_offset > -999:
+        with _DATUM_OFFSET_LOCK:
+            _DATUM_OFFSET_CACHE[key] = datum_offset
+    return datum_offset
+
+
+def _datum_offset(prop: Any, node: int, model: xr.Dataset,
+                  id_number: str, logger: Logger) -> float:
+    """Compute the offset for get_datum_offset, without caching."""
     # If doing GLOFS and using the LWD datum, no correction is necessary.
     if prop.datum.lower() == 'lwd':
         return 0
@@ -467,15 +602,17 @@ def get_datum_offset(prop: Any, node: int, model: xr.Dataset,
     logger.info('Doing datum conversion for %s station %s!', prop.ofs,
                 id_number)
     vdatums: Any = None
+    vdatum_grid: Any = None
     if prop.ofs not in ['secofs', 'loofs2'] and 'stofs' not in prop.ofs:
-        vdatums = read_vdatum_from_bucket(prop, logger)
-        if isinstance(vdatums, int):
+        vdatum_grid = _read_vdatum_grid(prop, logger)
+        if isinstance(vdatum_grid, int):
             logger.warning(
                 'WARNING: No vdatum file could be loaded for %s (S3 and '
                 'local fallback both failed). No datum shift will be '
                 'applied. Water level results should be viewed with '
                 'caution.', prop.ofs)
-            return vdatums
+            return vdatum_grid
+        vdatums = vdatum_grid.dataset
     # Here we handle secofs, which has a vdatum file on the co-ops server, or
     # or locally in ./src/. Once the vdatum file is on the NODD bucket, this section
     # can be removed.
@@ -609,18 +746,13 @@ def get_datum_offset(prop: Any, node: int, model: xr.Dataset,
                     )
             elif prop.model_source == 'fvcom':
                 # Gotta search with lat/lon here...
-                vlonlat = np.around(np.array([vdatums[
-                    'longitude'], vdatums['latitude']]), 3)
                 lon_adjustment = 360
                 if 'necofs' in prop.ofs:
                     lon_adjustment = 0
-                target = np.around(
-                    np.array([[_node_value(model, 'lon', node) - lon_adjustment],
-                              [_node_value(model, 'lat', node)]]), 3)
-                moddistances = np.linalg.norm(vlonlat - target,
-                                              axis=0)
-                datum_offset = float(datum_field[int(
-                    np.argmin(moddistances))])
+                nearest = vdatum_grid.nearest_node(
+                    _node_value(model, 'lon', node) - lon_adjustment,
+                    _node_value(model, 'lat', node))
+                datum_offset = float(datum_field[int(nearest)])
             elif prop.ofs == 'secofs':
                 # Gotta search with lat/lon here...
                 vlonlat = np.around(np.array([vdatums[
@@ -15,6 +15,29 @@ from botocore.exceptions import ClientError
 
 from ofs_skill.obs_retrieval import utils
 
+# Forecast cycle hours and forecast length (hours) per OFS. Anything not
+# listed falls back to _DEFAULT_FCST_CYCLES / _DEFAULT_FCST_LENGTH.
+_FCST_CYCLES = {
+    **dict.fromkeys(('cbofs', 'dbofs', 'gomofs', 'ciofs', 'leofs',
+                     'lmhofs', 'loofs', 'loofs2', 'lsofs', 'tbofs',
+                     'necofs', 'secofs', 'stofs_2d_glo'), (0, 6, 12, 18)),
+    **dict.fromkeys(('creofs', 'ngofs2', 'sfbofs', 'sscofs'),
+                    (3, 9, 15, 21)),
+    **dict.fromkeys(('stofs_3d_atl', 'stofs_3d_pac'), (12,)),
+}
+_DEFAULT_FCST_CYCLES = (3,)
+_FCST_LENGTHS = {
+    **dict.fromkeys(('cbofs', 'ciofs', 'creofs', 'dbofs', 'ngofs2', 'sfbofs',
+                     'tbofs', 'stofs_3d_pac', 'secofs'), 48),
+    **dict.fromkeys(('gomofs', 'wcofs', 'sscofs', 'necofs'), 72),
+    'stofs_3d_atl': 96,
+    'stofs_2d_glo': 180,
+}
+_DEFAULT_FCST_LENGTH = 120
+# OFS groups checked by name below
+_STOFS_3D_OFS = frozenset(('stofs_3d_atl', 'stofs_3d_pac'))
+_NO_S3_FALLBACK_OFS = frozenset(('loofs2', 'secofs'))
+
 
 def get_s3_bucket(ofs):
     """Select appropriate S3 bucket config name from OFS.
@@ -29,9 +52,9 @@ def get_s3_bucket(ofs):
     str
         Config key for the S3 bucket URL.
     """
-    if ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
+    if ofs in _STOFS_3D_OFS:
         url_root = 'nodd_s3_stofs3d'
-    elif ofs in ('stofs_2d_glo'):
+    elif ofs == 'stofs_2d_glo':
         url_root = 'nodd_s3_stofs2d'
     else:
         url_root = 'nodd_s3'
@@ -194,36 +217,40 @@ def get_fcst_hours(ofs):
     '''
 
     # Need to know forecast cycle hours (e.g. 00Z) and forecast length (hours)
-    if ofs in (
-        'cbofs', 'dbofs', 'gomofs', 'ciofs', 'leofs',
-        'lmhofs', 'loofs', 'loofs2', 'lsofs', 'tbofs',
-        'necofs', 'secofs', 'stofs_2d_glo'
-    ):
-        fcstcycles = np.array([0, 6, 12, 18])
-    elif ofs in ('creofs', 'ngofs2', 'sfbofs', 'sscofs'):
-        fcstcycles = np.array([3, 9, 15, 21])
-    elif ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
-        fcstcycles = np.array([12])
-    else:
-        fcstcycles = np.array([3])
-    # Now need to know forecast length in hours
-    if ofs in (
-        'cbofs', 'ciofs', 'creofs', 'dbofs', 'ngofs2', 'sfbofs',
-        'tbofs', 'stofs_3d_pac', 'secofs'
-    ):
-        fcstlength = 48
-    elif ofs in ('gomofs', 'wcofs', 'sscofs', 'necofs'):
-        fcstlength = 72
-    elif ofs in ('stofs_3d_atl'):
-        fcstlength = 96
-    elif ofs in ('stofs_2d_glo'):
-        fcstlength = 180
-    else:  # Default / catch-all
-        fcstlength = 120
+    fcstcycles = np.array(_FCST_CYCLES.get(ofs, _DEFAULT_FCST_CYCLES))
+    fcstlength = _FCST_LENGTHS.get(ofs, _DEFAULT_FCST_LENGTH)
 
     return fcstlength, fcstcycles
 
 
+def _nearest_cycle_offset(ofs, hour):
+    """
+    Hours to add to ``hour`` to reach the nearest forecast cycle of an OFS.
+
+    Cycles wrap around midnight, so 23Z moves forward to the next day's
+    00Z and 01Z moves back to the previous day's 21Z. On a tie the earlier
+    cycle wins.
+
+    Parameters
+    ----------
+    ofs : str
+        OFS model name
+    hour : int
+        Requested cycle hour, 0-23
+
+    Returns
+    -------
+    int
+        Signed offset in hours
+    """
+    cycles = list(_FCST_CYCLES.get(ofs, _DEFAULT_FCST_CYCLES))
+    if cycles[0] == 0:
+        cycles.append(24)
+    elif cycles[0] == 3 and len(cycles) > 1:
+        cycles.insert(0, -3)
+    return min((cycle - hour for cycle in cycles), key=abs)
+
+
 def get_fcst_dates(prop, logger):
     """
     Assign forecast cycle and compute end date for forecast runs.
@@ -276,7 +303,7 @@ def get_fcst_dates(prop, logger):
     except (KeyError, FileNotFoundError):
         use_s3_fallback = False
 
-    if prop.ofs in ('loofs2','secofs'):
+    if prop.ofs in _NO_S3_FALLBACK_OFS:
         use_s3_fallback = False
 
     # Define forecast cycle hours for each OFS group
@@ -316,18 +343,9 @@ def get_fcst_dates(prop, logger):
         sdate = sdate + ftime
         sdatetime = datetime.strptime(sdate, '%Y-%m-%dT%H:%M:%SZ')
         if requested_hour not in fcstcycles_str:
-            if fcstcycles[0] == 0:
-                fcstcycles = np.append(fcstcycles, 24)
-                fcstcycles_str.append('00')
-            elif fcstcycles[0] == 3 and len(fcstcycles) > 1:
-                fcstcycles = np.concatenate(([-3], fcstcycles))
-                fcstcycles_str.insert(0, '21')
-            # Find nearest valid cycle hour
-            requested_hour_int = int(requested_hour)
-            dist = np.array([item - requested_hour_int for item in fcstcycles])
-            # Adjust start date to match forecast cycle
-            sdatetime = sdatetime + \
-                timedelta(hours=int(dist[np.nanargmin(np.abs(dist))]))
+            # Adjust start date to match the nearest forecast cycle
+            sdatetime = sdatetime + timedelta(
+                hours=_nearest_cycle_offset(prop.ofs, int(requested_hour)))
             # Display warning
             prop.forecast_hr = sdatetime.strftime('%H')
             logger.warning(
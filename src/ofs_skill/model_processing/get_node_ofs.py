@@ -9,9 +9,9 @@ with the time series
 """
 
 import copy
+import functools
 import logging
 import logging.config
-import math
 import os
 import sys
 import threading
@@ -213,6 +213,48 @@ def find_time_gaps(prop, model, logger):
     return bool(np.any(gaps))
 
 
+# Parsed model ctl files keyed by (path, mtime_ns); see _read_ofs_ctlfile.
+_OFS_CTLFILE_CACHE = {}
+_OFS_CTLFILE_CACHE_LOCK = threading.Lock()
+
+
+def _read_ofs_ctlfile(filename):
+    """Parse a model ctl file into ``(lines, nodes, depths, shifts, ids)``.
+
+    The columns are cast from one string array instead of one array per
+    column. Results are memoized by path and modification time, so the
+    per-variable loop in ``get_node_ofs`` and repeated whichcasts reuse
+    the parse until the file is rewritten.
+    """
+    key = (os.fspath(filename), os.stat(filename).st_mtime_ns)
+    with _OFS_CTLFILE_CACHE_LOCK:
+        cached = _OFS_CTLFILE_CACHE.get(key)
+    if cached is None:
+        with open(filename, encoding='utf-8') as file:
+            lines = [line.split() for line in file.read().split('\n')]
+        table = np.array(lines[:-1])
+        nodes = table[:, 0].astype(np.int64).tolist()
+        depths = table[:, 1].astype(np.int64).tolist()
+        # this is the shift that can be applied to the ofs timeseries,
+        # for instance if there is a known bias in the model
+        shifts = table[:, -1].astype(np.float64).tolist()
+        # This is the station id, of the nearest station to the mesh node
+        ids = table[:, -2].tolist()
+        cached = (lines, nodes, depths, shifts, ids)
+        with _OFS_CTLFILE_CACHE_LOCK:
+            _OFS_CTLFILE_CACHE[key] = cached
+    lines, nodes, depths, shifts, ids = cached
+    return ([list(line) for line in lines], list(nodes), list(depths),
+            list(shifts), list(ids))
+
+
+def _model_ctl_path(prop, name_var):
+    """Path of the model ctl file for ``name_var`` and the run's file type."""
+    suffix = 'model.ctl' if prop.ofsfiletype == 'fields' else \
+        'model_station.ctl'
+    return Path(prop.control_files_path) / f'{prop.ofs}_{name_var}_{suffix}'
+
+
 def ofs_ctlfile_extract(prop, name_var, model, logger):
     """
     The input here is the path, variable name, and logger.
@@ -220,40 +262,13 @@ def ofs_ctlfile_extract(prop, name_var, model, logger):
     it generates it first.
     """
 
-    if prop.ofsfiletype == 'fields':
-        filename = f'{prop.control_files_path}/{prop.ofs}_{name_var}_model.ctl'
-        if (os.path.isfile(filename)) is False and prop.ctl_flag == 0:
-            write_ofs_ctlfile(prop, model, logger)
-            prop.ctl_flag += 1 # Raise flag -- we've gone through ctl file production
-    elif prop.ofsfiletype == 'stations':
-        filename = f'{prop.control_files_path}/{prop.ofs}_{name_var}_model_station.ctl'
-        if (os.path.isfile(filename)) is False and prop.ctl_flag == 0:
-            write_ofs_ctlfile(prop, model, logger)
-            prop.ctl_flag += 1 # Raise flag -- we've gone through ctl file production
+    filename = _model_ctl_path(prop, name_var)
+    if not filename.is_file() and prop.ctl_flag == 0:
+        write_ofs_ctlfile(prop, model, logger)
+        prop.ctl_flag += 1 # Raise flag -- we've gone through ctl file production
 
     try:
-        with open(
-                filename, encoding='utf-8'
-        ) as file:
-            model_ctlfile = file.read()
-            lines = model_ctlfile.split('\n')
-            lines = [i.split(' ') for i in lines]
-            lines = [list(filter(None, i)) for i in lines]
-            nodes = np.array(lines[:-1])[:, 0]
-            nodes = [int(i) for i in nodes]
-            depths = np.array(lines[:-1])[:, 1]
-            depths = [int(i) for i in depths]
-
-            # this is the shift that can be applied to the ofs timeseries,
-            # for instance if there is a known bias in the model
-            shifts = np.array(lines[:-1])[:, -1]
-            shifts = [float(i) for i in shifts]
-
-            # This is the station id, of the nearest station to the mesh node
-            ids = np.array(lines[:-1])[:, -2]
-            ids = [str(i) for i in ids]
-
-            return lines, nodes, depths, shifts, ids
+        return _read_ofs_ctlfile(filename)
     except IndexError:
         logger.warning('%s model ctl file is blank -- no '
                      'model nodes/stations found! Moving on...',
@@ -378,13 +393,41 @@ def _resample_time_vars_only(model, time_name, time_step, logger):
 _BATCH_EXTRACT_TIME_CHUNK = 1000
 
 
+def _station_points(idx_list, dep_list, idx_first):
+    """Order station and layer indices by dim for :func:`_select_points`."""
+    if dep_list is None:
+        return [idx_list]
+    if idx_first:
+        return [idx_list, dep_list]
+    return [dep_list, idx_list]
+
+
+def _select_points(da, point_indices):
+    """Pick points from ``da`` with one vectorized ``isel``.
+
+    ``point_indices`` holds one index sequence per non-time dim of
+    ``da``, in dim order; point ``k`` is ``da[:, p[0][k], p[1][k], ...]``.
+    Returns a lazy ``(time, n_points)`` DataArray.
+    """
+    if len(point_indices) != da.ndim - 1:
+        raise ValueError(
+            f'{da.name} has dims {da.dims}; got {len(point_indices)} '
+            f'point index arrays')
+    indexers = {
+        dim: xr.DataArray(np.asarray(idx, dtype=np.int64), dims='_point')
+        for dim, idx in zip(da.dims[1:], point_indices)
+    }
+    return da.isel(indexers).transpose(da.dims[0], '_point')
+
+
 def _batch_extract(model, var_name, idx_list, dep_list, idx_first=False,
                    logger=None, time_chunk=_BATCH_EXTRACT_TIME_CHUNK):
     """Extract all stations for a variable via batched dask.compute().
 
     The time axis is split into windows of ``time_chunk`` steps. Each
-    window's per-station selections are computed in one ``dask.compute``
-    call; the results are concatenated along time. This bounds peak
+    window picks every station with one vectorized selection and is
+    computed in one ``dask.compute`` call; the results are concatenated
+    along time. This bounds peak
     memory to roughly one window's intermediate-chunk footprint, even on
     long multi-month runs that would otherwise materialize hundreds of
     backing files in a single compute graph.
@@ -420,28 +463,18 @@ def _batch_extract(model, var_name, idx_list, dep_list, idx_first=False,
 
     time_dim = model[var_name].dims[0]
     n_time = int(model[var_name].sizes[time_dim])
+    points = _station_points(idx_list, dep_list, idx_first)
 
     def _select(da, t0, t1):
-        sliced = da.isel({time_dim: slice(t0, t1)})
-        if dep_list is None:
-            return [sliced[:, idx_list[i]] for i in range(n)]
-        if idx_first:
-            return [sliced[:, idx_list[i], dep_list[i]] for i in range(n)]
-        return [sliced[:, dep_list[i], idx_list[i]] for i in range(n)]
+        return _select_points(da.isel({time_dim: slice(t0, t1)}), points)
 
     probe_da = model[var_name]
     has_dask = hasattr(probe_da.data, 'dask')
 
-    # Eager (non-Dask) path: per-station numpy materialization. No need
-    # to chunk; the previous code path also handled this case in one go.
+    # Eager (non-Dask) path: one numpy materialization. No need to
+    # chunk; the previous code path also handled this case in one go.
     if not has_dask:
-        if dep_list is None:
-            lazy = [probe_da[:, idx_list[i]] for i in range(n)]
-        elif idx_first:
-            lazy = [probe_da[:, idx_list[i], dep_list[i]] for i in range(n)]
-        else:
-            lazy = [probe_da[:, dep_list[i], idx_list[i]] for i in range(n)]
-        return np.stack([np.array(s) for s in lazy], axis=1)
+        return np.asarray(_select_points(probe_da, points).values)
 
     # Dask-backed path: window the time axis.
     chunk = max(1, int(time_chunk))
@@ -450,8 +483,8 @@ def _batch_extract(model, var_name, idx_list, dep_list, idx_first=False,
         # implementation exactly when the dataset fits in one window.
         lazy = _select(probe_da, 0, n_time)
         with _BATCH_EXTRACT_LOCK:
-            computed = dask.compute(*[s.data for s in lazy])
-        return np.stack(computed, axis=1)
+            computed, = dask.compute(lazy.data)
+        return np.asarray(computed)
 
     n_chunks = (n_time + chunk - 1) // chunk
     if logger is not None:
@@ -470,8 +503,8 @@ def _batch_extract(model, var_name, idx_list, dep_list, idx_first=False,
         # isn't thread-safe under concurrent reads and 4 simultaneous
         # computes would quadruple peak memory.
         with _BATCH_EXTRACT_LOCK:
-            computed = dask.compute(*[s.data for s in lazy])
-        parts.append(np.stack(computed, axis=1))
+            computed, = dask.compute(lazy.data)
+        parts.append(np.asarray(computed))
         if logger is not None:
             logger.info(
                 'Batch extract %s chunk %d/%d done (timesteps %d:%d)',
@@ -536,42 +569,25 @@ def _batch_extract_multi(model, var_names, idx_list, dep_list, idx_first=False,
                 f'has {model[v].dims[0]}'
             )
 
+    points = _station_points(idx_list, dep_list, idx_first)
+
     def _select_one(da, t0, t1):
-        sliced = da.isel({time_dim: slice(t0, t1)})
-        if dep_list is None:
-            return [sliced[:, idx_list[i]] for i in range(n)]
-        if idx_first:
-            return [sliced[:, idx_list[i], dep_list[i]] for i in range(n)]
-        return [sliced[:, dep_list[i], idx_list[i]] for i in range(n)]
+        return _select_points(da.isel({time_dim: slice(t0, t1)}), points)
 
     has_dask = hasattr(model[probe_var].data, 'dask')
 
     if not has_dask:
-        # Eager path — fall back to per-var per-station numpy.
-        results = []
-        for v in var_names:
-            da = model[v]
-            if dep_list is None:
-                lazy = [da[:, idx_list[i]] for i in range(n)]
-            elif idx_first:
-                lazy = [da[:, idx_list[i], dep_list[i]] for i in range(n)]
-            else:
-                lazy = [da[:, dep_list[i], idx_list[i]] for i in range(n)]
-            results.append(np.stack([np.array(s) for s in lazy], axis=1))
-        return results
+        # Eager path — one numpy materialization per var.
+        return [np.asarray(_select_points(model[v], points).values)
+                for v in var_names]
 
     chunk = max(1, int(time_chunk))
     if n_time <= chunk:
         # Single-window fast path: one fused compute over all vars + stations.
-        per_var_lazy = [_select_one(model[v], 0, n_time) for v in var_names]
-        flat = [s.data for lst in per_var_lazy for s in lst]
+        lazy = [_select_one(model[v], 0, n_time).data for v in var_names]
         with _BATCH_EXTRACT_LOCK:
-            computed = dask.compute(*flat)
-        results = []
-        for vi, _ in enumerate(var_names):
-            start = vi * n
-            results.append(np.stack(computed[start:start + n], axis=1))
-        return results
+            computed = dask.compute(*lazy)
+        return [np.asarray(c) for c in computed]
 
     n_chunks = (n_time + chunk - 1) // chunk
     if logger is not None:
@@ -585,19 +601,17 @@ def _batch_extract_multi(model, var_names, idx_list, dep_list, idx_first=False,
     for ci in range(n_chunks):
         t0 = ci * chunk
         t1 = min(n_time, t0 + chunk)
-        per_var_lazy = [_select_one(model[v], t0, t1) for v in var_names]
-        flat = [s.data for lst in per_var_lazy for s in lst]
+        lazy = [_select_one(model[v], t0, t1).data for v in var_names]
         with _BATCH_EXTRACT_LOCK:
-            computed = dask.compute(*flat)
-        for vi in range(len(var_names)):
-            start = vi * n
-            parts_per_var[vi].append(np.stack(computed[start:start + n], axis=1))
+            computed = dask.compute(*lazy)
+        for vi, part in enumerate(computed):
+            parts_per_var[vi].append(np.asarray(part))
         if logger is not None:
             logger.info(
                 'Batch extract %s chunk %d/%d done (timesteps %d:%d)',
                 '+'.join(var_names), ci + 1, n_chunks, t0, t1,
             )
-        del per_var_lazy, flat, computed
+        del lazy, computed
         gc.collect()
 
     return [np.concatenate(parts, axis=0) for parts in parts_per_var]
@@ -727,82 +741,191 @@ def _precompute_stations_data(prop, model, ofs_ctlfile, model_var, logger):
     return result
 
 
+def _extract_points(model, var_name, point_indices, logger=None,
+                    time_chunk=_BATCH_EXTRACT_TIME_CHUNK):
+    """Extract a ``(time, n_points)`` array with one vectorized selection.
+
+    ``point_indices`` is laid out as for :func:`_select_points`. Unlike
+    :func:`_batch_extract`, the index arrays are not limited to a
+    station and a layer dim, so ROMS ``eta, xi`` pairs work too.
+    Dask-backed data is computed in ``time_chunk`` windows under
+    ``_BATCH_EXTRACT_LOCK``.
+    """
+    import gc
+
+    da = model[var_name]
+    time_dim = da.dims[0]
+    points = _select_points(da, point_indices)
+    if not hasattr(points.data, 'dask'):
+        return np.asarray(points.values)
+
+    n_time = int(da.sizes[time_dim])
+    chunk = max(1, int(time_chunk))
+    parts = []
+    for t0 in range(0, n_time, chunk):
+        t1 = min(n_time, t0 + chunk)
+        with _BATCH_EXTRACT_LOCK:
+            parts.append(np.asarray(
+                points.isel({time_dim: slice(t0, t1)}).values))
+        if logger is not None and n_time > chunk:
+            logger.info('Point extract %s done (timesteps %d:%d of %d)',
+                        var_name, t0, t1, n_time)
+        gc.collect()
+    if not parts:
+        return np.empty((0, len(point_indices[0])))
+    return np.concatenate(parts, axis=0)
+
+
+# Fields-file layouts: time variable, whether the layer index comes
+# before the node index, and the variable name(s) for each model_var.
+_FIELDS_LAYOUTS = {
+    'fvcom': ('time', True, {
+        'zeta': ('zeta',), 'temp': ('temp',), 'salinity': ('salinity',),
+        'currents': ('u', 'v')}),
+    'roms': ('ocean_time', True, {
+        'zeta': ('zeta',), 'temp': ('temp',), 'salinity': ('salt',),
+        'currents': ('u_east', 'v_north')}),
+    'stofs': ('time', False, {
+        'zeta': ('elevation',), 'temp': ('temperature',),
+        'salinity': ('salinity',),
+        'currents': ('horizontalVelX', 'horizontalVelY')}),
+    'secofs': ('time', True, {
+        'zeta': ('zeta',), 'temp': ('temp',), 'salinity': ('salinity',),
+        'currents': ('u', 'v')}),
+    'schism': ('time', True, {'zeta': ('zeta',)}),
+}
+
+
+def _fields_layout(prop, model_var):
+    """Look up ``(time_var, depth_first, var_names)`` in _FIELDS_LAYOUTS."""
+    key = prop.model_source
+    if key == 'schism':
+        for flavour in ('stofs', 'secofs'):
+            if flavour in prop.ofs:
+                key = flavour
+    time_var, depth_first, names = _FIELDS_LAYOUTS.get(key, (None, None, {}))
+    if model_var not in names:
+        raise ValueError(f'No fields layout for {prop.ofs} {model_var}')
+    return time_var, depth_first, names[model_var]
+
+
+def _precompute_fields_data(prop, model, ofs_ctlfile, model_var, logger,
+                            stations=None):
+    """Batch-extract station time series from fields files.
+
+    Fields files are indexed per station by mesh node (ROMS: the node
+    unravelled to ``eta, xi``) and, for 3-D variables, sigma layer. The
+    stations are read with one :func:`_extract_points` call per variable
+    instead of one slice per station. ``stations`` selects ctl file rows
+    (default: all). Returns the same keys as
+    :func:`_precompute_stations_data`, one column per selected station.
+    """
+    time_var, depth_first, var_names = _fields_layout(prop, model_var)
+    rows = slice(None) if stations is None else stations
+    nodes = np.asarray(ofs_ctlfile[1], dtype=np.int64)[rows]
+    depths = np.asarray(ofs_ctlfile[2], dtype=np.int64)[rows]
+    if prop.model_source == 'roms':
+        horizontal = list(np.unravel_index(nodes, np.shape(model['lon_rho'])))
+    else:
+        horizontal = [nodes]
+
+    def _points(var_name):
+        if model[var_name].ndim == 1 + len(horizontal):
+            return horizontal
+        if depth_first:
+            return [depths] + horizontal
+        return horizontal + [depths]
+
+    keys = ('u_data', 'v_data') if model_var == 'currents' else \
+        ('scalar_data',)
+    batch_logger = logger if stations is None else None
+    result = {'model_time': np.array(model[time_var])}
+    for key, var_name in zip(keys, var_names):
+        result[key] = _extract_points(
+            model, var_name, _points(var_name), batch_logger)
+
+    if stations is None:
+        logger.info('Pre-computed fields extraction for %d stations, var=%s',
+                    len(nodes), model_var)
+    return result
+
+
+def _run_day(date_full):
+    """Return the calendar day of an ISO ``date_full`` as a naive datetime."""
+    day = pd.Timestamp(date_full).tz_localize(None).normalize()
+    return day.to_pydatetime()
+
+
+@functools.lru_cache(maxsize=8)
+def _series_window(start_date_full, end_date_full):
+    """Return the ``(start, end)`` strings passed to scalar()/vector().
+
+    The window pads the run's date range by two days on each side. It is
+    the same for every station and variable of a run, so it is computed
+    once per date range instead of once per station.
+    """
+    start_date = (_run_day(start_date_full)
+                  - timedelta(days=2)).strftime('%Y%m%d') + '-01:01:01'
+    end_date = (_run_day(end_date_full)
+                + timedelta(days=2)).strftime('%Y%m%d') + '-01:01:01'
+    return start_date, end_date
+
+
 def format_temp_salt(prop, model, ofs_ctlfile, model_var, i, precomputed=None):
     """
     extract temperature and salinity time series from concatenated model data
     """
 
-    if precomputed is not None and prop.ofsfiletype == 'stations':
+    col = i
+    if precomputed is None and prop.ofsfiletype == 'fields' and \
+            prop.model_source != 'adcirc':
+        precomputed = _precompute_fields_data(
+            prop, model, ofs_ctlfile, model_var, logger, stations=[i])
+        col = 0
+
+    if precomputed is not None:
         model_time = precomputed['model_time']
-        model_obs = precomputed['scalar_data'][:, i].copy()
-        if prop.model_source == 'schism':
+        model_obs = precomputed['scalar_data'][:, col]
+        if prop.model_source == 'schism' and prop.ofsfiletype == 'stations':
             model_obs = _mask_schism_sentinels(
                 model_obs, model_var, ofs_ctlfile[4][i], prop.ofs, logger)
     elif prop.model_source=='fvcom':
-        if prop.ofsfiletype == 'fields':
-            model_time = np.array(model['time'])
-            model_obs = np.array(
-                model[model_var][:, int(ofs_ctlfile[2][i]),
-                                 int(ofs_ctlfile[1][i])]
-            )
-            model_obs = model_obs #+ ofs_ctlfile[3][i]
-        elif prop.ofsfiletype == 'stations':
-            # Dimensions: time x siglay x station
-            model_time = np.array(model['time'])
-            #if int(ofs_ctlfile[1][i]) > -999:
-            model_obs = np.array(
-                model[model_var][:, int(ofs_ctlfile[2][i]),
-                                 int(ofs_ctlfile[1][i])]
-            )
-            model_obs = model_obs #+ ofs_ctlfile[3][i]
-            #else:
-            #    model_obs = None
+        # Dimensions: time x siglay x station
+        model_time = np.asarray(model['time'])
+        #if int(ofs_ctlfile[1][i]) > -999:
+        model_obs = np.asarray(
+            model[model_var][:, int(ofs_ctlfile[2][i]),
+                             int(ofs_ctlfile[1][i])]
+        )
+        model_obs = model_obs #+ ofs_ctlfile[3][i]
+        #else:
+        #    model_obs = None
 
     elif prop.model_source=='roms':
         if model_var=='salinity':
             model_var='salt'
-        if prop.ofsfiletype == 'fields':
-            i_index,j_index = roms_nodes(model, int(ofs_ctlfile[1][i]))
-            model_time = np.array(model['ocean_time'])
-            model_obs = np.array(model[model_var][:, int(ofs_ctlfile[2][i]),
-                                                  i_index,j_index])
-            model_obs = model_obs #+ ofs_ctlfile[3][i]
-        elif prop.ofsfiletype == 'stations':
-            # Dimensions: time x station x s_rho
-            model_time = np.array(model['ocean_time'])
-            #if int(ofs_ctlfile[1][i]) > -999:
-            model_obs = np.array(model[model_var]
-                                 [:, int(ofs_ctlfile[1][i]),
-                                  int(ofs_ctlfile[2][i])])
-            model_obs = model_obs #+ ofs_ctlfile[3][i]
+        # Dimensions: time x station x s_rho
+        model_time = np.asarray(model['ocean_time'])
+        #if int(ofs_ctlfile[1][i]) > -999:
+        model_obs = np.asarray(model[model_var]
+                               [:, int(ofs_ctlfile[1][i]),
+                                int(ofs_ctlfile[2][i])])
+        model_obs = model_obs #+ ofs_ctlfile[3][i]
     elif prop.model_source=='schism':
-        # SECOFS: time x depth x node
-        if prop.ofsfiletype == 'fields':
-            if 'stofs' in prop.ofs:
-               if model_var=='temp':
-                   model_var='temperature'
-               model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i]),
-                                                     int(ofs_ctlfile[2][i])])
-            elif 'secofs' in prop.ofs:
-               model_obs = np.array(model[model_var][:, int(ofs_ctlfile[2][i]),
-                                                     int(ofs_ctlfile[1][i])])
-            model_obs = model_obs
-            model_time = np.array(model['time'])
-        elif prop.ofsfiletype == 'stations':
-            model_time = np.array(model['time'])
-            if 'stofs' in prop.ofs:
-                if model_var=='temp':
-                    model_var = 'temperature'
-                model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i])])
-            elif 'secofs' in prop.ofs:
-                # SECOFS dims: time x siglay x station
-                model_obs = np.array(model[model_var][:, int(ofs_ctlfile[2][i]),
-                                                      int(ofs_ctlfile[1][i])])
-            else:
-                model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i]),
-                                                      int(ofs_ctlfile[2][i])])
-            model_obs = _mask_schism_sentinels(
-                model_obs, model_var, ofs_ctlfile[4][i], prop.ofs, logger)
+        model_time = np.asarray(model['time'])
+        if 'stofs' in prop.ofs:
+            if model_var=='temp':
+                model_var = 'temperature'
+            model_obs = np.asarray(model[model_var][:, int(ofs_ctlfile[1][i])])
+        elif 'secofs' in prop.ofs:
+            # SECOFS dims: time x siglay x station
+            model_obs = np.asarray(model[model_var][:, int(ofs_ctlfile[2][i]),
+                                                    int(ofs_ctlfile[1][i])])
+        else:
+            model_obs = np.asarray(model[model_var][:, int(ofs_ctlfile[1][i]),
+                                                    int(ofs_ctlfile[2][i])])
+        model_obs = _mask_schism_sentinels(
+            model_obs, model_var, ofs_ctlfile[4][i], prop.ofs, logger)
     elif prop.model_source == 'adcirc':
         if prop.ofs == 'stofs_2d_glo':
             # We raise en exception here for STOFS-2D-Global because it does
@@ -810,29 +933,14 @@ def format_temp_salt(prop, model, ofs_ctlfile, model_var, i, precomputed=None):
             # away from calling this function with STOFS-2D-Global.
             raise ValueError('Temperature and salinity data are not available for STOFS-2D-Global.')
 
+    # scalar() copies the rows it keeps, so the columns can be views.
     data_model = pd.DataFrame(
         {'DateTime': model_time,
-         'OBS': model_obs}, columns=['DateTime', 'OBS']
+         'OBS': model_obs}, columns=['DateTime', 'OBS'], copy=False
     )
 
-    start_date = (
-        str(
-            (
-                datetime.strptime(prop.start_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                - timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
-    end_date = (
-        str(
-            (
-                datetime.strptime(prop.end_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                + timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
+    start_date, end_date = _series_window(prop.start_date_full,
+                                          prop.end_date_full)
 
     formatted_series = \
         scalar(data_model, start_date, end_date)
@@ -849,147 +957,66 @@ def format_currents(prop, model, ofs_ctlfile, i, precomputed=None):
     extract current velocity time series from concatenated model data
     """
 
-    if precomputed is not None and prop.ofsfiletype == 'stations':
-        mfp = ModelFormatProperties()
+    col = i
+    if precomputed is None and prop.ofsfiletype == 'fields' and \
+            prop.model_source != 'adcirc':
+        precomputed = _precompute_fields_data(
+            prop, model, ofs_ctlfile, 'currents', logger, stations=[i])
+        col = 0
+
+    mfp = ModelFormatProperties()
+    if precomputed is not None:
         mfp.model_time = precomputed['model_time']
-        u_i = precomputed['u_data'][:, i]
-        v_i = precomputed['v_data'][:, i]
-        if prop.model_source == 'schism':
+        u_i = precomputed['u_data'][:, col]
+        v_i = precomputed['v_data'][:, col]
+        if prop.model_source == 'schism' and prop.ofsfiletype == 'stations':
             station_id = ofs_ctlfile[4][i]
             u_i = _mask_schism_sentinels(
                 u_i, 'currents_uv', station_id, prop.ofs, logger)
             v_i = _mask_schism_sentinels(
                 v_i, 'currents_uv', station_id, prop.ofs, logger)
-        mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-        mfp.model_ang = np.array(
-            [math.atan2(u_i[t], v_i[t]) / math.pi * 180 % 360.0
-             for t in range(len(mfp.model_time))])
     elif prop.model_source=='fvcom':
-        mfp = ModelFormatProperties()
-        mfp.model_time = np.array(model['time'])
-        if prop.ofsfiletype == 'fields':
-            u_i = np.array(
-                model['u'][:, int(ofs_ctlfile[2][i]), int(ofs_ctlfile[1][i])]
+        mfp.model_time = np.asarray(model['time'])
+        #if int(ofs_ctlfile[1][i]) > -999:
+        u_i = np.asarray(
+            model['u'][:, int(ofs_ctlfile[2][i]),
+                       int(ofs_ctlfile[1][i])]
+        )
+        v_i = np.asarray(
+            model['v'][:, int(ofs_ctlfile[2][i]),
+                       int(ofs_ctlfile[1][i])]
+        )
+    elif prop.model_source=='roms':
+        mfp.model_time = np.asarray(model['ocean_time'])
+        # Dimensions: time x station x s_rho
+        u_i = np.asarray(model['u_east'][:, int(ofs_ctlfile[1][i]),
+                                         int(ofs_ctlfile[2][i])])
+        v_i = np.asarray(model['v_north'][:, int(ofs_ctlfile[1][i]),
+                                          int(ofs_ctlfile[2][i])])
+    elif prop.model_source=='schism':
+        mfp.model_time = np.asarray(model['time'])
+        if 'stofs' in prop.ofs:
+            u_i = np.asarray(
+                model['u'][:, int(ofs_ctlfile[1][i])]
             )
-            v_i = np.array(
-                model['v'][:, int(ofs_ctlfile[2][i]), int(ofs_ctlfile[1][i])]
+            v_i = np.asarray(
+                model['v'][:, int(ofs_ctlfile[1][i])]
             )
-
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-
-            mfp.model_ang = np.array(
-            [math.atan2(u_i[t], v_i[t]) / math.pi * 180 % 360.0 for t in range(
-            len(np.array(mfp.model_time)))])
-
-            mfp.model_obs = mfp.model_obs #+ ofs_ctlfile[3][i]
-
-        elif prop.ofsfiletype == 'stations':
-            #if int(ofs_ctlfile[1][i]) > -999:
-            mfp = ModelFormatProperties()
-            mfp.model_time = np.array(model['time'])
-
-            u_i = np.array(
+        else:
+            u_i = np.asarray(
                 model['u'][:, int(ofs_ctlfile[2][i]),
                            int(ofs_ctlfile[1][i])]
             )
-            v_i = np.array(
+            v_i = np.asarray(
                 model['v'][:, int(ofs_ctlfile[2][i]),
                            int(ofs_ctlfile[1][i])]
             )
 
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-
-            mfp.model_ang = np.array(
-                [math.atan2(u_i[t], v_i[t]) / math.pi * \
-                 180 % 360.0 for t in range(
-                    len(np.array(mfp.model_time)))])
-
-            mfp.model_obs = mfp.model_obs #+ ofs_ctlfile[3][i]
-
-    elif prop.model_source=='roms':
-        mfp = ModelFormatProperties()
-        mfp.model_time = np.array(model['ocean_time'])
-        if prop.ofsfiletype == 'fields':
-            i_index,j_index = roms_nodes(model, int(ofs_ctlfile[1][i]))
-            u_i = np.array(model['u_east'][:, int(ofs_ctlfile[2][i]),
-                                           i_index,j_index])
-            v_i = np.array(model['v_north'][:, int(ofs_ctlfile[2][i]),
-                                            i_index,j_index])
-
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-            mfp.model_ang = np.array(
-                [math.atan2(u_i[t], v_i[t]) / math.pi * \
-                 180 % 360.0 for t in range(
-                    len(np.array(mfp.model_time)))])
-
-            mfp.model_obs = mfp.model_obs #+ ofs_ctlfile[3][i]
-        elif prop.ofsfiletype == 'stations':
-            # Dimensions: time x station x s_rho
-            u_i = np.array(model['u_east'][:, int(ofs_ctlfile[1][i]),
-                                           int(ofs_ctlfile[2][i])])
-            v_i = np.array(model['v_north'][:, int(ofs_ctlfile[1][i]),
-                                            int(ofs_ctlfile[2][i])])
-
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-            mfp.model_ang = np.array(
-                [math.atan2(u_i[t], v_i[t]) / math.pi * \
-                 180 % 360.0 for t in range(
-                    len(np.array(mfp.model_time)))])
-
-            mfp.model_obs = mfp.model_obs #+ ofs_ctlfile[3][i]
-
-    elif prop.model_source=='schism':
-        mfp = ModelFormatProperties()
-        mfp.model_time = np.array(model['time'])
-        if prop.ofsfiletype == 'fields':
-            if 'stofs' in prop.ofs:
-                u_i = np.array(
-                    model['horizontalVelX'][:, int(ofs_ctlfile[1][i]), int(ofs_ctlfile[2][i])]
-                )
-                v_i = np.array(
-                    model['horizontalVelY'][:, int(ofs_ctlfile[1][i]), int(ofs_ctlfile[2][i])]
-                )
-            elif prop.ofs in ['secofs']:
-                u_i = np.array(
-                    model['u'][:, int(ofs_ctlfile[2][i]), int(ofs_ctlfile[1][i])]
-                )
-                v_i = np.array(
-                    model['v'][:, int(ofs_ctlfile[2][i]), int(ofs_ctlfile[1][i])]
-                )
-
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-            mfp.model_ang = np.array(
-            [math.atan2(u_i[t], v_i[t]) / math.pi * 180 % 360.0 for t in range(
-            len(np.array(mfp.model_time)))])
-            mfp.model_obs = mfp.model_obs #+ ofs_ctlfile[3][i]
-        elif prop.ofsfiletype == 'stations':
-            if 'stofs' in prop.ofs:
-                u_i = np.array(
-                    model['u'][:, int(ofs_ctlfile[1][i])]
-                )
-                v_i = np.array(
-                    model['v'][:, int(ofs_ctlfile[1][i])]
-                )
-            else:
-                u_i = np.array(
-                    model['u'][:, int(ofs_ctlfile[2][i]),
-                               int(ofs_ctlfile[1][i])]
-                )
-                v_i = np.array(
-                    model['v'][:, int(ofs_ctlfile[2][i]),
-                               int(ofs_ctlfile[1][i])]
-                )
-
-            station_id = ofs_ctlfile[4][i]
-            u_i = _mask_schism_sentinels(
-                u_i, 'currents_uv', station_id, prop.ofs, logger)
-            v_i = _mask_schism_sentinels(
-                v_i, 'currents_uv', station_id, prop.ofs, logger)
-            mfp.model_obs = np.array(u_i**2 + v_i**2) ** 0.5
-            mfp.model_ang = np.array(
-                [math.atan2(u_i[t], v_i[t]) / math.pi * \
-                 180 % 360.0 for t in range(
-                    len(np.array(mfp.model_time)))])
+        station_id = ofs_ctlfile[4][i]
+        u_i = _mask_schism_sentinels(
+            u_i, 'currents_uv', station_id, prop.ofs, logger)
+        v_i = _mask_schism_sentinels(
+            v_i, 'currents_uv', station_id, prop.ofs, logger)
     elif prop.model_source == 'adcirc':
         if prop.ofs == 'stofs_2d_glo':
             # We raise en exception here for STOFS-2D-Global because it does
@@ -997,31 +1024,18 @@ def format_currents(prop, model, ofs_ctlfile, i, precomputed=None):
             # away from calling this function with STOFS-2D-Global.
             raise ValueError('Current data are not available for STOFS-2D-Global.')
 
+    mfp.model_obs = np.hypot(u_i, v_i)
+    mfp.model_ang = np.mod(np.degrees(np.arctan2(u_i, v_i)), 360.0)
+
     mfp.data_model = pd.DataFrame(
         {'DateTime': mfp.model_time,
          'DIR': mfp.model_ang,
          'OBS': mfp.model_obs},
-        columns=['DateTime', 'DIR', 'OBS'],
+        columns=['DateTime', 'DIR', 'OBS'], copy=False,
     )
 
-    start_date = (
-        str(
-            (
-                datetime.strptime(prop.start_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                - timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
-    end_date = (
-        str(
-            (
-                datetime.strptime(prop.end_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                + timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
+    start_date, end_date = _series_window(prop.start_date_full,
+                                          prop.end_date_full)
     formatted_series = \
         vector(mfp.data_model, start_date, end_date)
 
@@ -1045,94 +1059,48 @@ def format_waterlevel(prop, model, ofs_ctlfile, model_var,
         prop, int(ofs_ctlfile[1][i]), model, id_number, logger)
     logger.info(f'Datum offset for station {id_number} (node {ofs_ctlfile[1][i]}): {datum_offset}')
 
-    if precomputed is not None and prop.ofsfiletype == 'stations':
+    col = i
+    if precomputed is None and prop.ofsfiletype == 'fields' and \
+            prop.model_source != 'adcirc':
+        precomputed = _precompute_fields_data(
+            prop, model, ofs_ctlfile, model_var, logger, stations=[i])
+        col = 0
+
+    if precomputed is not None:
         model_time = precomputed['model_time']
-        model_obs = precomputed['scalar_data'][:, i].copy()
-        if prop.model_source == 'schism':
-            if datum_offset > -999 and datum_offset < 999:
-                sign = 1 if 'stofs' in prop.ofs else -1
-                model_obs = model_obs + sign * datum_offset
-        else:
-            if datum_offset > -999:
-                model_obs = model_obs - datum_offset
-    elif prop.model_source=='fvcom':
-        if prop.ofsfiletype == 'fields':
-            model_time = np.array(model['time'])
-            model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i])])
-            if datum_offset > -999:
-                model_obs = model_obs - datum_offset
-        elif prop.ofsfiletype == 'stations':
-            model_time = np.array(model['time'])
-            #if int(ofs_ctlfile[1][i]) > -999:
-            model_obs = np.array(model[model_var][:,
-                                                  int(ofs_ctlfile[1][i])])
-            if datum_offset > -999:
-                model_obs = model_obs - datum_offset
-            #else:
-            #    model_obs = None
-    elif prop.model_source=='roms':
-        if prop.ofsfiletype == 'fields':
-            i_index,j_index = roms_nodes(model, int(ofs_ctlfile[1][i]))
-            model_time = np.array(model['ocean_time'])
-            model_obs = np.array(model[model_var][:, i_index,j_index])
-            if datum_offset > -999:
-                model_obs = model_obs - datum_offset
-        elif prop.ofsfiletype == 'stations':
-            # Dimensions: time x stations
-            #i_index = roms_station_nodes(model, int(ofs_ctlfile[1][i]))
-            model_time = np.array(model['ocean_time'])
-            #if int(ofs_ctlfile[1][i]) > -999:
-            model_obs = np.array(model[model_var][:,
-                                                  int(ofs_ctlfile[1][i])])
-            if datum_offset > -999:
-                model_obs = model_obs - datum_offset
-            #else:
-            #    model_obs = None
-    elif prop.model_source=='schism':
+        model_obs = precomputed['scalar_data'][:, col]
+    else:
+        # Dimensions: time x stations
+        time_var = 'ocean_time' if prop.model_source == 'roms' else 'time'
+        model_time = np.asarray(model[time_var])
+        model_obs = np.asarray(model[model_var][:, int(ofs_ctlfile[1][i])])
+
+    # Fold the ctl shift and datum offset into one scalar so the series
+    # is shifted with a single array operation. model_obs may be a view
+    # of the batch or of the dataset, so it is never modified in place.
+    shift = 0.0
+    if prop.model_source == 'schism':
         if prop.ofsfiletype == 'fields':
-            if model_var=='zeta' and 'stofs' in prop.ofs:
-               model_var='elevation' # Using out2d files
-            model_time = np.array(model['time'])
-            model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i])])
-            model_obs = model_obs + ofs_ctlfile[3][i]
-            if datum_offset > -999 and datum_offset < 999:
-                sign = 1 if 'stofs' in prop.ofs else -1
-                model_obs = model_obs + sign * datum_offset
-        elif prop.ofsfiletype == 'stations':
-            model_time = np.array(model['time'])
-            model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i])])
-            if datum_offset > -999 and datum_offset < 999:
-                sign = 1 if 'stofs' in prop.ofs else -1
-                model_obs = model_obs + sign * datum_offset
-    elif prop.model_source =='adcirc':
-        model_time = np.array(model['time'])
-        model_obs = np.array(model[model_var][:, int(ofs_ctlfile[1][i])])
+            shift += ofs_ctlfile[3][i]
+        if datum_offset > -999 and datum_offset < 999:
+            sign = 1 if 'stofs' in prop.ofs else -1
+            shift += sign * datum_offset
+    elif prop.model_source == 'adcirc':
         if datum_offset > -999 and datum_offset < 999:
-            model_obs = model_obs - datum_offset
+            shift -= datum_offset
+    elif datum_offset > -999:
+        shift -= datum_offset
+    if shift:
+        model_obs = model_obs + shift
 
+    # scalar() copies the rows it keeps, so the columns can be views.
     data_model = pd.DataFrame(
         {'DateTime': model_time,
-         'OBS': model_obs}, columns=['DateTime', 'OBS']
+         'OBS': model_obs}, columns=['DateTime', 'OBS'], copy=False
     )
 
-    start_date = (
-        str(
-            (
-                datetime.strptime(prop.start_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                - timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
-    end_date = (
-        str(
-            (
-                datetime.strptime(prop.end_date_full.split('T')[0].replace('-', ''), '%Y%m%d')
-                + timedelta(days=2)
-            ).strftime('%Y%m%d')
-        )
-        + '-01:01:01'
-    )
+    start_date, end_date = _series_window(prop.start_date_full,
+                                          prop.end_date_full)
 
     formatted_series = \
         scalar(data_model, start_date, end_date)
@@ -1331,6 +1299,17 @@ def read_custom_filenames(filepath):
     return lines
 
 
+def _prd_path(prop, ofs_ctlfile, name_var, i, tag):
+    """Path of station ``i``'s .prd file.
+
+    ``tag`` is the whichcast part of the name, e.g. ``'nowcast'`` or
+    ``'forecast_a_06z'`` for a forecast_a cycle.
+    """
+    return Path(prop.data_model_1d_node_path) / (
+        f'{ofs_ctlfile[4][i]}_{prop.ofs}_{name_var}_{ofs_ctlfile[1][i]}_'
+        f'{tag}_{prop.ofsfiletype}_model.prd')
+
+
 def _all_prd_files_complete(prop_local, ofs_ctlfile, name_var,
                             expected_timesteps, logger):
     """Return ``True`` iff every per-station ``.prd`` file for this
@@ -1352,26 +1331,11 @@ def _all_prd_files_complete(prop_local, ofs_ctlfile, name_var,
     if n_stations == 0:
         return False
 
-    def _prd_path(idx):
-        if prop_local.whichcast == 'forecast_a':
-            return (
-                f'{prop_local.data_model_1d_node_path}/'
-                f'{ofs_ctlfile[4][idx]}_{prop_local.ofs}_'
-                f'{name_var}_{ofs_ctlfile[1][idx]}_'
-                f'{prop_local.whichcast}_'
-                f'{prop_local.forecast_hr}_'
-                f'{prop_local.ofsfiletype}_model.prd'
-            )
-        return (
-            f'{prop_local.data_model_1d_node_path}/'
-            f'{ofs_ctlfile[4][idx]}_{prop_local.ofs}_'
-            f'{name_var}_{ofs_ctlfile[1][idx]}_'
-            f'{prop_local.whichcast}_'
-            f'{prop_local.ofsfiletype}_model.prd'
-        )
-
+    tag = prop_local.whichcast
+    if tag == 'forecast_a':
+        tag = f'{tag}_{prop_local.forecast_hr}'
     for i in range(n_stations):
-        path = _prd_path(i)
+        path = _prd_path(prop_local, ofs_ctlfile, name_var, i, tag)
         if not os.path.isfile(path) or os.path.getsize(path) == 0:
             return False
         if expected_timesteps is None:
@@ -1398,7 +1362,7 @@ def _all_prd_files_complete(prop_local, ofs_ctlfile, name_var,
     return True
 
 
-def get_node_ofs(prop, logger, model_dataset=None):
+def get_node_ofs(prop, logger, model_dataset=None, horizon_frames=None):
     """
     This is the final model 1d extraction function, it opens the path and looks
      for the model ctl file,
@@ -1413,6 +1377,11 @@ def get_node_ofs(prop, logger, model_dataset=None):
     model_dataset : xarray.Dataset or None
         Pre-loaded model dataset. When provided, skips the expensive
         intake_model() call and reuses this dataset instead.
+    horizon_frames : dict or None
+        Horizon skill only. When provided, each station's model cycle
+        series is appended to ``horizon_frames[csv_path]`` as a
+        ``(datecycle, df)`` tuple instead of being merged into the horizon
+        CSV on disk, so the caller can write every CSV once.
 
     Returns
     -------
@@ -1477,18 +1446,12 @@ def get_node_ofs(prop, logger, model_dataset=None):
     os.makedirs(prop.plotly_maps, exist_ok=True)
 
     # Reformat start & end dates
-    # Convert ISO format to internal format for processing
     # Use local variables to avoid modifying prop permanently
-    start_date_internal = prop.start_date_full.replace('-', '').replace('Z', '').replace('T', '-')
-    end_date_internal = prop.end_date_full.replace('-', '').replace('Z', '').replace('T', '-')
-
     try:
-        prop.startdate = (datetime.strptime(
-            start_date_internal.split('-')[0], '%Y%m%d')).strftime(
-            '%Y%m%d') + '00'
-        prop.enddate = (datetime.strptime(
-            end_date_internal.split('-')[0], '%Y%m%d')).strftime(
-            '%Y%m%d') + '23'
+        start_day = _run_day(prop.start_date_full)
+        end_day = _run_day(prop.end_date_full)
+        prop.startdate = start_day.strftime('%Y%m%d') + '00'
+        prop.enddate = end_day.strftime('%Y%m%d') + '23'
     except Exception as e:
         logger.error(f'Problem with date format in get_node_ofs: {e}')
         raise SystemExit(1)
@@ -1522,10 +1485,7 @@ def get_node_ofs(prop, logger, model_dataset=None):
         if use_custom_files:
             # Check if dates of loaded model data overlap with user-input dates
             try:
-                date_overlap = has_date_overlap(datetime.strptime(
-                    start_date_internal.split('-')[0], '%Y%m%d'),
-                    datetime.strptime(end_date_internal.split('-')[0], '%Y%m%d'),
-                    model)
+                date_overlap = has_date_overlap(start_day, end_day, model)
                 if not date_overlap:
                     logger.error('The date range of the loaded model files '
                                  'does not overlap with the start and end '
@@ -1612,14 +1572,17 @@ def get_node_ofs(prop, logger, model_dataset=None):
         try:
             name_conventions = name_convent(variable)
             if not prop_local.user_input_location:
-                control_file = f'{prop_local.control_files_path}/{prop_local.ofs}_' \
-                               f'{name_conventions[0]}_station.ctl'
-                if os.path.isfile(control_file) is False:
+                control_file = (Path(prop_local.control_files_path) /
+                                f'{prop_local.ofs}_{name_conventions[0]}'
+                                f'_station.ctl')
+                try:
+                    control_size = control_file.stat().st_size
+                except FileNotFoundError:
                     logger.info('%s is not found. If not providing a custom XY '
                                 'input file, then an observation control file '
                                 'must be present! Exiting...', control_file)
                     sys.exit()
-                if os.path.getsize(control_file): # Gets size of obs ctl file!
+                if control_size: # Size of obs ctl file!
                     ofs_ctlfile = ofs_ctlfile_extract(
                         prop_local, name_conventions[0], model, logger)
                     if ofs_ctlfile is None:
@@ -1676,18 +1639,32 @@ def get_node_ofs(prop, logger, model_dataset=None):
                     )
                     return
 
-            # Batch-extract all station data if using stations files
+            # Batch-extract all station data up front
             precomputed = None
-            if prop_local.ofsfiletype == 'stations':
-                try:
+            try:
+                if prop_local.ofsfiletype == 'stations':
                     precomputed = _precompute_stations_data(
                         prop_local, model, ofs_ctlfile,
                         name_conventions[-1], logger)
-                except Exception as ex:
-                    logger.warning(
-                        'Batch precomputation failed, falling back to '
-                        'per-station extraction: %s', ex)
-                    precomputed = None
+                elif prop_local.ofsfiletype == 'fields':
+                    precomputed = _precompute_fields_data(
+                        prop_local, model, ofs_ctlfile,
+                        name_conventions[-1], logger)
+            except Exception as ex:
+                logger.warning(
+                    'Batch precomputation failed, falling back to '
+                    'per-station extraction: %s', ex)
+                precomputed = None
+
+            # Horizon skill only pairs cycles that have forecast_b .prd
+            # files; list the directory once instead of a stat per station.
+            prd_on_disk = set()
+            if prop_local.horizonskill:
+                try:
+                    prd_on_disk = set(
+                        os.listdir(prop_local.data_model_1d_node_path))
+                except FileNotFoundError:
+                    pass
 
             def _process_single_station(i, ofs_ctlfile, prop_local, model,
                                         name_conventions, precomputed,
@@ -1727,37 +1704,16 @@ def get_node_ofs(prop, logger, model_dataset=None):
 
                 if (prop_local.whichcast == 'forecast_a' and
                     not prop_local.horizonskill):
-                    with open(
-                        r''
-                        + f'{prop_local.data_model_1d_node_path}'
-                          f'/{ofs_ctlfile[4][i]}_'
-                          f'{prop_local.ofs}_{name_conventions[0]}_'
-                          f'{ofs_ctlfile[1][i]}_'
-                          f'{prop_local.whichcast}_{prop_local.forecast_hr}_'
-                          f'{prop_local.ofsfiletype}_model.prd',
-                        'w',
-                        encoding='utf-8',
-                    ) as output:
-                        for line in formatted_series:
-                            output.write(str(line) + '\n')
-                        logger.info(
-                            '%s/%s_%s_%s_%s_%s_%s_%s_model.prd created '
-                            'successfully',
-                            prop_local.data_model_1d_node_path,
-                            ofs_ctlfile[4][i],
-                            prop_local.ofs,
-                            name_conventions[0],
-                            ofs_ctlfile[1][i],
-                            prop_local.whichcast,
-                            prop_local.forecast_hr,
-                            prop_local.ofsfiletype
-                        )
-                elif (prop_local.horizonskill and os.path.isfile(
-                        f'{prop_local.data_model_1d_node_path}/'
-                        f'{ofs_ctlfile[-1][i]}_{prop_local.ofs}_{name_conventions[0]}_'
-                        f'{ofs_ctlfile[1][i]}_forecast_b_{prop_local.ofsfiletype}_'
-                        f'model.prd'
-                    ) is True):
+                    prd_path = _prd_path(
+                        prop_local, ofs_ctlfile, name_conventions[0], i,
+                        f'{prop_local.whichcast}_{prop_local.forecast_hr}')
+                    prd_path.write_text(
+                        ''.join(f'{line}\n' for line in formatted_series),
+                        encoding='utf-8')
+                    logger.info('%s created successfully', prd_path)
+                elif (prop_local.horizonskill and _prd_path(
+                        prop_local, ofs_ctlfile, name_conventions[0], i,
+                        'forecast_b').name in prd_on_disk):
                     datecycle = prop_local.start_date_full.split('T')[0].replace('-', '') + \
                         '-' + prop_local.forecast_hr + '-' + 'forecast'
                     try:
@@ -1771,6 +1727,11 @@ def get_node_ofs(prop, logger, model_dataset=None):
                     f'{name_conventions[0]}_fcst_horizons.csv')
                     filepath = os.path.join(prop_local.data_horizon_1d_node_path,
                                  filename)
+                    if horizon_frames is not None:
+                        # Caller merges and writes all cycles at once
+                        horizon_frames.setdefault(filepath, []).append(
+                            (datecycle, df))
+                        return (datum_offset, model_station)
                     if os.path.isfile(filepath):
                         try:
                             df = do_horizon_skill_utils.pandas_merge(filepath, df,
@@ -1790,27 +1751,13 @@ def get_node_ofs(prop, logger, model_dataset=None):
                                      'Error: %s', e_x)
                         return (datum_offset, model_station)
                 else:
-                    with open(
-                        r''
-                        +f'{prop_local.data_model_1d_node_path}/{ofs_ctlfile[4][i]}_'
-                          f'{prop_local.ofs}_'
-                          f'{name_conventions[0]}_{ofs_ctlfile[1][i]}'
-                          f'_{prop_local.whichcast}_{prop_local.ofsfiletype}_model.prd',
-                        'w',
-                        encoding='utf-8',
-                    ) as output:
-                        for line in formatted_series:
-                            output.write(str(line) + '\n')
-                        logger.info(
-                            '%s/%s_%s_%s_%s_%s_%s_model.prd created successfully',
-                            prop_local.data_model_1d_node_path,
-                            ofs_ctlfile[4][i],
-                            prop_local.ofs,
-                            name_conventions[0],
-                            ofs_ctlfile[1][i],
-                            prop_local.whichcast,
-                            prop_local.ofsfiletype
-                        )
+                    prd_path = _prd_path(prop_local, ofs_ctlfile,
+                                         name_conventions[0], i,
+                                         prop_local.whichcast)
+                    prd_path.write_text(
+                        ''.join(f'{line}\n' for line in formatted_series),
+                        encoding='utf-8')
+                    logger.info('%s created successfully', prd_path)
 
                 return (datum_offset, model_station)
 
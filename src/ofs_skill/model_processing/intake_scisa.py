@@ -48,6 +48,7 @@ from typing import Any
 
 import intake
 import numpy as np
+import pandas as pd
 import xarray as xr
 
 from ofs_skill.model_processing.get_fcst_cycle import get_fcst_hours
@@ -118,6 +119,34 @@ def preprocess_with_filename(ds):
         filename = 'unknown'
     return ds.assign_coords(filename=filename)
 
+
+def _load_coords(ds: xr.Dataset) -> xr.Dataset:
+    """Eagerly load every coordinate of a lazily opened dataset.
+
+    Combining lazily opened files re-reads non-concatenated coords from
+    the backing store once per file, serially. Loading them up front
+    means each file's coords are read exactly once.
+    """
+    for coord in ds.coords.values():
+        coord.load()
+    return ds
+
+
+def _drop_duplicate_times(ds: xr.Dataset, time_name: str,
+                          keep: str) -> xr.Dataset:
+    """Drop repeated time steps, keeping the first or last of each.
+
+    Same result as ``ds.drop_duplicates(dim=time_name, keep=keep)``, but
+    finds the duplicates on a pandas index of the time values and selects
+    the rest with one positional ``isel``. Returns ``ds`` untouched when
+    there is nothing to drop.
+    """
+    duplicated = pd.Index(ds[time_name].values).duplicated(keep=keep)
+    if not duplicated.any():
+        return ds
+    return ds.isel({time_name: np.flatnonzero(~duplicated)})
+
+
 def intake_model(file_list: list[str], prop: Any, logger: Logger) -> xr.Dataset:
     """
     Create a catalog and lazily load model files using Intake and Dask.
@@ -470,9 +499,9 @@ def intake_model(file_list: list[str], prop: Any, logger: Logger) -> xr.Dataset:
                      'or confirm which engine your custom filenames require.')
         raise SystemExit
     if prop.ofsfiletype == 'stations' and prop.whichcast != 'forecast_a':
-        ds = ds.drop_duplicates(dim=time_name, keep='last')
+        ds = _drop_duplicate_times(ds, time_name, keep='last')
     elif prop.ofsfiletype == 'stations' and prop.whichcast == 'forecast_a':
-        ds = ds.drop_duplicates(dim=time_name, keep='first')
+        ds = _drop_duplicate_times(ds, time_name, keep='first')
 
     # forecast_b stacks overlapping cycles in filename order, so the time
     # axis can be non-monotonic after dedup. Downstream resample() requires
@@ -1024,6 +1053,9 @@ def remove_extra_stations(engine: str,
     2. For each file, removes stations not in the reference set
     3. Combines all files with consistent dimensions
 
+    Files are opened and trimmed in a thread pool (up to 8 workers), and
+    the trimmed files are combined along time in one call.
+
     Parameters
     ----------
     engine : str
@@ -1060,7 +1092,7 @@ def remove_extra_stations(engine: str,
     --------
     >>> ds = remove_extra_stations(engine, urlpaths, dim_ref,
     ...                            drop_variables, time_name, logger)
-    INFO:root:Looping through each stations file, applying corrections...
+    INFO:root:Looping through each stations file, applying corrections (max_workers=8)...
     INFO:root:Done with corrections loop! Files are combined.
     """
 
@@ -1078,9 +1110,9 @@ def remove_extra_stations(engine: str,
         lat_key = 'lat_rho'
 
     reflat = np.array(refds[lat_key])
-    # Now loop through datasets. Check for and remove extra stations.
-    logger.info('Looping through each stations file, applying corrections...')
-    for _i, file in enumerate(urlpaths):
+    # Open one file, check for and remove extra stations. Run per file
+    # in the thread pool below.
+    def _trim_file(file):
         tempsource = intake.open_netcdf(
             urlpath=[file,file],
             xarray_kwargs={
@@ -1095,7 +1127,7 @@ def remove_extra_stations(engine: str,
         )
 
         tempds = tempsource.read()
-        tempds = tempds.drop_duplicates(dim=time_name, keep='first')
+        tempds = _drop_duplicate_times(tempds, time_name, keep='first')
         latcheck = np.isin(np.array(tempds[lat_key]), reflat, invert=True)
         latcheck_1 = np.where(latcheck)[0]
         try:
@@ -1109,24 +1141,37 @@ def remove_extra_stations(engine: str,
                 logger.error('Unable to trim extra stations to make array '
                              'dimensions consistent! Must exit...')
                 raise SystemExit(-1)
+        return _load_coords(tempds)
 
-        # If compatible, then combine datasets
-        if file == urlpaths[0]:
-            ds = tempds
-        elif file != urlpaths[0]:
-            try:
-                ds = xr.combine_nested(
-                    [ds, tempds],
-                    concat_dim=time_name,
-                    data_vars='minimal',
-                )
-            except ValueError as e_x:
-                logger.error(f'Station dims are inconsistent! {e_x}')
-                logger.info('Check intake_scisa.py.')
-                raise SystemExit(-1) from e_x
-            except Exception as e:
-                logger.error('Error when combining trimmed station netcdfs! '
-                             'Error: %s', e)
-                raise SystemExit(-1) from e
+    # Opening is latency-bound on network storage, so overlap the per-file
+    # reads. executor.map preserves urlpaths order for the time concat.
+    max_workers = min(len(urlpaths), 8)
+    logger.info('Looping through each stations file, applying corrections '
+                '(max_workers=%d)...', max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        trimmed = list(executor.map(_trim_file, urlpaths))
+
+    # Combine all trimmed files in one pass. Chaining pairwise combines
+    # re-walked the growing dataset once per file (quadratic in the file
+    # count). coords/compat are pinned to the legacy defaults on purpose
+    # (xarray plans to change them): the per-file scalar 'filename' coord
+    # must become a per-timestep coord, and conflicting static vars must
+    # still raise.
+    try:
+        ds = xr.combine_nested(
+            trimmed,
+            concat_dim=time_name,
+            data_vars='minimal',
+            coords='different',
+            compat='no_conflicts',
+        )
+    except ValueError as e_x:
+        logger.error(f'Station dims are inconsistent! {e_x}')
+        logger.info('Check intake_scisa.py.')
+        raise SystemExit(-1) from e_x
+    except Exception as e:
+        logger.error('Error when combining trimmed station netcdfs! '
+                     'Error: %s', e)
+        raise SystemExit(-1) from e
     logger.info('Done with corrections loop! Files are combined.')
     return ds
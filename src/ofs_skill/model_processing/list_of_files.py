@@ -184,7 +184,7 @@ def dates_range(start_date: str, end_date: str, ofs: str, whichcast: str, logger
             last_date = end_d
     # For STOFS-2D, we need to look a day ahead for nowcast, but
     # don't need to look an extra day behind for forecasts.
-    elif ofs in ('stofs_2d_glo'):
+    elif ofs == 'stofs_2d_glo':
         if whichcast == 'nowcast':
             first_date = start_d
             last_date = end_d + timedelta(days=1)
@@ -371,7 +371,7 @@ def construct_expected_files(prop: Any, dir_path: str, logger: Logger) -> list[s
             for cycle in fcstcycles:
                 if prop.ofs in ('stofs_3d_atl', 'stofs_3d_pac'):
                     filename = f'{prop.ofs}.t{cycle}z.points.cwl.temp.salt.vel.nc'
-                elif prop.ofs in ('stofs_2d_glo'):
+                elif prop.ofs == 'stofs_2d_glo':
                     filename = f'{prop.ofs}.t{cycle}z.points.cwl.nc'
                 else:
                     if date_obj >= datechange:
@@ -413,7 +413,7 @@ def construct_expected_files(prop: Any, dir_path: str, logger: Logger) -> list[s
                             filepath = f'{dir_path}//{filename}'
                             files.append(filepath)
 
-            elif prop.ofs in ('stofs_2d_glo'):
+            elif prop.ofs == 'stofs_2d_glo':
                 for cycle in fcstcycles:
                     # For now we're just doing the combined water level ("cwl").
                     files.append(f'{dir_path}//{prop.ofs}.t{cycle}z.fields.cwl.nc')
@@ -459,6 +459,30 @@ def construct_expected_files(prop: Any, dir_path: str, logger: Logger) -> list[s
     return files
 
 
+def _dir_has_entries(path: str) -> bool:
+    """
+    Check whether a path is a directory with at least one entry.
+
+    Stops at the first entry instead of listing the whole directory, which
+    matters for month directories holding thousands of model files.
+
+    Parameters
+    ----------
+    path : str
+        Directory to check
+
+    Returns
+    -------
+    bool
+        True if ``path`` is a readable directory that is not empty
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
 def list_of_dir(prop: Any, logger: Logger) -> list[str]:
     """
     Create a list of directories containing model netCDF files.
@@ -527,6 +551,9 @@ def list_of_dir(prop: Any, logger: Logger) -> list[str]:
     # a dir list that might have two different formats.
     datethreshold = datetime.strptime('12/31/24', '%m/%d/%y')
     logger.info('Starting model output directory search...')
+    # Every date in a month maps to the same old-style {YYYYMM} dir, so
+    # only check each candidate dir once.
+    checked_dirs = set()
 
     for date_index in range(0, dates_len):
         year = datetime.strptime(dates[date_index], '%m/%d/%y').year
@@ -547,12 +574,16 @@ def list_of_dir(prop: Any, logger: Logger) -> list[str]:
                 logger.error("Check the date -- can't find model output dir!")
                 raise SystemExit(-1)
 
+        if model_dir in checked_dirs:
+            continue
+        checked_dirs.add(model_dir)
+
         # Switch to backup directory if files are not in primary directory
         # (skip entirely if forcing NODD streaming -- model_dir is used only
         # as an S3-URL template downstream)
         if force_nodd_streaming:
             pass
-        elif not os.path.exists(model_dir) or not os.listdir(model_dir):
+        elif not _dir_has_entries(model_dir):
             logger.info(
                 'Model data path ' + model_dir + ' not found, or is empty. ')
 
@@ -577,7 +608,7 @@ def list_of_dir(prop: Any, logger: Logger) -> list[str]:
             backup_model_dir = Path(backup_model_dir).as_posix()
 
             # Check if backup directory exists and has files
-            if os.path.exists(backup_model_dir) and os.listdir(backup_model_dir):
+            if _dir_has_entries(backup_model_dir):
                 logger.info('Found model data in backup dir: %s', backup_model_dir)
                 model_dir = backup_model_dir
             elif use_s3_fallback:
@@ -797,7 +828,7 @@ def list_of_files(prop: Any, dir_list: list[str], logger: Logger) -> list[str]:
                                         ):
                                         files.append(af_name)
                                         hr_cyc_day.append(checkstr1)
-                            elif prop.ofs in ('stofs_2d_glo'):
+                            elif prop.ofs == 'stofs_2d_glo':
                                 # STOFS-2D-Global files each contain the full timeseries,
                                 # so we filter only on:
                                 # (1) station vs fields;
@@ -1010,7 +1041,7 @@ def list_of_files(prop: Any, dir_list: list[str], logger: Logger) -> list[str]:
                                     if (int(checkstr2) - 1 >= int(a_start[-2:])):
                                         files.append(af_name)
                                         hr_cyc_day.append(checkstr1)
-                            elif prop.ofs in ('stofs_2d_glo'):
+                            elif prop.ofs == 'stofs_2d_glo':
                                 # STOFS-2D-Global files each contain the full timeseries,
                                 # so we filter on:
                                 # (1) station vs fields;
@@ -71,7 +71,7 @@ def get_model_source(ofs: str) -> str:
     elif ofs_lower in ('stofs_3d_atl', 'stofs_3d_pac', 'loofs2', 'secofs'):
         return 'schism'
     
-    elif ofs_lower in ('stofs_2d_glo'):
+    elif ofs_lower == 'stofs_2d_glo':
         return 'adcirc'
 
     else:
@@ -79,14 +79,11 @@ def parse_ofs_ctlfile(filename: str) -> tuple[list[list[str]], list[int], list[i
     with open(filename, encoding='utf-8') as file:
         model_ctlfile = file.read()
 
-    # Split into lines and parse
-    raw_lines = model_ctlfile.split('\n')
-    split_lines: list[list[str]] = [line.split(' ') for line in raw_lines]
-    # Remove empty strings from each line
-    split_lines = [list(filter(None, line)) for line in split_lines]
-
-    # Filter out empty lines (which would be empty lists after filtering)
-    lines: list[list[str]] = [line for line in split_lines if line]
+    # Split into lines and fields on runs of whitespace, skipping blank
+    # lines
+    lines: list[list[str]] = [
+        line.split() for line in model_ctlfile.splitlines() if line.strip()
+    ]
 
     # Extract data columns
     lines_array = np.array(lines)
@@ -114,10 +114,9 @@ def ofs_ctlfile_extract(prop, name_var, logger, model_dataset=None):
             with open(ctl_path, encoding='utf-8') as file:
                 read_ofs_ctl_file = file.read()
 
-                lines = read_ofs_ctl_file.split('\n')
-                lines = [x for x in lines if x != '']
-                lines = [i.split(' ') for i in lines]
-                lines = [list(filter(None, i)) for i in lines]
+                lines = [line.split()
+                         for line in read_ofs_ctl_file.splitlines()
+                         if line.strip()]
 
                 nodes = np.array(lines)[:, 0]
                 nodes = [int(i) for i in nodes]
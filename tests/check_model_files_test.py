@@ -0,0 +1,98 @@
+"""Tests for ``check_model_files`` in ``check_model_files.py``.
+
+The start/end dates handed to ``list_of_files`` are parsed once per cast
+instead of rewriting ``prop.start_date_full`` with a chain of string
+replaces. These tests check the parsed dates and that the caller's full
+dates are left untouched, including when files are missing.
+"""
+
+import importlib
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# The package __init__ re-exports the check_model_files *function* under
+# the module's name, so fetch the module itself.
+cmf = importlib.import_module(
+    'ofs_skill.model_processing.check_model_files')
+
+
+@pytest.mark.parametrize('date_full', [
+    '2025-03-04T06:00:00Z', '20250304-06:00:00'])
+def test_full_date_to_day(date_full):
+    assert cmf._full_date_to_day(date_full) == datetime(2025, 3, 4)
+
+
+def test_bad_date_raises_value_error():
+    with pytest.raises(ValueError):
+        cmf._full_date_to_day('2025030406')
+
+
+@pytest.fixture
+def listing(monkeypatch):
+    """Stub the expected and actual file listings; one file is missing."""
+    seen = []
+    monkeypatch.setattr(
+        cmf.get_model_data, 'list_of_dir',
+        lambda prop, path, logger: (['d0', 'd1'], ['03/03/25', '03/04/25']))
+    monkeypatch.setattr(
+        cmf.get_model_data, 'make_file_list',
+        lambda prop, dates, dirs, logger: ['/x/a.nc', '/x/b.nc'])
+    monkeypatch.setattr(cmf, 'list_of_dir', lambda prop, logger: ['/y'])
+
+    def _list_of_files(prop, dir_list, logger):
+        seen.append((prop.startdate, prop.enddate))
+        return ['/y/a.nc']
+
+    monkeypatch.setattr(cmf, 'list_of_files', _list_of_files)
+    return seen
+
+
+def test_dates_parsed_and_prop_left_untouched(listing):
+    prop = SimpleNamespace(ofs='cbofs', whichcasts=['nowcast', 'forecast_b'],
+                           start_date_full='2025-03-04T06:00:00Z',
+                           end_date_full='2025-03-05T18:00:00Z')
+
+    cmf.check_model_files(prop, logging.getLogger(__name__))
+
+    assert listing == [('2025030400', '2025030523')] * 2
+    assert prop.start_date_full == '2025-03-04T06:00:00Z'
+    assert prop.end_date_full == '2025-03-05T18:00:00Z'
+
+
+def test_missing_files_logged_once_in_expected_order(listing, monkeypatch,
+                                                     caplog):
+    monkeypatch.setattr(
+        cmf.get_model_data, 'make_file_list',
+        lambda prop, dates, dirs, logger: [
+            '/x/c.nc', '/x/a.nc', '/x/b.nc', '/x/c.nc'])
+    prop = SimpleNamespace(ofs='cbofs', whichcasts=['nowcast'],
+                           start_date_full='2025-03-04T06:00:00Z',
+                           end_date_full='2025-03-05T18:00:00Z')
+
+    with caplog.at_level(logging.WARNING):
+        cmf.check_model_files(prop, logging.getLogger(__name__))
+
+    missing_logs = [r.getMessage() for r in caplog.records
+                    if 'missing model files' in r.getMessage()]
+    assert len(missing_logs) == 1
+    assert missing_logs[0].endswith('The missing files are: \nc.nc\nb.nc')
+
+
+def test_model_paths_set_from_config(listing):
+    prop = SimpleNamespace(ofs='cbofs', whichcasts=['nowcast'],
+                           start_date_full='2025-03-04T06:00:00Z',
+                           end_date_full='2025-03-05T18:00:00Z')
+
+    cmf.check_model_files(prop, logging.getLogger(__name__))
+
+    dir_params = cmf.utils.Utils().read_config_section(
+        'directories', logging.getLogger(__name__))
+    # Same value the per-cast os.path.join + as_posix used to produce.
+    expected = Path(os.path.join(dir_params['model_historical_dir'], 'cbofs',
+                                 dir_params['netcdf_dir'])).as_posix()
+    assert prop.model_path == prop.model_save_path == expected
@@ -0,0 +1,85 @@
+"""Tests for the per-process datum offset cache in ``get_datum_offset.py``.
+
+``get_datum_offset`` runs for every water level station on every
+``get_node_ofs`` call, which a forecast horizon run makes once per
+cycle. Valid offsets are cached on what they depend on, and error codes
+are recomputed.
+"""
+
+import importlib
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+gdo = importlib.import_module('ofs_skill.model_processing.get_datum_offset')
+
+
+@pytest.fixture(autouse=True)
+def calls(monkeypatch):
+    gdo._DATUM_OFFSET_CACHE.clear()
+    seen = []
+    results = {}
+
+    def _fake(prop, node, model, id_number, logger):
+        seen.append((prop.datum, node, id_number))
+        return results.get(id_number, 0.25)
+
+    monkeypatch.setattr(gdo, '_datum_offset', _fake)
+    yield seen, results
+    gdo._DATUM_OFFSET_CACHE.clear()
+
+
+def _prop(**kwargs):
+    values = dict(ofs='cbofs', ofsfiletype='stations', model_source='roms',
+                  datum='MLLW', start_date_full='2026-01-01T00:00:00Z')
+    values.update(kwargs)
+    return SimpleNamespace(**values)
+
+
+def _offset(prop, node=3, id_number='8575512'):
+    return gdo.get_datum_offset(prop, node, None, id_number,
+                                logging.getLogger('datum_offset_cache_test'))
+
+
+def test_repeat_station_reuses_offset(calls):
+    seen, _ = calls
+    assert _offset(_prop()) == 0.25
+    assert _offset(_prop(start_date_full='2026-01-01T06:00:00Z')) == 0.25
+    assert len(seen) == 1
+
+    _offset(_prop(datum='NAVD88'))
+    _offset(_prop(), node=4)
+    _offset(_prop(ofsfiletype='fields'))
+    assert len(seen) == 4
+
+
+def test_error_codes_not_cached(calls):
+    seen, results = calls
+    results['8575512'] = -9990
+    assert _offset(_prop()) == -9990
+    results['8575512'] = 0.5
+    assert _offset(_prop()) == 0.5
+    assert _offset(_prop()) == 0.5
+    assert len(seen) == 2
+
+
+def test_secofs_keyed_on_model_zero_period(calls):
+    seen, _ = calls
+    prop = _prop(ofs='secofs', model_source='schism')
+    _offset(prop)
+    _offset(_prop(ofs='secofs', model_source='schism',
+                  start_date_full='2026-02-01T00:00:00Z'))
+    assert len(seen) == 1
+    _offset(_prop(ofs='secofs', model_source='schism',
+                  start_date_full='2026-06-01T00:00:00Z'))
+    assert len(seen) == 2
+
+
+def test_secofs_unparsed_start_date_does_not_raise(calls):
+    seen, _ = calls
+    for datum in ('MLLW', 'NAVD88'):
+        assert _offset(_prop(ofs='secofs', model_source='schism',
+                             datum=datum,
+                             start_date_full='2026-01-01T00:00:00')) == 0.25
+    assert len(seen) == 2
@@ -0,0 +1,44 @@
+"""Tests for ``report_datums`` in ``get_datum_offset.py``.
+
+Each model station is matched to its row in the obs ctl file through an
+ID lookup table built once, not a list scan per station. These tests
+check the rows still line up when the model stations come in a different
+order than the ctl file.
+"""
+
+import importlib
+import logging
+from types import SimpleNamespace
+
+import pandas as pd
+
+# The package __init__ re-exports the get_datum_offset *function* under the
+# module's name, so fetch the module itself.
+gdo = importlib.import_module('ofs_skill.model_processing.get_datum_offset')
+
+_CTL = (
+    '8573364 8573364_COOPS "Station A"\n'
+    '  37.0 -76.0 0.0  0.25  MLLW\n'
+    '8575512 8575512_COOPS "Station B"\n'
+    '  38.9 -76.5 0.0  0.05  NAVD88\n'
+    '8577330 8577330_COOPS "Station C"\n'
+    '  38.3 -76.4 0.0  -0.10  MSL\n'
+)
+
+
+def test_report_rows_follow_model_station_order(tmp_path):
+    (tmp_path / 'cbofs_wl_station.ctl').write_text(_CTL)
+    prop = SimpleNamespace(control_files_path=str(tmp_path), ofs='cbofs',
+                           user_input_location=False, datum='MLLW')
+    datum_offsets = [['8577330', '8573364', '8575512'],
+                     [0.111, 0.222, -9999]]
+
+    gdo.report_datums(prop, datum_offsets, logging.getLogger(__name__))
+
+    report = pd.read_csv(tmp_path / 'cbofs_wl_datum_report.csv',
+                         dtype={'Station ID': str})
+    assert list(report['Station ID']) == ['8577330', '8573364', '8575512']
+    assert list(report['Obs source datum']) == ['MSL', 'MLLW', 'NAVD88']
+    assert list(report['Datum conversion pass/fail']) == \
+        ['pass', 'pass', 'fail']
+    assert 'Out of geographic range (model)' in report['Reason for failure'][2]
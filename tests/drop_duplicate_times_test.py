@@ -0,0 +1,42 @@
+"""Tests for ``_drop_duplicate_times`` in ``intake_scisa.py``.
+
+Station time series are de-duplicated on a pandas index and a single
+positional ``isel`` instead of ``Dataset.drop_duplicates``. The result
+must match ``drop_duplicates`` for both ``keep`` modes, including on
+non-monotonic forecast_b style axes.
+"""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ofs_skill.model_processing.intake_scisa import _drop_duplicate_times
+
+
+def _dataset(hours):
+    times = (np.datetime64('2026-01-01T00')
+             + np.asarray(hours) * np.timedelta64(1, 'h'))
+    return xr.Dataset(
+        data_vars={
+            'zeta': (('time', 'station'),
+                     np.arange(len(hours) * 2, dtype=float).reshape(-1, 2)),
+        },
+        coords={'time': times},
+    )
+
+
+@pytest.mark.parametrize('keep', ['first', 'last'])
+@pytest.mark.parametrize('hours', [
+    [0, 1, 1, 2, 3, 3, 3, 4],
+    [0, 1, 2, 1, 2, 3, 0],
+])
+def test_matches_drop_duplicates(hours, keep):
+    ds = _dataset(hours)
+    xr.testing.assert_identical(
+        _drop_duplicate_times(ds, 'time', keep=keep),
+        ds.drop_duplicates(dim='time', keep=keep))
+
+
+def test_unique_axis_returned_unchanged():
+    ds = _dataset([0, 1, 2, 3])
+    assert _drop_duplicate_times(ds, 'time', keep='last') is ds
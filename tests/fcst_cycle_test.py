@@ -0,0 +1,64 @@
+"""Tests for the forecast cycle tables in ``get_fcst_cycle.py``.
+
+``get_fcst_hours`` and the nearest-cycle adjustment in ``get_fcst_dates``
+now read module-level tables instead of if/elif chains and a NumPy
+``nanargmin``. These tests pin them to the previous results.
+"""
+
+import numpy as np
+import pytest
+
+from ofs_skill.model_processing import get_fcst_cycle
+
+_OFS = ('cbofs', 'dbofs', 'gomofs', 'ciofs', 'leofs', 'lmhofs', 'loofs',
+        'loofs2', 'lsofs', 'tbofs', 'necofs', 'secofs', 'creofs', 'ngofs2',
+        'sfbofs', 'sscofs', 'wcofs', 'stofs_3d_atl', 'stofs_3d_pac',
+        'stofs_2d_glo')
+
+
+def _old_nearest_offset(fcstcycles, hour):
+    """The NumPy nearest-cycle search get_fcst_dates used before."""
+    if fcstcycles[0] == 0:
+        fcstcycles = np.append(fcstcycles, 24)
+    elif fcstcycles[0] == 3 and len(fcstcycles) > 1:
+        fcstcycles = np.concatenate(([-3], fcstcycles))
+    dist = np.array([item - hour for item in fcstcycles])
+    return int(dist[np.nanargmin(np.abs(dist))])
+
+
+@pytest.mark.parametrize('ofs,length,cycles', [
+    ('cbofs', 48, [0, 6, 12, 18]),
+    ('gomofs', 72, [0, 6, 12, 18]),
+    ('sscofs', 72, [3, 9, 15, 21]),
+    ('wcofs', 72, [3]),
+    ('stofs_3d_atl', 96, [12]),
+    ('stofs_3d_pac', 48, [12]),
+    ('stofs_2d_glo', 180, [0, 6, 12, 18]),
+    ('leofs', 120, [0, 6, 12, 18]),
+])
+def test_fcst_hours(ofs, length, cycles):
+    fcstlength, fcstcycles = get_fcst_cycle.get_fcst_hours(ofs)
+    assert fcstlength == length
+    assert isinstance(fcstcycles, np.ndarray)
+    assert fcstcycles.tolist() == cycles
+
+
+@pytest.mark.parametrize('ofs', _OFS)
+def test_nearest_cycle_offset_matches_numpy_search(ofs):
+    _, fcstcycles = get_fcst_cycle.get_fcst_hours(ofs)
+    for hour in range(24):
+        assert get_fcst_cycle._nearest_cycle_offset(ofs, hour) == \
+            _old_nearest_offset(fcstcycles, hour)
+
+
+@pytest.mark.parametrize('ofs,bucket', [
+    ('stofs_3d_atl', 'nodd_s3_stofs3d'),
+    ('stofs_3d_pac', 'nodd_s3_stofs3d'),
+    ('stofs_2d_glo', 'nodd_s3_stofs2d'),
+    ('cbofs', 'nodd_s3'),
+    # Substrings of an OFS name are not that OFS.
+    ('stofs_2d', 'nodd_s3'),
+    ('glo', 'nodd_s3'),
+])
+def test_s3_bucket(ofs, bucket):
+    assert get_fcst_cycle.get_s3_bucket(ofs) == bucket
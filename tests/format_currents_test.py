@@ -0,0 +1,43 @@
+"""Tests for speed and direction in ``format_currents``.
+
+``format_currents`` turns a station's u/v series into the speed and
+direction-toward columns of the .prd file. These tests compare its lines
+against the per-timestep ``math.atan2`` loop it originally used.
+"""
+
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from ofs_skill.model_processing.get_node_ofs import format_currents
+from ofs_skill.obs_retrieval import vector
+
+
+def test_matches_atan2_loop():
+    rng = np.random.default_rng(0)
+    times = pd.date_range('2026-01-01', periods=200, freq='6min').to_numpy()
+    u = rng.normal(scale=0.5, size=(200, 2))
+    v = rng.normal(scale=0.5, size=(200, 2))
+    # Calm, due-north and due-south samples.
+    u[:3, 1] = [0.0, 0.0, 0.0]
+    v[:3, 1] = [0.0, 0.4, -0.4]
+    prop = SimpleNamespace(model_source='fvcom', ofsfiletype='stations',
+                           ofs='ngofs2',
+                           start_date_full='2026-01-01T00:00:00Z',
+                           end_date_full='2026-01-01T12:00:00Z')
+    precomputed = {'model_time': times, 'u_data': u, 'v_data': v}
+
+    for i in range(2):
+        lines = format_currents(prop, None, None, i, precomputed)
+
+        u_i, v_i = u[:, i], v[:, i]
+        expected = pd.DataFrame({
+            'DateTime': times,
+            'DIR': [math.atan2(u_i[t], v_i[t]) / math.pi * 180 % 360.0
+                    for t in range(len(times))],
+            'OBS': np.array(u_i**2 + v_i**2) ** 0.5,
+        })
+        assert lines == vector(expected, '20251230-01:01:01',
+                               '20260103-01:01:01')
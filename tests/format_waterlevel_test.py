@@ -0,0 +1,69 @@
+"""Tests for the datum and shift handling in ``format_waterlevel``.
+
+``format_waterlevel`` adds the ctl file shift (SCHISM fields) and the
+datum offset to each station's series. These tests compare its lines
+with the series shifted the way the function originally did it, one
+array operation per correction.
+"""
+
+import importlib
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofs_skill.obs_retrieval import scalar
+
+gno = importlib.import_module('ofs_skill.model_processing.get_node_ofs')
+
+_TIMES = pd.date_range('2026-01-01', periods=48, freq='30min').to_numpy()
+
+
+def _legacy(prop, series, shift, datum_offset):
+    if prop.model_source == 'schism':
+        if prop.ofsfiletype == 'fields':
+            series = series + shift
+        if -999 < datum_offset < 999:
+            sign = 1 if 'stofs' in prop.ofs else -1
+            series = series + sign * datum_offset
+    elif prop.model_source == 'adcirc':
+        if -999 < datum_offset < 999:
+            series = series - datum_offset
+    elif datum_offset > -999:
+        series = series - datum_offset
+    return scalar(pd.DataFrame({'DateTime': _TIMES, 'OBS': series}),
+                  '20251230-01:01:01', '20260103-01:01:01')
+
+
+@pytest.mark.parametrize('source, ofs, filetype', [
+    ('fvcom', 'ngofs2', 'stations'),
+    ('roms', 'cbofs', 'fields'),
+    ('schism', 'stofs_3d_atl', 'fields'),
+    ('schism', 'secofs', 'fields'),
+    ('schism', 'secofs', 'stations'),
+    ('adcirc', 'stofs_2d_glo', 'stations'),
+])
+@pytest.mark.parametrize('datum_offset', [0.37, 0, -9992, 1500.0])
+def test_matches_per_correction_shifts(monkeypatch, source, ofs, filetype,
+                                       datum_offset):
+    monkeypatch.setattr(gno, 'get_datum_offset_func',
+                        lambda *args: datum_offset)
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(len(_TIMES), 3)).astype(np.float32)
+    ctl = ([], [5, 6, 7], [0, 0, 0], [0.0, -0.2, 0.15], ['a', 'b', 'c'])
+    prop = SimpleNamespace(model_source=source, ofs=ofs, ofsfiletype=filetype,
+                           start_date_full='2026-01-01T00:00:00Z',
+                           end_date_full='2026-01-01T12:00:00Z')
+    precomputed = {'model_time': _TIMES, 'scalar_data': data}
+
+    original = data.copy()
+    for i in range(3):
+        lines, offset = gno.format_waterlevel(
+            prop, None, ctl, 'zeta', i,
+            logging.getLogger('format_waterlevel_test'), precomputed)
+        assert offset == datum_offset
+        assert lines == _legacy(prop, data[:, i], ctl[3][i], datum_offset)
+    # The batch is shared between stations and must not change.
+    np.testing.assert_array_equal(data, original)
@@ -0,0 +1,64 @@
+"""Regression tests for ``get_horizon_filenames`` in ``do_horizon_skill_utils.py``.
+
+``get_horizon_filenames`` lists every station file for the model cycles
+that have forecast output inside the requested date range. These tests
+check it against a reference copy of the original implementation, which
+walked the range hour by hour and deduplicated the names at the end.
+"""
+
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from ofs_skill.model_processing import get_fcst_cycle
+from ofs_skill.model_processing.do_horizon_skill_utils import (
+    get_horizon_filenames,
+)
+
+
+def _reference(ofs, start, end):
+    fcstlength, fcstcycles = get_fcst_cycle.get_fcst_hours(ofs)
+    names = set()
+    date_iterate = start
+    while date_iterate <= end:
+        datedt = date_iterate.replace(minute=0, second=0, microsecond=0)
+        d_0 = datedt - timedelta(hours=fcstlength)
+        dist = np.concatenate((fcstcycles, fcstcycles + 24)) - d_0.hour
+        first = int(dist[dist >= 0][0])
+        base = d_0 + timedelta(hours=first)
+        ndates = int(len(fcstcycles) * (fcstlength / 24)) + (first == 0)
+        d_t = int(24 / len(fcstcycles))
+        for i in range(ndates):
+            date = base + timedelta(hours=d_t * i)
+            horizon = int((datedt - date).total_seconds() / 3600)
+            cast = 'nowcast' if horizon <= 0 else 'forecast'
+            names.add(f'{ofs}.t{date:%H}z.{date:%Y%m%d}.stations.{cast}.nc')
+        date_iterate += timedelta(hours=1)
+    return names
+
+
+@pytest.mark.parametrize('ofs', ['cbofs', 'ngofs2', 'gomofs',
+                                 'stofs_3d_atl', 'leofs'])
+@pytest.mark.parametrize('start, end', [
+    (datetime(2026, 1, 1), datetime(2026, 1, 3)),
+    (datetime(2026, 1, 1, 5, 30), datetime(2026, 1, 1, 5, 45)),
+    (datetime(2026, 2, 27, 13), datetime(2026, 3, 2, 2)),
+    (datetime(2026, 1, 1, 6), datetime(2026, 1, 1, 6)),
+    (datetime(2026, 1, 1, 6, 50), datetime(2026, 1, 1, 7, 10)),
+    (datetime(2026, 1, 2), datetime(2026, 1, 1)),
+])
+def test_matches_reference(ofs, start, end):
+    result = get_horizon_filenames(
+        ofs, start, end, logging.getLogger('horizon_filenames_test'))
+    assert len(result) == len(set(result))
+    assert set(result) == _reference(ofs, start, end)
+
+
+def test_names_in_cycle_order():
+    result = get_horizon_filenames(
+        'cbofs', datetime(2026, 1, 1), datetime(2026, 1, 2),
+        logging.getLogger('horizon_filenames_test'))
+    stamps = [name.split('.')[2] + name.split('.')[1] for name in result]
+    assert stamps == sorted(stamps)
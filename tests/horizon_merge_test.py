@@ -0,0 +1,187 @@
+"""Regression tests for ``pandas_merge`` in ``do_horizon_skill_utils.py``.
+
+Each model cycle series is merged onto the horizon CSV holding the
+previously merged cycles. The merge used to be ``pd.merge`` on the six
+time key columns; it is now an outer join on a sorted time key index.
+These tests check the result matches the old merge, and that duplicate
+time rows are reported instead of silently multiplying rows.
+
+``make_horizon_series`` now collects every cycle and calls
+``pandas_merge_cycles`` once per CSV; that must give the same table as
+merging the cycles onto the CSV one at a time.
+
+``pandas_processing`` parses the fixed-width formatted series into the
+string columns these merges take.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofs_skill.model_processing.do_horizon_skill_utils import (
+    pandas_merge,
+    pandas_merge_cycles,
+    pandas_processing,
+)
+from ofs_skill.obs_retrieval.format_obs_timeseries import (
+    format_scalar,
+    format_vector,
+)
+
+_KEYS = ['julian', 'year', 'month', 'day', 'hour', 'minute']
+
+
+def _rows(hours, value):
+    return [
+        # Julian dates are rounded to 4 decimals, as in format_obs_timeseries
+        {'julian': round(2461041.5 + h / 24.0, 4), 'year': 2026,
+         'month': 1, 'day': 1, 'hour': h, 'minute': 0, 'v': value + h}
+        for h in hours
+    ]
+
+
+@pytest.fixture
+def horizon_csv(tmp_path):
+    prd = pd.DataFrame(_rows(range(0, 6), 1.0)).rename(
+        columns={'v': '20260101-00z'})
+    prd['20260101-06z'] = prd['20260101-00z'] + 10
+    path = tmp_path / 'horizon.csv'
+    prd.to_csv(path, index=False)
+    return path
+
+
+def _new_series(hours, datecycle):
+    # pandas_processing hands over string columns from str.split.
+    df = pd.DataFrame(_rows(hours, 100.0)).rename(columns={'v': datecycle})
+    return df.astype(str)
+
+
+def _legacy_merge(filepath, df, datecycle):
+    prd = pd.read_csv(filepath)
+    df = df.astype({**{k: 'int64' for k in _KEYS[1:]}, 'julian': 'float',
+                    datecycle: 'float'})
+    if datecycle in prd.columns:
+        prd.drop(columns=datecycle, inplace=True)
+    return pd.merge(prd, df, on=_KEYS, how='outer')
+
+
+def test_matches_legacy_outer_merge(horizon_csv):
+    datecycle = '20260101-12z'
+    prop = SimpleNamespace(
+        datecycles=['20260101-00z', '20260101-06z', datecycle])
+    # Out of order, partly overlapping and partly past the existing rows.
+    df = _new_series([9, 3, 4, 5, 6, 7, 8], datecycle)
+
+    result = pandas_merge(horizon_csv, df.copy(), datecycle, prop)
+    expected = _legacy_merge(horizon_csv, df.copy(), datecycle)
+
+    pd.testing.assert_frame_equal(result, expected)
+    assert len(result) == 10
+
+
+def test_rerun_replaces_existing_cycle_column(horizon_csv):
+    datecycle = '20260101-06z'
+    prop = SimpleNamespace(datecycles=['20260101-00z', datecycle])
+    df = _new_series(range(0, 6), datecycle)
+
+    result = pandas_merge(horizon_csv, df, datecycle, prop)
+
+    assert list(result.columns) == _KEYS + ['20260101-00z', datecycle]
+    assert result[datecycle].tolist() == [100.0 + h for h in range(6)]
+
+
+def test_duplicate_time_rows_raise(horizon_csv):
+    datecycle = '20260101-12z'
+    prop = SimpleNamespace(
+        datecycles=['20260101-00z', '20260101-06z', datecycle])
+    df = _new_series([6, 7, 7], datecycle)
+
+    with pytest.raises(ValueError, match='Duplicate time rows'):
+        pandas_merge(horizon_csv, df, datecycle, prop)
+
+
+def _sequential(filepath, frames, prop):
+    """Old per-cycle path: merge onto the CSV and write it back each time."""
+    for datecycle, df in frames:
+        df = pandas_merge(filepath, df.copy(), datecycle, prop)
+        df.to_csv(filepath, index=False)
+    return pd.read_csv(filepath)
+
+
+def test_batched_merge_matches_per_cycle_merges(horizon_csv, tmp_path):
+    cycles = ['20260101-12z', '20260101-18z', '20260102-00z']
+    prop = SimpleNamespace(
+        datecycles=['20260101-00z', '20260101-06z'] + cycles)
+    frames = [(c, _new_series(range(3 + 2 * k, 9 + 2 * k), c))
+              for k, c in enumerate(cycles)]
+    # Rerun of a cycle already in the CSV
+    frames.append(('20260101-06z', _new_series(range(0, 4), '20260101-06z')))
+
+    seq_path = tmp_path / 'sequential.csv'
+    seq_path.write_bytes(horizon_csv.read_bytes())
+    expected = _sequential(seq_path, frames, prop)
+
+    result = pandas_merge_cycles(horizon_csv, frames, prop,
+                                 logging.getLogger('horizon_merge_test'))
+    result.to_csv(horizon_csv, index=False)
+
+    pd.testing.assert_frame_equal(pd.read_csv(horizon_csv), expected)
+
+
+def test_batched_merge_without_existing_csv(tmp_path):
+    cycles = ['20260101-00z', '20260101-06z']
+    prop = SimpleNamespace(datecycles=cycles)
+    frames = [(c, _new_series(range(6 * k, 6 * k + 8), c))
+              for k, c in enumerate(cycles)]
+
+    result = pandas_merge_cycles(tmp_path / 'new.csv', frames, prop,
+                                 logging.getLogger('horizon_merge_test'))
+
+    assert list(result.columns) == _KEYS + cycles
+    assert result['hour'].tolist() == list(range(14))
+    assert result[cycles[0]].isna().tolist() == [False] * 8 + [True] * 6
+    assert result[cycles[1]].isna().tolist() == [True] * 6 + [False] * 8
+
+
+def test_batched_merge_skips_bad_cycle(tmp_path, caplog):
+    cycles = ['20260101-00z', '20260101-06z']
+    prop = SimpleNamespace(datecycles=cycles)
+    frames = [(cycles[0], _new_series([0, 1, 1], cycles[0])),
+              (cycles[1], _new_series([6, 7], cycles[1]))]
+
+    result = pandas_merge_cycles(tmp_path / 'new.csv', frames, prop,
+                                 logging.getLogger('horizon_merge_test'))
+
+    assert list(result.columns) == _KEYS + [cycles[1]]
+    assert 'Could not merge datecycle 20260101-00z' in caplog.text
+
+
+@pytest.fixture
+def obs_frame():
+    return pd.DataFrame({
+        'DateTime': pd.date_range('2026-01-01', periods=4, freq='h'),
+        'OBS': [0.5, -12.25, np.nan, 1234.5],
+        'DIR': [90.0, 180.0, 10.0, 20.0],
+    })
+
+
+@pytest.mark.parametrize('name, formatter', [
+    ('wl', format_scalar),
+    ('cu', format_vector),
+])
+def test_processing_splits_formatted_series(obs_frame, name, formatter):
+    datecycle = '20260101-00z-forecast'
+    lines = formatter(obs_frame, '20260101-00:00:00', '20260101-03:00:00')
+
+    df = pandas_processing(name, datecycle, lines)
+
+    assert list(df.columns) == _KEYS + [datecycle]
+    assert df['hour'].tolist() == ['0', '1', '2', '3']
+    assert df['julian'].tolist()[0] == '2461041.50000000'
+    # The all-space padded nan must not shift the columns.
+    np.testing.assert_array_equal(
+        df[datecycle].astype(float).to_numpy(),
+        [0.5, -12.25, np.nan, np.nan])
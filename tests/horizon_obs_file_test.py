@@ -0,0 +1,177 @@
+"""Tests for observation pairing in ``do_horizon_skill.py``.
+
+``merge_obs_series_scalar`` reads each station .obs file with a fixed
+column schema, fills short observation gaps on the model time axis, and
+left-joins the observations onto the station's horizon CSV. These tests
+write .obs files in the format produced by ``format_obs_timeseries`` and
+check the values against the original read and pairing steps.
+"""
+
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofs_skill.model_processing import do_horizon_skill
+from ofs_skill.obs_retrieval.format_obs_timeseries import (
+    format_scalar,
+    format_vector,
+)
+
+
+def _write_obs(path, formatter, frame, start, end):
+    lines = formatter(frame, start, end)
+    path.write_text('\n'.join(lines) + '\n')
+
+
+@pytest.mark.parametrize('formatter', [format_scalar, format_vector])
+def test_obs_file_read_with_schema(tmp_path, formatter):
+    frame = pd.DataFrame({
+        'DateTime': pd.date_range('2026-01-01', periods=5, freq='6min'),
+        'OBS': [0.5, -12.25, np.nan, 1.0, 2.0],
+        'DIR': [90.0, 180.0, 10.0, 20.0, 30.0],
+    })
+    path = tmp_path / 'station.obs'
+    _write_obs(path, formatter, frame, '20260101-00:00:00',
+               '20260101-01:00:00')
+
+    obs_df = do_horizon_skill._read_obs_file(path)
+
+    assert list(obs_df.columns) == do_horizon_skill._OBS_COLUMNS
+    assert obs_df['year'].dtype == np.int64
+    legacy = pd.read_csv(path, sep=r'\s+', header=None)
+    np.testing.assert_array_equal(obs_df.to_numpy(dtype=float),
+                                  legacy.iloc[:, :7].to_numpy(dtype=float))
+
+
+def _legacy_pairing(obs_path, horizon_path, start, end):
+    """The read/fill/merge steps as merge_obs_series_scalar first had them."""
+    obs_df = pd.read_csv(obs_path, sep=r'\s+', header=None)
+    ofs_df = pd.read_csv(horizon_path)
+    ofs_df['DateTime'] = pd.to_datetime(
+        ofs_df[['year', 'month', 'day', 'hour', 'minute']])
+    paired_0 = pd.DataFrame({'DateTime': ofs_df['DateTime']})
+    obs_df['DateTime'] = pd.to_datetime(dict(
+        year=obs_df[1], month=obs_df[2], day=obs_df[3],
+        hour=obs_df[4], minute=obs_df[5]))
+    obs_df = obs_df.rename(columns={6: 'OBS'}).sort_values(by='DateTime')
+    obs_df = pd.concat([paired_0, obs_df]).sort_values(by='DateTime')
+    obs_df = obs_df[~obs_df['DateTime'].duplicated(keep=False)
+                    | obs_df[['OBS']].notnull().any(axis=1)]
+    obs_df = (obs_df.sort_values(by='DateTime').set_index('DateTime')
+              .astype(float).interpolate(method='linear', limit=3)
+              .ffill(limit=1).bfill(limit=1).reset_index())
+    ofs_df = (ofs_df.sort_values(by='DateTime').set_index('DateTime')
+              .astype(float).reset_index())
+    paired = pd.merge(ofs_df, obs_df[['DateTime', 'OBS']],
+                      on=['DateTime'], how='left')
+    return paired.loc[(paired['DateTime'] >= start)
+                      & (paired['DateTime'] <= end)]
+
+
+@pytest.fixture
+def station_dirs(tmp_path, monkeypatch):
+    ctl = tmp_path / 'control_files'
+    obs = tmp_path / 'obs'
+    horizon = tmp_path / 'horizon'
+    for path in (ctl, obs, horizon):
+        path.mkdir()
+    (ctl / 'cbofs_wl_station.ctl').write_text('')
+    (ctl / 'cbofs_wl_model_station.ctl').write_text('')
+    # Control file contents are not under test here.
+    monkeypatch.setattr(do_horizon_skill, 'name_convent', lambda v: 'wl')
+    monkeypatch.setattr(
+        do_horizon_skill, 'station_ctl_file_extract',
+        lambda path: [[['8575512', 'wl_NOS', 'Annapolis']]])
+    monkeypatch.setattr(
+        do_horizon_skill, 'ofs_ctlfile_extract',
+        lambda prop, name, logger: [[0], [12], [0], [0], ['8575512'],
+                                    ['8575512']])
+    captured = {}
+    monkeypatch.setattr(
+        do_horizon_skill, 'horizon_skill',
+        lambda prop, paired, info, logger: captured.update(
+            paired=paired, info=info))
+    prop = SimpleNamespace(
+        ofs='cbofs', var_list=['water_level'], ofsfiletype='stations',
+        start_date_full='2026-01-01T00:00:00Z',
+        end_date_full='2026-01-01T10:00:00Z',
+        control_files_path=str(ctl),
+        data_observations_1d_station_path=str(obs),
+        data_horizon_1d_node_path=str(horizon),
+    )
+    return prop, captured
+
+
+def _write_station_files(prop, rng):
+    # Observations every 6 minutes with a gap and a duplicated timestamp.
+    obs_times = pd.date_range('2025-12-31T23:00', '2026-01-01T12:00',
+                              freq='6min')
+    obs_times = obs_times.delete(range(40, 60)).insert(5, obs_times[5])
+    obs = pd.DataFrame({'DateTime': obs_times,
+                        'OBS': rng.normal(size=len(obs_times))})
+    obs_path = (Path(prop.data_observations_1d_station_path)
+                / '8575512_cbofs_wl_station.obs')
+    _write_obs(obs_path, format_scalar, obs, '20251231-23:00:00',
+               '20260101-12:00:00')
+
+    model_times = pd.date_range('2026-01-01', '2026-01-01T11:00',
+                                freq='30min')
+    horizon = pd.DataFrame({
+        'julian': np.round(model_times.to_julian_date(), 4),
+        'year': model_times.year, 'month': model_times.month,
+        'day': model_times.day, 'hour': model_times.hour,
+        'minute': model_times.minute,
+        '20260101-00z-forecast': rng.normal(size=len(model_times)),
+    }).iloc[::-1]
+    horizon_path = (Path(prop.data_horizon_1d_node_path)
+                    / 'cbofs_8575512_wl_fcst_horizons.csv')
+    horizon.to_csv(horizon_path, index=False)
+
+    return obs_path, horizon_path
+
+
+def test_pairing_matches_legacy_merge(station_dirs):
+    prop, captured = station_dirs
+    obs_path, horizon_path = _write_station_files(
+        prop, np.random.default_rng(1))
+    expected = _legacy_pairing(
+        obs_path, horizon_path,
+        pd.Timestamp('2026-01-01T00:00'), pd.Timestamp('2026-01-01T10:00'))
+    do_horizon_skill.merge_obs_series_scalar(
+        prop, logging.getLogger('horizon_obs_file_test'))
+
+    pd.testing.assert_frame_equal(
+        captured['paired'].reset_index(drop=True),
+        expected.reset_index(drop=True))
+
+
+def test_obs_ctl_row_matched_by_station_id(station_dirs, monkeypatch):
+    prop, captured = station_dirs
+    _write_station_files(prop, np.random.default_rng(2))
+    monkeypatch.setattr(
+        do_horizon_skill, 'station_ctl_file_extract',
+        lambda path: [[['8574680', 'wl_NOS', 'Baltimore'],
+                       ['8575512', 'wl_NOS', 'Annapolis'],
+                       ['8575512', 'wl_NOS', 'Annapolis (dup)']]])
+
+    do_horizon_skill.merge_obs_series_scalar(
+        prop, logging.getLogger('horizon_obs_file_test'))
+
+    assert captured['info'][3] == 'Annapolis'
+    assert captured['info'][4] == 'NOS'
+
+
+def test_unmatched_station_id_exits(station_dirs, monkeypatch):
+    prop, _ = station_dirs
+    _write_station_files(prop, np.random.default_rng(3))
+    monkeypatch.setattr(
+        do_horizon_skill, 'station_ctl_file_extract',
+        lambda path: [[['8574680', 'wl_NOS', 'Baltimore']]])
+
+    with pytest.raises(SystemExit):
+        do_horizon_skill.merge_obs_series_scalar(
+            prop, logging.getLogger('horizon_obs_file_test'))
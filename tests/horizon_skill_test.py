@@ -0,0 +1,104 @@
+"""Regression tests for ``horizon_skill`` in ``do_horizon_skill.py``.
+
+``horizon_skill`` reshapes a station's paired model cycle table into one
+long table with forecast horizon hours and 6-hour bins, then hands it to
+the plotting functions. These tests stub the plotting functions and
+compare what they receive against a straightforward reference built the
+way the function originally did it: one ``strptime`` per cycle column,
+a masked assignment per hour bin, and a ``sorted`` call for the cycle
+order.
+"""
+
+import logging
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofs_skill.model_processing import do_horizon_skill, get_fcst_cycle
+
+# Deliberately out of date order.
+_CYCLES = [
+    '20260102-06z-forecast',
+    '20260101-00z-forecast',
+    '20260101-18z-forecast',
+    '20260101-06z-forecast',
+]
+
+
+@pytest.fixture
+def paired():
+    times = pd.date_range('2026-01-01', '2026-01-04', freq='30min')
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'DateTime': times,
+                       'OBS': rng.normal(size=len(times))})
+    for col in _CYCLES:
+        df[col] = rng.normal(size=len(times))
+    return df
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    seen = {}
+
+    def _bins(df_all, info, prop, logger):
+        seen['df_all'] = df_all.copy()
+
+    def _series(df_all, forecast_cols_sort, info, prop, logger):
+        seen['forecast_cols_sort'] = forecast_cols_sort
+
+    monkeypatch.setattr(do_horizon_skill.plot_forecast_hours,
+                        'make_horizonbin_plots', _bins)
+    monkeypatch.setattr(do_horizon_skill.plot_forecast_hours,
+                        'make_horizonbin_freq_plots',
+                        lambda *args: None)
+    monkeypatch.setattr(do_horizon_skill.plot_forecast_hours,
+                        'make_timeseries_plots', _series)
+    return seen
+
+
+def _reference(df, ofs):
+    fcstlength, _ = get_fcst_cycle.get_fcst_hours(ofs)
+    bins = np.arange(0, fcstlength + 6, 6)
+    frames = []
+    for col in _CYCLES:
+        start = datetime.strptime(
+            col.split('-')[0] + col.split('-')[1][0:2], '%Y%m%d%H')
+        hc = np.floor(
+            (df['DateTime'] - start).dt.total_seconds() / 3600).astype(int)
+        hb = hc.copy()
+        for j in range(len(bins) - 1):
+            hb[(hc >= bins[j]) & (hc < bins[j + 1])] = bins[j + 1]
+        frames.append(pd.DataFrame({
+            'DateTime': df['DateTime'], 'model_cycle': col,
+            'horizon_category': hc, 'hour_bins': hb,
+            'OBS': df['OBS'], 'OFS': df[col],
+        }))
+    df_all = pd.concat(frames)
+    df_all = df_all[(df_all['horizon_category'] <= fcstlength) &
+                    (df_all['horizon_category'] >= 0)]
+    df_all['error'] = df_all['OFS'] - df_all['OBS']
+    df_all['square_error'] = (df_all['OFS'] - df_all['OBS'])**2
+    order = sorted(_CYCLES, key=lambda c: datetime.strptime(
+        c.split('-')[0] + c.split('-')[1][0:2], '%Y%m%d%H'))
+    return df_all, order
+
+
+@pytest.mark.parametrize('ofs', ['cbofs', 'gomofs'])
+def test_matches_reference(paired, captured, ofs):
+    prop = SimpleNamespace(ofs=ofs)
+    info = ['wl', ofs, '8575512', 'Annapolis', 'NOS', [], True, 'wl']
+
+    do_horizon_skill.horizon_skill(prop, paired.copy(), info,
+                                   logging.getLogger('horizon_skill_test'))
+
+    expected, order = _reference(paired, prop.ofs)
+    result = captured['df_all']
+    assert captured['forecast_cols_sort'] == order
+    assert list(result.columns) == list(expected.columns)
+    for col in expected.columns:
+        np.testing.assert_array_equal(result[col].to_numpy(),
+                                      expected[col].to_numpy(),
+                                      err_msg=col)
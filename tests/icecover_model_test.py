@@ -0,0 +1,366 @@
+"""Tests for bin/model_processing/get_icecover_model.py.
+
+Daily model ice composites that are not cached yet are averaged from
+one open of all their model files. These tests stub the model intake
+and check that results come back in day order, come from a single
+intake call, and are written to and reused from the .npz cache (or a
+CSV cache from older runs). Days without model files are not cached.
+"""
+
+import importlib.util
+import logging
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parent.parent
+    / 'bin' / 'model_processing' / 'get_icecover_model.py'
+)
+_spec = importlib.util.spec_from_file_location(
+    'get_icecover_model', _MODULE_PATH,
+)
+assert _spec is not None and _spec.loader is not None
+icm = importlib.util.module_from_spec(_spec)
+sys.modules['get_icecover_model'] = icm
+_spec.loader.exec_module(icm)
+
+_DAYS = [datetime(2026, 1, d) for d in (1, 2, 3)]
+
+
+def _files():
+    return [f'/m/leofs.t{cyc:02d}z.2026010{d}.fields.n006.nc'
+            for d in (1, 2, 3) for cyc in (6, 12)]
+
+
+def _fake_intake(calls):
+    def _intake_model(file_list, prop, logger):
+        calls.append(list(file_list))
+        times = icm.file_name_to_datetime(file_list)
+        days = np.array([float(t.day) for t in times])
+        return xr.Dataset({
+            'aice': (('time', 'node'), np.repeat(days[:, None], 3, axis=1)),
+            'lon': (('node',), np.array([270.0, 271.0, 272.0])),
+            'lat': (('node',), np.array([41.0, 42.0, 43.0])),
+        }, coords={'time': times})
+    return _intake_model
+
+
+def _run(tmp_path, files=None):
+    prop = SimpleNamespace(ofs='leofs', whichcast='nowcast',
+                           model_source='fvcom',
+                           data_model_ice_path=str(tmp_path))
+    return icm._process_daily_composite(
+        prop, logging.getLogger(__name__),
+        _files() if files is None else files, _DAYS, 'aice', 'lon', 'lat')
+
+
+def test_daily_composites_in_day_order_from_one_open(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+
+    composite, lon_m, lat_m, days = _run(tmp_path)
+
+    assert days == _DAYS
+    assert composite.dtype == np.float32
+    assert composite.shape == (3, 3)
+    np.testing.assert_array_equal(composite[:, 0], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(lon_m, [-90.0, -89.0, -88.0])
+    assert calls == [_files()]
+
+
+def test_only_missing_days_are_opened(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+    _run(tmp_path)
+    (tmp_path / 'leofs_nowcast_20260102_composite_iceconc.npz').unlink()
+    calls.clear()
+
+    composite, _, _, _ = _run(tmp_path)
+
+    assert calls == [[f for f in _files() if '.20260102.' in f]]
+    np.testing.assert_array_equal(composite[:, 0], [1.0, 2.0, 3.0])
+
+
+def test_day_without_files_is_not_cached(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+    partial = [f for f in _files() if '.20260102.' not in f]
+
+    composite, _, _, _ = _run(tmp_path, partial)
+
+    np.testing.assert_array_equal(composite[:, 0], [1.0, np.nan, 3.0])
+    assert not (tmp_path / 'leofs_nowcast_20260102_composite_iceconc.npz'
+                ).exists()
+
+    # Once its files exist, the day is averaged and cached.
+    calls.clear()
+    composite, _, _, _ = _run(tmp_path)
+
+    assert calls == [[f for f in _files() if '.20260102.' in f]]
+    np.testing.assert_array_equal(composite[:, 0], [1.0, 2.0, 3.0])
+    assert (tmp_path / 'leofs_nowcast_20260102_composite_iceconc.npz'
+            ).exists()
+
+
+def test_cached_days_are_not_recomputed(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+    first = _run(tmp_path)
+    calls.clear()
+
+    second = _run(tmp_path)
+
+    assert calls == []
+    np.testing.assert_array_equal(first[0], second[0])
+    np.testing.assert_array_equal(first[1], second[1])
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        f'leofs_nowcast_2026010{d}_composite_iceconc.npz' for d in (1, 2, 3)]
+    with np.load(tmp_path / 'leofs_nowcast_20260101_composite_iceconc.npz') as npz:
+        assert npz['daily_composite'].dtype == np.float16
+
+
+def test_legacy_csv_cache_is_read(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+    for day in _DAYS:
+        pd.DataFrame({'lon': [270.0, 271.0, 272.0], 'lat': [41.0, 42.0, 43.0],
+                      'daily_composite': [0.5, 0.25, 0.0]}).to_csv(
+            tmp_path / f'leofs_nowcast_{day:%Y%m%d}_composite_iceconc.csv',
+            index=False)
+    # A truncated .npz cache falls back to the CSV.
+    (tmp_path / 'leofs_nowcast_20260101_composite_iceconc.npz').write_bytes(b'PK')
+
+    composite, lon_m, _, _ = _run(tmp_path)
+
+    assert calls == []
+    np.testing.assert_array_equal(composite[2], [0.5, 0.25, 0.0])
+    np.testing.assert_array_equal(lon_m, [-90.0, -89.0, -88.0])
+    # The CSV caches were converted to .npz.
+    assert len(list(tmp_path.glob('*.npz'))) == 3
+    for csv in tmp_path.glob('*.csv'):
+        csv.unlink()
+    np.testing.assert_array_equal(_run(tmp_path)[0], composite)
+    assert calls == []
+
+
+def test_daily_file_regex_matches_whole_fields():
+    nowcast = icm._daily_file_regex('t12z', 'n006')
+    assert nowcast.match('leofs.t12z.20260101.fields.n006.nc')
+    assert nowcast.match('nos.leofs.fields.n006.20240101.t12z.nc')
+    assert not nowcast.match('leofs.t06z.20260101.fields.n006.nc')
+    assert not nowcast.match('leofs.t12z.20260101.fields.n005.nc')
+    assert not nowcast.match('leofs.t12z.20260101.fields.n0061.nc')
+
+    schism = icm._daily_file_regex('t12z', 'out2d')
+    assert schism.match('loofs2.t12z.20260101.fields.out2d_n001_012.nc')
+    assert not schism.match(
+        'loofs2.t12z.20260101.fields.salinity_n001_012.nc')
+
+
+def _legacy_file_name_to_datetime(list_files):
+    dates = []
+    for file in list_files:
+        file_split = file.split('/')[-1].split('.')
+        if 'nos.' in file:
+            cycle_date = datetime.strptime(
+                file_split[4] + file_split[5][1:3], '%Y%m%d%H')
+            hour_info = file_split[3]
+        else:
+            cycle_date = datetime.strptime(
+                file_split[2] + file_split[1][1:3], '%Y%m%d%H')
+            hour_info = file_split[4]
+        if hour_info == 'hindcast':
+            dates.append(cycle_date)
+        elif 'n' in hour_info:
+            dates.append(cycle_date - timedelta(hours=6 - int(hour_info[1:])))
+        elif 'f' in hour_info:
+            dates.append(cycle_date + timedelta(hours=int(hour_info[1:])))
+    return dates
+
+
+def test_file_name_to_datetime_matches_legacy():
+    files = [
+        '/m/2026/01/leofs.t00z.20260101.fields.n001.nc',
+        '/m/2026/01/leofs.t06z.20260101.fields.n006.nc',
+        '/m/2026/01/leofs.t18z.20260131.fields.f048.nc',
+        '/m/2024/01/nos.leofs.fields.n003.20240101.t12z.nc',
+        '/m/2024/01/nos.leofs.fields.f120.20240229.t00z.nc',
+        'leofs.t12z.20260101.fields.hindcast.nc',
+        # Not hindcast/nowcast/forecast output: skipped
+        '/m/2026/01/leofs.t00z.20260101.fields.x001.nc',
+    ]
+    result = icm.file_name_to_datetime(files)
+    assert result == _legacy_file_name_to_datetime(files)
+    assert all(type(dt) is datetime for dt in result)
+    assert icm.file_name_to_datetime([]) == []
+
+
+def test_indices_by_day():
+    dates = [datetime(2026, 1, 2, 1), datetime(2026, 1, 1, 6),
+             datetime(2026, 1, 2, 0), datetime(2026, 1, 1, 23),
+             datetime(2026, 1, 4, 12)]
+    by_day = icm.get_indices_by_day(dates)
+    assert by_day == {
+        datetime(2026, 1, 1).date(): [1, 3],
+        datetime(2026, 1, 2).date(): [0, 2],
+        datetime(2026, 1, 4).date(): [4],
+    }
+    assert icm.get_indices_by_day([]) == {}
+
+
+def _hourly_prop(model_source):
+    return SimpleNamespace(
+        ofs='leofs', whichcast='nowcast', model_source=model_source,
+        start_date_full='2026-01-01T00:00:00Z',
+        end_date_full='2026-01-01T23:00:00Z',
+        ice_dt='hourly', dailyavg=False)
+
+
+def _hourly_model(monkeypatch, model_source):
+    ice_name, x_name, y_name = icm._get_variable_names(model_source)
+    times = pd.date_range('2026-01-01', periods=24, freq='h')
+    values = np.arange(24 * 3, dtype=float).reshape(24, 3)
+    ds = xr.Dataset({
+        ice_name: (('time', 'node'), values),
+        x_name: (('node',), np.array([270.0, 271.0, 272.0])),
+        y_name: (('node',), np.array([41.0, 42.0, 43.0])),
+    }, coords={'time': times}).chunk({'time': 1})
+    monkeypatch.setattr(icm.model_source, 'model_source',
+                        lambda ofs: model_source)
+    monkeypatch.setattr(icm, 'list_of_dir', lambda prop, logger: [])
+    monkeypatch.setattr(icm, 'list_of_files',
+                        lambda prop, dirs, logger: ['f.nc'])
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model',
+                        lambda files, prop, logger: ds)
+    return values
+
+
+def test_hourly_model_ice_is_lazy(monkeypatch):
+    values = _hourly_model(monkeypatch, 'fvcom')
+
+    icecover_m, lon_m, _, time_m = icm.get_icecover_model(
+        _hourly_prop('fvcom'), logging.getLogger(__name__))
+
+    assert not isinstance(icecover_m, np.ndarray)
+    np.testing.assert_array_equal(np.array(icecover_m[5][:]), values[5])
+    np.testing.assert_array_equal(lon_m, [-90.0, -89.0, -88.0])
+    assert len(time_m) == 24
+
+
+def test_schism_daily_extraction_keeps_noon(monkeypatch):
+    values = _hourly_model(monkeypatch, 'schism')
+    prop = _hourly_prop('schism')
+    prop.ice_dt = 'daily'
+    # The daily file filter is not under test here.
+    monkeypatch.setattr(icm, '_daily_file_regex',
+                        lambda cycle, hour: icm.re.compile(''))
+
+    icecover_m, _, _, time_m = icm.get_icecover_model(
+        prop, logging.getLogger(__name__))
+
+    assert list(time_m) == [np.datetime64('2026-01-01T12:00', 'ns')]
+    np.testing.assert_array_equal(np.asarray(icecover_m), values[[12]])
+
+
+def test_cache_rounding_matches_fresh_composite(tmp_path, monkeypatch):
+    def _intake_model(file_list, prop, logger):
+        times = icm.file_name_to_datetime(file_list)
+        rng = np.random.default_rng(4)
+        return xr.Dataset({
+            'aice': (('time', 'node'), rng.uniform(size=(len(times), 3))),
+            'lon': (('node',), np.array([270.0, 271.0, 272.0])),
+            'lat': (('node',), np.array([41.0, 42.0, 43.0])),
+        }, coords={'time': times})
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _intake_model)
+
+    fresh = _run(tmp_path)[0]
+    cached = _run(tmp_path)[0]
+
+    assert cached.dtype == np.float32
+    np.testing.assert_array_equal(fresh, cached)
+
+
+def test_parse_iso():
+    assert icm._parse_iso('2026-01-31T18:30:00Z') == datetime(2026, 1, 31, 18, 30)
+    assert icm._parse_iso('2026-01-31') == datetime(2026, 1, 31)
+
+
+def test_warm_cache_skips_file_listing(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake(calls))
+    listed = []
+    monkeypatch.setattr(icm, '_list_model_files',
+                        lambda prop, logger: listed.append(1) or _files())
+    monkeypatch.setattr(icm.model_source, 'model_source', lambda ofs: 'fvcom')
+    prop = SimpleNamespace(
+        ofs='leofs', whichcast='nowcast', data_model_ice_path=str(tmp_path),
+        start_date_full='2026-01-01T00:00:00Z',
+        end_date_full='2026-01-03T00:00:00Z',
+        ice_dt='daily', dailyavg=True)
+
+    first = icm.get_icecover_model(prop, logging.getLogger(__name__))
+    assert listed == [1]
+    second = icm.get_icecover_model(prop, logging.getLogger(__name__))
+
+    assert listed == [1]
+    assert len(calls) == 1
+    np.testing.assert_array_equal(first[0], second[0])
+    assert second[3] == _DAYS
+
+
+def test_days_between_dates():
+    assert icm.get_days_between_dates(
+        datetime(2026, 1, 30, 12), datetime(2026, 2, 2, 6)) == [
+        datetime(2026, 1, 30, 12), datetime(2026, 1, 31, 12),
+        datetime(2026, 2, 1, 12)]
+    days = icm.get_days_between_dates(datetime(2026, 1, 1),
+                                      datetime(2026, 1, 1))
+    assert days == [datetime(2026, 1, 1)]
+    assert type(days[0]) is datetime
+
+
+def test_warm_cache_reads_grid_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(icm.intake_scisa, 'intake_model', _fake_intake([]))
+    first = _run(tmp_path)
+    reads = []
+    read_cache = icm._read_composite_cache
+
+    def _recording_read(prop, day, cached_names, grid=True):
+        reads.append(grid)
+        return read_cache(prop, day, cached_names, grid)
+    monkeypatch.setattr(icm, '_read_composite_cache', _recording_read)
+
+    second = _run(tmp_path)
+
+    assert sorted(reads) == [False, False, False, True]
+    np.testing.assert_array_equal(second[0], first[0])
+    np.testing.assert_array_equal(second[2], first[2])
+
+
+def test_logger_configured_once(tmp_path, monkeypatch):
+    config = tmp_path / 'ofs_dps.conf'
+    config.write_text('')
+    monkeypatch.setattr(
+        icm.utils, 'Utils',
+        lambda config_file=None: SimpleNamespace(
+            get_config_file=lambda: str(config)))
+    configured = []
+    monkeypatch.setattr(icm.logging.config, 'fileConfig',
+                        lambda path: configured.append(path))
+    icm._init_logger.cache_clear()
+    try:
+        first = icm._setup_logger(None)
+        second = icm._setup_logger(None)
+        given = logging.getLogger(__name__)
+        assert icm._setup_logger(given) is given
+    finally:
+        icm._init_logger.cache_clear()
+
+    assert first is second
+    assert len(configured) == 1
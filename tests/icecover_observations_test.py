@@ -0,0 +1,84 @@
+"""Tests for bin/obs_retrieval/get_icecover_observations.py.
+
+The concatenated GLSEA file and the clipped ``{ofs}_ice.nc`` are written
+with zlib level 1 and roughly 1 MB chunks along time. These tests check
+the round trip is lossless and that packing from the input files
+survives the new encoding.
+"""
+
+import importlib.util
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+import xarray as xr
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parent.parent
+    / 'bin' / 'obs_retrieval' / 'get_icecover_observations.py'
+)
+_spec = importlib.util.spec_from_file_location(
+    'get_icecover_observations', _MODULE_PATH,
+)
+assert _spec is not None and _spec.loader is not None
+ice = importlib.util.module_from_spec(_spec)
+sys.modules['get_icecover_observations'] = ice
+_spec.loader.exec_module(ice)
+
+
+def _write_glsea(path, day, packed=False):
+    rng = np.random.default_rng(day)
+    ice_c = rng.uniform(0, 100, (1, 30, 40))
+    ice_c[:, :5, :] = np.nan
+    ds = xr.Dataset(
+        {'ice_concentration': (('time', 'lat', 'lon'), ice_c)},
+        coords={'time': [np.datetime64('2026-01-01') + np.timedelta64(day, 'D')],
+                'lat': np.linspace(41.0, 49.0, 30),
+                'lon': np.linspace(-92.0, -76.0, 40)},
+    )
+    encoding = None
+    if packed:
+        encoding = {'ice_concentration': {
+            'dtype': 'int16', 'scale_factor': 0.01, '_FillValue': -1}}
+    ds.to_netcdf(path, encoding=encoding)
+    return ds
+
+
+def test_concat_round_trips_and_is_compressed(tmp_path):
+    files = []
+    inputs = []
+    for day in range(3):
+        path = tmp_path / f'2026010{day + 1}00-glsea_ice.nc'
+        inputs.append(_write_glsea(path, day))
+        files.append(str(path))
+
+    _, save_path = ice.concat_sat(files, str(tmp_path), logging.getLogger())
+
+    with xr.open_dataset(save_path) as out:
+        xr.testing.assert_equal(out['ice_concentration'],
+                                xr.concat(inputs, 'time')['ice_concentration'])
+        enc = out['ice_concentration'].encoding
+        assert enc['zlib'] is True
+        assert enc['complevel'] == 1
+        assert enc['chunksizes'] == (3, 30, 40)
+
+
+def test_encoding_keeps_input_packing(tmp_path):
+    path = tmp_path / '2026010100-glsea_ice.nc'
+    _write_glsea(path, 0, packed=True)
+    with xr.open_dataset(path) as ds:
+        enc = ice._netcdf_encoding(ds)['ice_concentration']
+    assert enc['dtype'] == np.dtype('int16')
+    assert enc['scale_factor'] == 0.01
+    assert 'source' not in enc
+
+
+def test_chunks_along_time_stay_near_target():
+    ds = xr.Dataset(
+        {'ice_concentration': (('time', 'lat', 'lon'),
+                               np.zeros((40, 256, 256)))},
+    )
+    chunks = ice._netcdf_encoding(ds)['ice_concentration']['chunksizes']
+    # 256 * 256 float64 values are 512 KiB per step, so 2 steps per chunk.
+    assert chunks == (2, 256, 256)
@@ -0,0 +1,50 @@
+"""Tests for ``list_of_dir`` directory checks in ``list_of_files.py``.
+
+Every date in a month maps to the same old-style ``{YYYYMM}`` model dir.
+``list_of_dir`` now checks each candidate dir once, and the emptiness
+check stops at the first entry instead of listing the whole directory.
+"""
+
+import importlib
+import logging
+import os
+from types import SimpleNamespace
+
+# The package __init__ re-exports the list_of_files *function* under the
+# module's name, so fetch the module itself.
+lof = importlib.import_module('ofs_skill.model_processing.list_of_files')
+
+
+def _prop(model_path, startdate, enddate):
+    return SimpleNamespace(ofs='cbofs', whichcast='nowcast',
+                           model_path=str(model_path),
+                           startdate=startdate, enddate=enddate)
+
+
+def test_month_dir_checked_once(tmp_path, monkeypatch):
+    month_dir = tmp_path / '202409'
+    month_dir.mkdir()
+    for hour in range(3):
+        (month_dir / f'nos.cbofs.fields.n00{hour}.20240901.t00z.nc').touch()
+
+    calls = []
+    real_scandir = os.scandir
+
+    def _counting_scandir(path):
+        calls.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(lof.os, 'scandir', _counting_scandir)
+    dir_list = lof.list_of_dir(_prop(tmp_path, '2024090100', '2024090523'),
+                               logging.getLogger(__name__))
+
+    assert dir_list == [month_dir.as_posix()]
+    assert calls == [month_dir.as_posix()]
+
+
+def test_dir_has_entries(tmp_path):
+    assert lof._dir_has_entries(str(tmp_path)) is False
+    (tmp_path / 'a.nc').touch()
+    assert lof._dir_has_entries(str(tmp_path)) is True
+    assert lof._dir_has_entries(str(tmp_path / 'a.nc')) is False
+    assert lof._dir_has_entries(str(tmp_path / 'missing')) is False
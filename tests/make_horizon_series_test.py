@@ -0,0 +1,131 @@
+"""Tests for cycle dispatch in ``make_horizon_series``.
+
+``make_horizon_series`` loads every forecast cycle with ``get_node_ofs``
+and collects the per-station series for one write per horizon CSV. With
+``parallel_forecast_cycles`` set, the cycles after the first run in a
+thread pool. These tests stub ``get_node_ofs`` and check that both paths
+collect the same series in cycle order, with one prop per worker. With
+``parallel_stations`` set, the horizon CSVs are written in a thread pool.
+
+Cycles work on ``_PropView`` overlays of the caller's prop instead of
+deep copies.
+"""
+
+import copy
+import logging
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from ofs_skill.model_processing import do_horizon_skill
+
+_FILENAMES = [
+    'cbofs.t00z.20260101.stations.forecast.nc',
+    'cbofs.t06z.20260101.stations.forecast.nc',
+    'cbofs.t06z.20260101.stations.nowcast.nc',
+    'cbofs.t12z.20260101.stations.forecast.nc',
+    'cbofs.t18z.20260101.stations.forecast.nc',
+    'cbofs.t00z.20260102.stations.forecast.nc',
+]
+
+
+@pytest.fixture
+def horizon_run(monkeypatch):
+    calls = []
+    written = {}
+    writers = {}
+
+    def _fake_get_node_ofs(prop, logger, horizon_frames=None):
+        calls.append((prop.forecast_hr, prop.start_date_full, prop,
+                      threading.current_thread().name))
+        for station in ('a', 'b'):
+            horizon_frames.setdefault(f'{station}.csv', []).append(
+                (f'{prop.start_date_full[:10]}-{prop.forecast_hr}', None))
+
+    def _fake_merge(filepath, frames, prop, logger):
+        written[filepath] = [datecycle for datecycle, _ in frames]
+        writers[filepath] = threading.current_thread().name
+        return SimpleNamespace(to_csv=lambda *args, **kwargs: None)
+
+    monkeypatch.setattr(do_horizon_skill, 'get_node_ofs', _fake_get_node_ofs)
+    monkeypatch.setattr(do_horizon_skill.do_horizon_skill_utils,
+                        'get_horizon_filenames',
+                        lambda *args: list(_FILENAMES))
+    monkeypatch.setattr(do_horizon_skill.do_horizon_skill_utils,
+                        'pandas_merge_cycles', _fake_merge)
+
+    def _run(parallel, parallel_stations=False):
+        monkeypatch.setattr(
+            do_horizon_skill, 'get_parallel_config',
+            lambda logger, config_file=None: {
+                'parallel_forecast_cycles': parallel,
+                'parallel_stations': parallel_stations})
+        calls.clear()
+        written.clear()
+        writers.clear()
+        prop = SimpleNamespace(ofs='cbofs',
+                               start_date_full='2026-01-02T00:00:00Z',
+                               end_date_full='2026-01-02T12:00:00Z')
+        do_horizon_skill.make_horizon_series(
+            prop, logging.getLogger('make_horizon_series_test'))
+        # The caller's prop is never written to.
+        assert vars(prop) == {'ofs': 'cbofs',
+                              'start_date_full': '2026-01-02T00:00:00Z',
+                              'end_date_full': '2026-01-02T12:00:00Z'}
+        return list(calls), dict(written), dict(writers)
+
+    return _run
+
+
+_EXPECTED = ['2026-01-01-00z', '2026-01-01-06z', '2026-01-01-12z',
+             '2026-01-01-18z', '2026-01-02-00z']
+
+
+def test_sequential_cycles_in_order(horizon_run):
+    calls, written, _ = horizon_run(parallel=False)
+    assert written == {'a.csv': _EXPECTED, 'b.csv': _EXPECTED}
+    assert len(calls) == 5
+    assert all(not name.startswith('ThreadPoolExecutor')
+               for *_, name in calls)
+
+
+def test_parallel_cycles_match_sequential(horizon_run):
+    calls, written, _ = horizon_run(parallel=True)
+    assert written == {'a.csv': _EXPECTED, 'b.csv': _EXPECTED}
+    # First cycle alone, the rest in workers with their own prop copies.
+    assert not calls[0][3].startswith('ThreadPoolExecutor')
+    workers = calls[1:]
+    assert all(name.startswith('ThreadPoolExecutor')
+               for *_, name in workers)
+    assert len({id(prop) for _, _, prop, _ in calls}) == len(calls)
+
+
+def test_parallel_station_writes(horizon_run):
+    _, written, writers = horizon_run(parallel=False, parallel_stations=True)
+    assert written == {'a.csv': _EXPECTED, 'b.csv': _EXPECTED}
+    assert all(name.startswith('ThreadPoolExecutor')
+               for name in writers.values())
+
+
+def test_prop_view_leaves_base_untouched():
+    base = SimpleNamespace(ofs='cbofs', forecast_hr='00z', var_list=['wl'])
+    view = do_horizon_skill._PropView(base)
+    view.forecast_hr = '06z'
+    view.model_source = 'roms'
+
+    assert (view.ofs, view.forecast_hr, view.model_source) == (
+        'cbofs', '06z', 'roms')
+    assert base.forecast_hr == '00z'
+    assert not hasattr(base, 'model_source')
+    # Nested objects are shared, not copied.
+    assert view.var_list is base.var_list
+    with pytest.raises(AttributeError):
+        view.missing
+
+
+def test_prop_view_copies():
+    view = do_horizon_skill._PropView(SimpleNamespace(ofs='cbofs'))
+    view.forecast_hr = '06z'
+    for clone in (copy.copy(view), copy.deepcopy(view)):
+        assert (clone.ofs, clone.forecast_hr) == ('cbofs', '06z')
@@ -0,0 +1,99 @@
+"""Tests for model ctl file parsing in ``get_node_ofs.py``.
+
+``ofs_ctlfile_extract`` reads the model ctl file once per variable and
+whichcast. The parse is memoized by path and modification time; these
+tests check it against the original column-by-column parse and that a
+rewritten file is read again.
+"""
+
+import importlib
+import logging
+import os
+from types import SimpleNamespace
+
+import numpy as np
+
+# The package re-exports the get_node_ofs function under the module name.
+get_node_ofs = importlib.import_module(
+    'ofs_skill.model_processing.get_node_ofs')
+
+_CTL = (
+    '   120     3   38.98  -76.48  8575512  0.0\n'
+    '     7     0   39.27  -76.58  8574680  -0.125\n'
+    ' 45010    19   38.03  -76.34  cb0102  1.5\n'
+)
+
+
+def _legacy(path):
+    with open(path, encoding='utf-8') as file:
+        lines = file.read().split('\n')
+    lines = [list(filter(None, i.split(' '))) for i in lines]
+    nodes = [int(i) for i in np.array(lines[:-1])[:, 0]]
+    depths = [int(i) for i in np.array(lines[:-1])[:, 1]]
+    shifts = [float(i) for i in np.array(lines[:-1])[:, -1]]
+    ids = [str(i) for i in np.array(lines[:-1])[:, -2]]
+    return lines, nodes, depths, shifts, ids
+
+
+def _prop(tmp_path):
+    return SimpleNamespace(ofsfiletype='stations', ofs='cbofs', ctl_flag=1,
+                           control_files_path=str(tmp_path))
+
+
+def test_matches_legacy_parse(tmp_path):
+    path = tmp_path / 'cbofs_wl_model_station.ctl'
+    path.write_text(_CTL)
+
+    result = get_node_ofs.ofs_ctlfile_extract(
+        _prop(tmp_path), 'wl', None, logging.getLogger('ofs_ctlfile_test'))
+
+    assert result == _legacy(path)
+    assert all(type(node) is int for node in result[1])
+    assert all(type(shift) is float for shift in result[3])
+
+
+def test_parse_reused_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / 'cbofs_wl_model_station.ctl'
+    path.write_text(_CTL)
+    reads = []
+
+    def _open(path, *args, **kwargs):
+        reads.append(path)
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(get_node_ofs, 'open', _open, raising=False)
+    prop = _prop(tmp_path)
+    logger = logging.getLogger('ofs_ctlfile_test')
+
+    first = get_node_ofs.ofs_ctlfile_extract(prop, 'wl', None, logger)
+    first[1].append(-1)
+    second = get_node_ofs.ofs_ctlfile_extract(prop, 'wl', None, logger)
+    assert len(reads) == 1
+    assert second == _legacy(path)
+
+    path.write_text(_CTL.splitlines(keepends=True)[0])
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    third = get_node_ofs.ofs_ctlfile_extract(prop, 'wl', None, logger)
+    assert len(reads) == 2
+    assert third[1] == [120]
+
+
+def test_blank_file_returns_none(tmp_path):
+    (tmp_path / 'cbofs_wl_model_station.ctl').write_text('')
+    assert get_node_ofs.ofs_ctlfile_extract(
+        _prop(tmp_path), 'wl', None,
+        logging.getLogger('ofs_ctlfile_test')) is None
+
+
+def test_tabs_and_trailing_whitespace(tmp_path):
+    plain = tmp_path / 'plain.ctl'
+    plain.write_text(_CTL)
+    path = tmp_path / 'cbofs_wl_model_station.ctl'
+    path.write_text(_CTL.replace('  38.98', '\t38.98').replace(
+        '0.0\n', '0.0 \t\n'))
+
+    result = get_node_ofs.ofs_ctlfile_extract(
+        _prop(tmp_path), 'wl', None, logging.getLogger('ofs_ctlfile_test'))
+
+    assert result == _legacy(plain)
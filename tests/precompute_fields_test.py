@@ -0,0 +1,164 @@
+"""Tests for the fields-file batch extraction in ``get_node_ofs.py``.
+
+``_precompute_fields_data`` reads every station's time series from a
+fields file with one vectorized selection per variable, using the
+layouts in ``_FIELDS_LAYOUTS``. These tests check its columns against
+direct per-station indexing for each model's fields layout, and that
+the single-station fallback in ``format_*`` matches the batch.
+"""
+
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ofs_skill.model_processing.get_node_ofs import (
+    _extract_points,
+    _precompute_fields_data,
+    format_currents,
+    format_temp_salt,
+    roms_nodes,
+)
+
+_N_TIME, _N_LAYER, _N_NODE = 30, 4, 12
+_NODES = [3, 0, 11, 7, 7]
+_DEPTHS = [1, 0, 3, 2, 0]
+
+
+def _logger():
+    return logging.getLogger('precompute_fields_test')
+
+
+def _times():
+    return np.datetime64('2026-02-16') + np.arange(_N_TIME) * np.timedelta64(
+        1, 'h')
+
+
+def _ctlfile():
+    ids = [f's{i}' for i in range(len(_NODES))]
+    return ([], list(_NODES), list(_DEPTHS), [0.0] * len(_NODES), ids)
+
+
+def _random(rng, *shape):
+    return rng.standard_normal(shape)
+
+
+def _dataset(layout, chunked):
+    rng = np.random.default_rng(0)
+    t = ('time', _N_TIME)
+    if layout == 'roms':
+        dims3 = ('ocean_time', 's_rho', 'eta_rho', 'xi_rho')
+        shape3 = (_N_TIME, _N_LAYER, 3, 4)
+        ds = xr.Dataset(
+            {name: (dims3, _random(rng, *shape3))
+             for name in ('temp', 'salt', 'u_east', 'v_north')},
+            coords={'ocean_time': _times()})
+        ds['zeta'] = (dims3[:1] + dims3[2:], _random(rng, _N_TIME, 3, 4))
+        ds['lon_rho'] = (('eta_rho', 'xi_rho'), _random(rng, 3, 4))
+    else:
+        if layout == 'stofs':
+            dims3 = (t[0], 'node', 'nSCHISM_vgrid_layers')
+            shape3 = (_N_TIME, _N_NODE, _N_LAYER)
+            names = ('temperature', 'salinity', 'horizontalVelX',
+                     'horizontalVelY')
+            zeta = 'elevation'
+        else:
+            dims3 = (t[0], 'siglay', 'node')
+            shape3 = (_N_TIME, _N_LAYER, _N_NODE)
+            names = ('temp', 'salinity', 'u', 'v')
+            zeta = 'zeta'
+        ds = xr.Dataset({name: (dims3, _random(rng, *shape3))
+                         for name in names}, coords={'time': _times()})
+        ds[zeta] = ((t[0], 'node'), _random(rng, _N_TIME, _N_NODE))
+    if chunked:
+        ds = ds.chunk({ds['zeta' if 'zeta' in ds else 'elevation'].dims[0]: 7})
+    return ds
+
+
+def _prop(layout):
+    source, ofs = {'fvcom': ('fvcom', 'ngofs2'), 'roms': ('roms', 'cbofs'),
+                   'stofs': ('schism', 'stofs_3d_atl'),
+                   'secofs': ('schism', 'secofs')}[layout]
+    return SimpleNamespace(model_source=source, ofs=ofs,
+                           ofsfiletype='fields', whichcast='nowcast')
+
+
+def _per_station(layout, ds, name, node, depth):
+    """Index one station the way format_* reads fields files."""
+    if layout == 'roms':
+        i_index, j_index = roms_nodes(ds, node)
+        if ds[name].ndim == 3:
+            return ds[name][:, i_index, j_index].values
+        return ds[name][:, depth, i_index, j_index].values
+    if ds[name].ndim == 2:
+        return ds[name][:, node].values
+    if layout == 'stofs':
+        return ds[name][:, node, depth].values
+    return ds[name][:, depth, node].values
+
+
+_VARS = {
+    'fvcom': {'temp': 'temp', 'salinity': 'salinity', 'zeta': 'zeta'},
+    'roms': {'temp': 'temp', 'salinity': 'salt', 'zeta': 'zeta'},
+    'stofs': {'temp': 'temperature', 'salinity': 'salinity',
+              'zeta': 'elevation'},
+    'secofs': {'temp': 'temp', 'salinity': 'salinity', 'zeta': 'zeta'},
+}
+_CURRENTS = {'fvcom': ('u', 'v'), 'roms': ('u_east', 'v_north'),
+             'stofs': ('horizontalVelX', 'horizontalVelY'),
+             'secofs': ('u', 'v')}
+
+
+@pytest.mark.parametrize('chunked', [False, True])
+@pytest.mark.parametrize('layout', ['fvcom', 'roms', 'stofs', 'secofs'])
+@pytest.mark.parametrize('model_var', ['temp', 'salinity', 'zeta',
+                                       'currents'])
+def test_matches_per_station_reads(layout, model_var, chunked):
+    ds = _dataset(layout, chunked)
+    result = _precompute_fields_data(
+        _prop(layout), ds, _ctlfile(), model_var, _logger())
+
+    np.testing.assert_array_equal(result['model_time'], _times())
+    if model_var == 'currents':
+        pairs = zip(('u_data', 'v_data'), _CURRENTS[layout])
+    else:
+        pairs = [('scalar_data', _VARS[layout][model_var])]
+    for key, name in pairs:
+        assert result[key].shape == (_N_TIME, len(_NODES))
+        for i, (node, depth) in enumerate(zip(_NODES, _DEPTHS)):
+            np.testing.assert_array_equal(
+                result[key][:, i],
+                _per_station(layout, ds, name, node, depth))
+
+
+def test_schism_without_fields_layout_raises():
+    prop = SimpleNamespace(model_source='schism', ofs='creofs',
+                           ofsfiletype='fields')
+    with pytest.raises(ValueError):
+        _precompute_fields_data(prop, _dataset('secofs', False), _ctlfile(),
+                                'temp', _logger())
+
+
+def test_extract_points_checks_index_count():
+    with pytest.raises(ValueError):
+        _extract_points(_dataset('fvcom', False), 'temp', [np.array(_NODES)])
+
+
+@pytest.mark.parametrize('layout', ['fvcom', 'roms', 'stofs', 'secofs'])
+def test_single_station_fallback_matches_batch(layout):
+    """Without a precomputed batch, format_* read the one station."""
+    ds = _dataset(layout, False)
+    prop = _prop(layout)
+    prop.start_date_full = '2026-02-16T00:00:00Z'
+    prop.end_date_full = '2026-02-16T12:00:00Z'
+    ctl = _ctlfile()
+    batch = _precompute_fields_data(prop, ds, ctl, 'temp', _logger())
+    currents = _precompute_fields_data(prop, ds, ctl, 'currents', _logger())
+
+    for i in range(len(_NODES)):
+        assert (format_temp_salt(prop, ds, ctl, 'temp', i)
+                == format_temp_salt(prop, ds, ctl, 'temp', i, batch))
+        assert (format_currents(prop, ds, ctl, i)
+                == format_currents(prop, ds, ctl, i, currents))
@@ -0,0 +1,123 @@
+"""Regression tests for ``remove_extra_stations`` in ``intake_scisa.py``.
+
+When station files in one run carry different station counts, each file
+is trimmed to the reference station set and the trimmed files are
+combined along time. The combine used to be chained pairwise (quadratic
+in the file count); it is now a single ``xr.combine_nested`` call. These
+tests build tiny on-disk station files and check the combined result,
+including the per-timestep ``filename`` coord that ``get_node_ofs``
+writes to the filename key CSV.
+"""
+
+import logging
+import threading
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from ofs_skill.model_processing import intake_scisa
+from ofs_skill.model_processing.intake_scisa import remove_extra_stations
+
+# (station count, file tag) for each hourly file, in time order.
+_FILES = [(3, 'a'), (4, 'b'), (3, 'c')]
+
+
+def _logger():
+    return logging.getLogger('remove_extra_stations_test')
+
+
+@pytest.fixture
+def station_files(tmp_path):
+    """Write three 2-step station files; the middle one has an extra station."""
+    paths = []
+    for k, (n_station, tag) in enumerate(_FILES):
+        times = (np.datetime64('2026-01-01T00')
+                 + np.arange(2 * k, 2 * k + 2) * np.timedelta64(1, 'h'))
+        ds = xr.Dataset(
+            data_vars={
+                'zeta': (('time', 'station'),
+                         np.full((2, n_station), float(k))),
+            },
+            coords={
+                'time': times,
+                'lat': (('station',), np.arange(n_station, dtype=float)),
+            },
+        )
+        path = tmp_path / f'station_{tag}.nc'
+        ds.to_netcdf(path, engine='h5netcdf')
+        paths.append(str(path))
+    return paths
+
+
+def _run(paths):
+    return remove_extra_stations('h5netcdf', paths, 0, [], 'time', _logger())
+
+
+def test_extra_station_trimmed_and_times_in_file_order(station_files):
+    ds = _run(station_files)
+    assert ds.sizes == {'time': 6, 'station': 3}
+    assert np.all(np.diff(ds['time'].values) > np.timedelta64(0))
+    np.testing.assert_array_equal(
+        ds['zeta'].values[:, 0], [0.0, 0.0, 1.0, 1.0, 2.0, 2.0])
+
+
+def test_filename_coord_varies_along_time(station_files):
+    """The scalar per-file filename coord must become a per-time coord."""
+    ds = _run(station_files)
+    assert ds['filename'].dims == ('time',)
+    assert list(ds['filename'].values) == [
+        'station_a.nc', 'station_a.nc',
+        'station_b.nc', 'station_b.nc',
+        'station_c.nc', 'station_c.nc',
+    ]
+
+
+def test_trimmed_files_combined_in_single_call(station_files, monkeypatch):
+    calls = []
+    real_combine = xr.combine_nested
+
+    def _counting_combine(datasets, *args, **kwargs):
+        calls.append(len(datasets))
+        return real_combine(datasets, *args, **kwargs)
+
+    monkeypatch.setattr(intake_scisa.xr, 'combine_nested', _counting_combine)
+    _run(station_files)
+    assert calls == [len(station_files)]
+
+
+def test_load_coords_reads_coords_into_memory(station_files):
+    with xr.open_dataset(station_files[1], engine='h5netcdf',
+                         chunks={}) as ds:
+        assert not ds['lat'].variable._in_memory
+        out = intake_scisa._load_coords(ds)
+        assert out is ds
+        assert ds['lat'].variable._in_memory
+        # Data variables stay lazy.
+        assert not ds['zeta'].variable._in_memory
+
+
+def test_files_trimmed_in_thread_pool(station_files, monkeypatch):
+    seen = []
+    real_load = intake_scisa._load_coords
+
+    def _recording_load(ds):
+        seen.append(threading.current_thread().name)
+        return real_load(ds)
+
+    monkeypatch.setattr(intake_scisa, '_load_coords', _recording_load)
+    _run(station_files)
+    assert len(seen) == len(station_files)
+    assert all(name.startswith('ThreadPoolExecutor') for name in seen)
+
+
+def test_trim_failure_in_worker_reaches_caller(station_files, monkeypatch):
+    """SystemExit raised inside a worker must surface through executor.map."""
+
+    def _fail_trim(ds):
+        raise SystemExit(-1)
+
+    monkeypatch.setattr(intake_scisa, '_load_coords', _fail_trim)
+    with pytest.raises(SystemExit) as exc_info:
+        _run(station_files)
+    assert exc_info.value.code == -1
@@ -0,0 +1,118 @@
+"""Regression tests for the vdatum node search in ``get_datum_offset.py``.
+
+The FVCOM stations branch of ``get_datum_offset`` used to run a full
+``np.linalg.norm`` over every vdatum node for every station. It now queries
+a KD-tree that ``_VdatumGrid`` builds once per loaded vdatum file. These
+tests check that:
+- The tree picks the same node as the old brute-force ``np.argmin``,
+  including the lowest-index tie-break on duplicated rounded coordinates.
+- The tree is built once per grid, and the local fallback grid is cached.
+"""
+
+import importlib
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import xarray as xr
+
+# The package __init__ re-exports the get_datum_offset *function* under the
+# module's name, so fetch the module itself.
+gdo = importlib.import_module('ofs_skill.model_processing.get_datum_offset')
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    gdo._load_vdatum_from_s3.cache_clear()
+    gdo._load_vdatum_local.cache_clear()
+    yield
+    gdo._load_vdatum_from_s3.cache_clear()
+    gdo._load_vdatum_local.cache_clear()
+
+
+def _vdatums(n_node=500, seed=0):
+    rng = np.random.default_rng(seed)
+    return xr.Dataset(
+        data_vars={
+            'longitude': (('node',), rng.uniform(-77.0, -75.0, n_node)),
+            'latitude': (('node',), rng.uniform(37.0, 39.0, n_node)),
+        },
+    )
+
+
+def _brute_force(vdatums, lon, lat):
+    vlonlat = np.around(np.array([vdatums['longitude'],
+                                  vdatums['latitude']]), 3)
+    target = np.around(np.array([[lon], [lat]]), 3)
+    return int(np.argmin(np.linalg.norm(vlonlat - target, axis=0)))
+
+
+def test_matches_brute_force_search():
+    vdatums = _vdatums()
+    grid = gdo._VdatumGrid(vdatums)
+    rng = np.random.default_rng(1)
+    for lon, lat in zip(rng.uniform(-77.0, -75.0, 25),
+                        rng.uniform(37.0, 39.0, 25)):
+        assert grid.nearest_node(lon, lat) == _brute_force(vdatums, lon, lat)
+
+
+def test_ties_on_rounded_coords_pick_lowest_index():
+    """Nodes that round to the same point must resolve like np.argmin."""
+    rng = np.random.default_rng(3)
+    base_lon = np.round(rng.uniform(-76.0, -75.9, 40), 3)
+    base_lat = np.round(rng.uniform(37.0, 37.1, 40), 3)
+    # Each base point appears 4 times, shuffled, with sub-rounding jitter,
+    # so every node shares its rounded coordinates with 3 others.
+    order = rng.permutation(160)
+    lon = np.tile(base_lon, 4)[order] + rng.uniform(-4e-4, 4e-4, 160)
+    lat = np.tile(base_lat, 4)[order] + rng.uniform(-4e-4, 4e-4, 160)
+    vdatums = xr.Dataset(data_vars={'longitude': (('node',), lon),
+                                    'latitude': (('node',), lat)})
+    grid = gdo._VdatumGrid(vdatums)
+
+    # Targets on the grid points, between them, and equidistant from
+    # distinct rounded points.
+    targets = [(lo, la) for lo, la in zip(base_lon, base_lat)]
+    targets += [(-75.95, 37.05), (-76.0, 37.0), (-75.9, 37.1)]
+    targets += [((base_lon[0] + base_lon[1]) / 2,
+                 (base_lat[0] + base_lat[1]) / 2)]
+    for t_lon, t_lat in targets:
+        assert grid.nearest_node(t_lon, t_lat) == \
+            _brute_force(vdatums, t_lon, t_lat)
+
+
+def test_accepts_arrays():
+    vdatums = _vdatums()
+    lons = np.array([-76.5, -75.2, -76.9])
+    lats = np.array([37.1, 38.8, 38.0])
+    idx = gdo._VdatumGrid(vdatums).nearest_node(lons, lats)
+    assert idx.shape == (3,)
+    for k in range(3):
+        assert idx[k] == _brute_force(vdatums, lons[k], lats[k])
+
+
+def test_tree_built_once_per_grid():
+    grid = gdo._VdatumGrid(_vdatums())
+    grid.nearest_node(-76.0, 38.0)
+    tree = grid.tree
+    grid.nearest_node(-75.5, 37.5)
+    assert grid.tree is tree
+
+
+def test_local_fallback_grid_is_cached(tmp_path, monkeypatch):
+    path = tmp_path / 'local_vdatums.nc'
+    _vdatums(n_node=20).to_netcdf(path, engine='h5netcdf')
+    conf = tmp_path / 'ofs_dps.custom.conf'
+    conf.write_text(f'[directories]\nlocal_vdatum = {path}\n')
+    prop = SimpleNamespace(ofs='cbofs', config_file=str(conf))
+
+    def _missing(ofs):
+        raise FileNotFoundError(ofs)
+
+    monkeypatch.setattr(gdo, '_load_vdatum_from_s3', _missing)
+    log = logging.getLogger('vdatum_nearest_node_test')
+    first = gdo._read_vdatum_grid(prop, log)
+    second = gdo._read_vdatum_grid(prop, log)
+    assert first is second
+    assert gdo._load_vdatum_local.cache_info().misses == 1
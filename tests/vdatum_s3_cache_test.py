@@ -0,0 +1,112 @@
+"""Regression tests for the S3 vdatum cache in ``get_datum_offset.py``.
+
+``get_datum_offset`` runs once per water level station, and each call used
+to re-open the same vdatum object from S3. ``_load_vdatum_from_s3`` now
+caches the loaded dataset. These tests mock ``s3fs.S3FileSystem`` to check
+that:
+- A second read for the same OFS does not go back to S3.
+- A ``FileNotFoundError`` is not cached, so the local fallback still runs.
+- Callers get copies, so changes to one do not leak into later calls.
+"""
+
+import importlib
+import logging
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import xarray as xr
+
+# The package __init__ re-exports the get_datum_offset *function* under the
+# module's name, so fetch the module itself.
+gdo = importlib.import_module('ofs_skill.model_processing.get_datum_offset')
+
+
+def _logger():
+    return logging.getLogger('vdatum_s3_cache_test')
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    gdo._load_vdatum_from_s3.cache_clear()
+    gdo._load_vdatum_local.cache_clear()
+    yield
+    gdo._load_vdatum_from_s3.cache_clear()
+    gdo._load_vdatum_local.cache_clear()
+
+
+@pytest.fixture
+def vdatum_file(tmp_path):
+    path = tmp_path / 'fake_vdatums.nc'
+    xr.Dataset(
+        data_vars={
+            'navd88tomsl': (('node',), np.linspace(0.1, 0.5, 5)),
+            'longitude': (('node',), np.linspace(-76.0, -75.0, 5)),
+            'latitude': (('node',), np.linspace(37.0, 38.0, 5)),
+        },
+    ).to_netcdf(path, engine='h5netcdf')
+    return path
+
+
+class _FakeS3FileSystem:
+    """Stands in for s3fs.S3FileSystem; serves one local file or raises."""
+
+    opened = []
+    local_path = None
+
+    def __init__(self, anon=False):
+        self.anon = anon
+
+    def open(self, url, mode='rb'):
+        _FakeS3FileSystem.opened.append(url)
+        if _FakeS3FileSystem.local_path is None:
+            raise FileNotFoundError(url)
+        return open(_FakeS3FileSystem.local_path, mode)
+
+
+@pytest.fixture
+def fake_s3(monkeypatch):
+    _FakeS3FileSystem.opened = []
+    _FakeS3FileSystem.local_path = None
+    monkeypatch.setattr(gdo.s3fs, 'S3FileSystem', _FakeS3FileSystem)
+    return _FakeS3FileSystem
+
+
+def test_second_read_skips_s3(fake_s3, vdatum_file):
+    fake_s3.local_path = vdatum_file
+    prop = SimpleNamespace(ofs='cbofs')
+
+    first = gdo.read_vdatum_from_bucket(prop, _logger())
+    second = gdo.read_vdatum_from_bucket(prop, _logger())
+
+    assert len(fake_s3.opened) == 1
+    assert fake_s3.opened[0].endswith('OFS_Grid_Datum/cbofs_vdatums.nc')
+    np.testing.assert_allclose(first['navd88tomsl'].values,
+                               second['navd88tomsl'].values)
+
+
+def test_callers_get_independent_copies(fake_s3, vdatum_file):
+    fake_s3.local_path = vdatum_file
+    prop = SimpleNamespace(ofs='cbofs')
+
+    first = gdo.read_vdatum_from_bucket(prop, _logger())
+    first['extra'] = first['navd88tomsl'] * 2
+    first.attrs['touched'] = True
+
+    second = gdo.read_vdatum_from_bucket(prop, _logger())
+    assert 'extra' not in second
+    assert 'touched' not in second.attrs
+
+
+def test_missing_s3_file_not_cached_and_local_fallback_runs(
+        fake_s3, vdatum_file, tmp_path):
+    conf = tmp_path / 'ofs_dps.custom.conf'
+    conf.write_text(f'[directories]\nlocal_vdatum = {vdatum_file}\n')
+    prop = SimpleNamespace(ofs='cbofs', config_file=str(conf))
+
+    for _ in range(2):
+        result = gdo.read_vdatum_from_bucket(prop, _logger())
+        assert 'navd88tomsl' in result.data_vars
+
+    # Both calls went back to S3: the failure was not cached.
+    assert len(fake_s3.opened) == 2